@@ -0,0 +1,192 @@
+"""
+Aggregate Cube (English)
+Precomputed salary aggregates over the dashboard filter dimensions
+(experience_years, seniority_level_ic, work_mode, gender). Every observed combination of
+filter levels is a cell holding count, sum and sum of squares of salary_numeric plus a
+value-count histogram of salary on a fixed grid (a mergeable quantile sketch: merging is
+addition). The same aggregates are kept per cell for every indicator flag (technologies,
+roles, company locations). All of them are additive, so any filter selection is answered
+by summing the selected cells; query cost depends on the number of cells, not on the
+number of respondents.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from data_store import decode_one_hot
+from stat_kernels import moment_stats
+from streaming_stats import weighted_quantile
+from vocabulary import flag_columns
+
+# Filter dimensions; work_mode is a categorical code column (a one-hot block in legacy files)
+DIMENSIONS = ('experience_years', 'seniority_level_ic', 'work_mode', 'gender')
+# Indicator blocks aggregated per cell
+FLAG_PREFIXES = ('company_location_', 'role_', 'programming_', 'frontend_', 'tools_')
+# Above this many distinct salaries the histogram grid is reduced to quantile points
+MAX_GRID_SIZE = 512
+STAT_COLUMNS = ['count', 'mean', 'std', 'median']
+
+
+def dimension_values(df: pd.DataFrame, dim: str) -> pd.Series:
+    """
+    Level of a filter dimension per row. Ordinal columns are used as-is; a categorical
+    code column (e.g. work_mode) gives the survey label, and in legacy files without it
+    the one-hot block (work_mode_*) gives the suffix of the set column. None if unset.
+    """
+    if dim in df.columns and not isinstance(df[dim].dtype, pd.CategoricalDtype):
+        return df[dim]
+    try:
+        values = df[dim] if dim in df.columns else decode_one_hot(df, f'{dim}_')
+    except KeyError:
+        raise KeyError(f"No column or one-hot block for dimension '{dim}'") from None
+    return values.astype(object).where(values.notna(), None)
+
+
+def salary_grid(salary, max_size=MAX_GRID_SIZE):
+    """
+    Histogram grid: the distinct salaries when there are at most max_size of them
+    (quantiles are then exact), otherwise max_size quantile points.
+    """
+    grid = np.sort(pd.unique(salary))
+    if len(grid) > max_size:
+        grid = np.unique(np.quantile(salary, np.linspace(0, 1, max_size)))
+    return grid
+
+
+def _grid_index(grid, values):
+    """Index of the nearest grid point for every value."""
+    upper = np.clip(np.searchsorted(grid, values), 0, len(grid) - 1)
+    lower = np.clip(upper - 1, 0, None)
+    return np.where(values - grid[lower] < grid[upper] - values, lower, upper)
+
+
+def _stats_frame(moments, histogram, grid, index):
+    """count/mean/std/median frame from (k, 3) moments and (k, grid) histograms."""
+    count = moments[:, 0]
+    mean, var = moment_stats(count, moments[:, 1], moments[:, 2])
+    median = [weighted_quantile(grid, h, 0.5) if n > 0 else np.nan for n, h in zip(count, histogram)]
+    return pd.DataFrame({'count': count, 'mean': mean, 'std': np.sqrt(var), 'median': median},
+                        index=index, columns=STAT_COLUMNS)
+
+
+class AggregateCube:
+    """
+    Salary aggregates per cell of the filter dimensions, overall and per indicator flag.
+    Build once with `from_frame`; queries take a filter dict {dimension: selected levels}
+    where a missing or empty selection leaves the dimension unfiltered. Rows without a
+    salary contribute nothing to the aggregates.
+    """
+
+    def __init__(self, dimensions, levels, cells, flags, grid,
+                 moments, histogram, flag_moments, flag_histogram):
+        self.dimensions = tuple(dimensions)
+        self.levels = levels                  # dimension -> sorted level labels
+        self.cells = cells                    # (cells, dimensions) level codes, -1 = missing
+        self.flags = list(flags)
+        self.grid = grid
+        self.moments = moments                # (cells, 3): count, sum, sum of squares
+        self.histogram = histogram            # (cells, grid)
+        self.flag_moments = flag_moments      # (cells, flags, 3)
+        self.flag_histogram = flag_histogram  # (cells, grid, flags)
+
+    @classmethod
+    def from_frame(cls, df, dimensions=DIMENSIONS, flag_prefixes=FLAG_PREFIXES):
+        """
+        Build the cube in one pass: sparse row -> cell indicators weighted by 1, s and
+        s^2 give the cell moments as column sums and the flag moments as C.T @ F;
+        histograms use a row -> (cell, grid point) indicator the same way.
+        """
+        levels, codes = {}, []
+        for dim in dimensions:
+            dim_codes, uniques = pd.factorize(dimension_values(df, dim), sort=True)
+            levels[dim] = np.asarray(uniques)
+            codes.append(dim_codes)
+        # One integer key per level combination (codes shifted so missing = 0)
+        shape = [len(levels[dim]) + 1 for dim in dimensions]
+        keys = np.ravel_multi_index([c + 1 for c in codes], shape)
+        row_cells, cell_keys = pd.factorize(keys, sort=True)
+        cells = np.column_stack(np.unravel_index(cell_keys, shape)) - 1
+
+        n, n_cells = len(df), len(cells)
+        salary = df['salary_numeric'].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(salary)
+        s = np.where(valid, salary, 0.0)
+        rows = np.arange(n)
+        powers = np.column_stack([valid, s, s ** 2]).astype(np.float64)
+        # Row -> cell indicators weighted by 1, s and s^2
+        C = [sparse.csr_matrix((powers[:, k], (rows, row_cells)), shape=(n, n_cells)) for k in range(3)]
+        moments = np.column_stack([np.asarray(Ck.sum(axis=0)).reshape(-1) for Ck in C])
+
+        flags = flag_columns(df.columns, tuple(flag_prefixes))
+        F = df[flags].fillna(0).to_numpy(dtype=np.float64)
+        flag_moments = np.stack([np.asarray(Ck.T @ F) for Ck in C], axis=-1)
+
+        grid = salary_grid(salary[valid])
+        n_grid = len(grid)
+        K = sparse.csr_matrix((valid.astype(np.float64), (rows, row_cells * n_grid + _grid_index(grid, s))),
+                              shape=(n, n_cells * n_grid))
+        histogram = np.asarray(K.sum(axis=0)).reshape(n_cells, n_grid)
+        flag_histogram = np.asarray(K.T @ F).reshape(n_cells, n_grid, len(flags)).astype(np.int32)
+        return cls(dimensions, levels, cells, flags, grid,
+                   moments, histogram, flag_moments, flag_histogram)
+
+    def cell_mask(self, filters=None):
+        """Boolean mask of the cells matching the filters; missing levels never match a filter."""
+        mask = np.ones(len(self.cells), dtype=bool)
+        for dim, selected in (filters or {}).items():
+            if selected is None or len(selected) == 0:
+                continue
+            codes = np.flatnonzero(np.isin(self.levels[dim], list(selected)))
+            mask &= np.isin(self.cells[:, self.dimensions.index(dim)], codes)
+        return mask
+
+    def summary(self, filters=None) -> pd.Series:
+        """count, mean, std and median of salary over the selection."""
+        mask = self.cell_mask(filters)
+        moments = self.moments[mask].sum(axis=0, keepdims=True)
+        histogram = self.histogram[mask].sum(axis=0, keepdims=True)
+        return _stats_frame(moments, histogram, self.grid, [0]).iloc[0]
+
+    def quantile(self, q, filters=None):
+        """q-th salary quantile over the selection (exact when the grid holds every distinct salary)."""
+        histogram = self.histogram[self.cell_mask(filters)].sum(axis=0)
+        return weighted_quantile(self.grid, histogram, q) if histogram.sum() > 0 else np.nan
+
+    def _by_level(self, dim, mask, values):
+        """Sum per-cell values (cells, ...) into (levels, ...) of dim; missing levels are dropped."""
+        codes = self.cells[mask, self.dimensions.index(dim)]
+        out = np.zeros((len(self.levels[dim]),) + values.shape[1:])
+        keep = codes >= 0
+        np.add.at(out, codes[keep], values[mask][keep])
+        return out
+
+    def by_dimension(self, dim, filters=None) -> pd.DataFrame:
+        """Salary stats per level of dim over the selection; only levels with respondents."""
+        mask = self.cell_mask(filters)
+        table = _stats_frame(self._by_level(dim, mask, self.moments),
+                             self._by_level(dim, mask, self.histogram), self.grid, self.levels[dim])
+        return table[table['count'] > 0]
+
+    def flag_moment_sums(self, filters=None):
+        """Moments of every flag's users (flags x 3) and of the whole selection (3,)."""
+        mask = self.cell_mask(filters)
+        return self.flag_moments[mask].sum(axis=0), self.moments[mask].sum(axis=0)
+
+    def flag_stats(self, filters=None):
+        """
+        Salary stats of flag users and of everyone else in the selection, as two frames
+        indexed by flag (NaN flags count as not set).
+        """
+        mask = self.cell_mask(filters)
+        moments, total_moments = self.flag_moment_sums(filters)
+        total_histogram = self.histogram[mask].sum(axis=0)
+        histogram = self.flag_histogram[mask].sum(axis=0).T
+        users = _stats_frame(moments, histogram, self.grid, self.flags)
+        others = _stats_frame(total_moments - moments, total_histogram - histogram, self.grid, self.flags)
+        return users, others
+
+    def flag_counts_by(self, dim, filters=None) -> pd.DataFrame:
+        """Number of flag users per level of dim over the selection (flags x levels)."""
+        counts = self._by_level(dim, self.cell_mask(filters), self.flag_moments[..., 0])
+        return pd.DataFrame(counts.T, index=self.flags, columns=self.levels[dim])
@@ -0,0 +1,34 @@
+"""
+Atomik dosya yazımı.
+Çıktı önce hedefin yanındaki geçici bir dosyaya yazılır, sonra os.replace ile hedefin
+yerine geçer; okuyucular hiçbir zaman yarım yazılmış dosya görmez. Geçici dosya normal
+open() ile oluşturulduğundan umask'a göre varsayılan izinleri alır (mkstemp'in 0600'ü
+yerine); süreç genelindeki umask okunmaz ve değiştirilmez.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+
+
+def temp_path(path):
+    """path'in yanında bu süreç ve iş parçacığına özgü geçici dosya adı."""
+    return f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+
+@contextmanager
+def atomic_path(path):
+    """
+    Geçici dosya yolunu ver; blok hatasız biterse dosya path'in yerine geçer,
+    hata olursa geçici dosya silinir.
+    """
+    tmp_path = temp_path(path)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
@@ -0,0 +1,82 @@
+"""
+Çoklu seçim normalizasyonu ve multi-hot kodlama için kıyaslama (benchmark).
+2025 anketindeki çoklu seçim hücrelerinden yeniden örneklenerek sentetik bir anket
+üretilir; satır bazlı eski yöntem (her hücre için token döngüsü + MultiLabelBinarizer)
+ile token'ları bir kez patlatıp yalnızca farklı token'ları normalize eden yöntem
+(`encode_multi_label`) karşılaştırılır ve çıktıların aynı olduğu doğrulanır.
+
+Kullanım: python src/benchmark_preprocessing.py --rows 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import MultiLabelBinarizer
+
+from data_preprocessing_final import (COLUMN_MAPPING, MULTI_LABEL_COLUMNS, RAW_DATA_PATH,
+                                      _normalize_multi_label_token, encode_multi_label)
+
+
+def legacy_encode_multi_label(values):
+    """
+    Önceki yöntem: her satırın her token'ı ayrı ayrı normalize edilir, ardından
+    MultiLabelBinarizer uygulanır.
+    """
+    def _normalize_list(tokens):
+        normalized = set()
+        for v in tokens:
+            norm = _normalize_multi_label_token(v)
+            if norm:
+                normalized.add(norm)
+        return sorted(normalized)
+
+    lists = values.fillna('Hiçbiri').astype(str).str.split(',').apply(_normalize_list)
+    mlb = MultiLabelBinarizer()
+    encoded = mlb.fit_transform(lists)
+    return encoded, {label: i for i, label in enumerate(mlb.classes_)}
+
+
+def synthetic_survey(n_rows, seed=42):
+    """
+    Ham anketin çoklu seçim sütunlarından satır yeniden örneklemesiyle sentetik veri üret.
+    """
+    raw = pd.read_csv(RAW_DATA_PATH).rename(columns=COLUMN_MAPPING)
+    columns = [c for c in MULTI_LABEL_COLUMNS if c in raw.columns]
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, len(raw), size=n_rows)
+    return raw[columns].iloc[rows].reset_index(drop=True)
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(n_rows=1_000_000):
+    print(f"Sentetik anket üretiliyor ({n_rows:,} satır)...")
+    survey = synthetic_survey(n_rows)
+
+    total_legacy = total_vectorized = 0.0
+    for col in survey.columns:
+        n_tokens = survey[col].fillna('Hiçbiri').astype(str).str.count(',').sum() + len(survey)
+        (legacy, legacy_index), t_legacy = _timed(legacy_encode_multi_label, survey[col])
+        (vectorized, vectorized_index), t_vectorized = _timed(encode_multi_label, survey[col])
+        assert legacy_index == vectorized_index, f"{col}: etiketler farklı"
+        assert np.array_equal(legacy, vectorized), f"{col}: kodlama farklı"
+        total_legacy += t_legacy
+        total_vectorized += t_vectorized
+        print(f"   {col}: {n_tokens:,} token, {len(vectorized_index)} etiket | "
+              f"eski: {t_legacy:.2f} sn, yeni: {t_vectorized:.2f} sn, hızlanma: {t_legacy / t_vectorized:.1f}x")
+
+    print(f"\nToplam | eski: {total_legacy:.2f} sn, yeni: {total_vectorized:.2f} sn, "
+          f"hızlanma: {total_legacy / total_vectorized:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Çoklu seçim kodlama kıyaslaması")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Sentetik anket satır sayısı")
+    args = parser.parse_args()
+    main(args.rows)
@@ -0,0 +1,86 @@
+"""
+Bitmap Index (English)
+Packed bitmaps (one bit per respondent, 64 rows per word) for every level of the
+dashboard filter dimensions and every technology flag. A filter is the AND over
+dimensions of the OR of the selected levels' bitmaps; user/non-user splits are AND /
+AND-NOT with a flag bitmap and counts are popcounts, so slicing touches n/64 words
+per bitmap instead of scanning and comparing whole columns.
+"""
+
+import numpy as np
+import pandas as pd
+
+from aggregate_cube import DIMENSIONS, dimension_values
+from vocabulary import flag_columns
+
+# Multi-hot technology blocks indexed as flags
+FLAG_PREFIXES = ('programming_', 'frontend_', 'tools_')
+
+
+def pack_bits(mask):
+    """Pack a boolean row mask into uint64 words (trailing bits are zero)."""
+    packed = np.packbits(np.asarray(mask, dtype=bool), bitorder='little')
+    padded = np.zeros(-(-len(packed) // 8) * 8, dtype=np.uint8)
+    padded[:len(packed)] = packed
+    return padded.view(np.uint64)
+
+
+def popcount(bits):
+    """Number of set bits."""
+    return int(np.bitwise_count(bits).sum())
+
+
+class BitmapIndex:
+    """
+    Level and flag bitmaps of a frame. Build once with `from_frame`; `select` takes
+    the same filter dict as AggregateCube ({dimension: selected levels}, a missing or
+    empty selection leaves the dimension unfiltered) and returns a bitmap.
+    """
+
+    def __init__(self, n_rows, levels, flags):
+        self.n_rows = n_rows
+        self.levels = levels  # dimension -> {level: bitmap}
+        self.flags = flags    # flag column -> bitmap
+        self._all = pack_bits(np.ones(n_rows, dtype=bool))
+        self._flag_matrix = np.vstack(list(flags.values())) if flags else np.empty((0, len(self._all)), np.uint64)
+
+    @classmethod
+    def from_frame(cls, df, dimensions=DIMENSIONS, flag_prefixes=FLAG_PREFIXES):
+        levels = {}
+        for dim in dimensions:
+            codes, uniques = pd.factorize(dimension_values(df, dim), sort=True)
+            levels[dim] = {level: pack_bits(codes == k) for k, level in enumerate(uniques.tolist())}
+        flags = {c: pack_bits(df[c].to_numpy() == 1) for c in flag_columns(df.columns, tuple(flag_prefixes))}
+        return cls(len(df), levels, flags)
+
+    def select(self, filters=None):
+        """Bitmap of the rows matching the filters; missing levels never match a filter."""
+        bits = self._all.copy()
+        for dim, selected in (filters or {}).items():
+            if selected is None or len(selected) == 0:
+                continue
+            any_level = np.zeros_like(bits)
+            for level in selected:
+                if level in self.levels[dim]:
+                    any_level |= self.levels[dim][level]
+            bits &= any_level
+        return bits
+
+    def split(self, flag, bits=None):
+        """(users, non-users) bitmaps of a flag within bits: AND and AND-NOT."""
+        bits = self._all if bits is None else bits
+        return bits & self.flags[flag], bits & ~self.flags[flag]
+
+    def count(self, bits=None):
+        """Number of rows in bits."""
+        return popcount(self._all if bits is None else bits)
+
+    def flag_counts(self, bits=None) -> pd.Series:
+        """Number of users of every flag within bits, one popcount pass over all flags."""
+        bits = self._all if bits is None else bits
+        counts = np.bitwise_count(self._flag_matrix & bits).sum(axis=1, dtype=np.int64)
+        return pd.Series(counts, index=list(self.flags))
+
+    def mask(self, bits):
+        """Boolean row mask of bits (for indexing the source frame)."""
+        return np.unpackbits(bits.view(np.uint8), count=self.n_rows, bitorder='little').astype(bool)
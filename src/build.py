@@ -0,0 +1,283 @@
+"""
+Artımlı derleme grafiği.
+Her çıktı (temizlenmiş veri, istatistiksel test sonuçları, figures/ altındaki her grafik
+grubu, LaTeX raporu) girdi dosyalarını, bağımlı olduğu hedefleri ve kodunu bildirir.
+Hedefin imzası girdilerin içerik özetleri, kod sürümü (betiğin ve içe aktardığı yerel
+modüllerin özeti) ve parametrelerinden oluşur; imza ve çıktıların özetleri bir manifest
+dosyasında tutulur. Yalnızca imzası değişmiş veya çıktısı silinmiş/elle değiştirilmiş
+hedefler yeniden üretilir. Elle düzenlenen LaTeX raporu varsayılan derlemeye girmez;
+yalnızca adıyla istendiğinde üretilir ve elle yapılan değişiklikler onu eski saymaz.
+Dosya özetleri boyut + mtime değişmedikçe yeniden hesaplanmaz (bkz. source_digests),
+böylece hiçbir şey değişmediğinde derleme neredeyse anında biter.
+"""
+
+import argparse
+import ast
+import fnmatch
+import hashlib
+import json
+import os
+import time
+from collections import namedtuple
+
+from atomic_write import atomic_path
+from source_digests import SRC_DIR, FileDigests, code_version
+
+MANIFEST_PATH = 'data/build_manifest.json'
+# Manifest biçimi sürümü; biçim uyumsuz değişirse artırılır (tüm hedefler yeniden üretilir)
+MANIFEST_FORMAT = 1
+# Yalnızca adıyla (veya deseniyle) istendiğinde üretilen hedefler; çıktıları elle
+# düzenlenir (reports/salary_analysis_report.tex), bu yüzden değişmiş çıktı eski sayılmaz
+EXPLICIT_TARGETS = ('report',)
+
+# deps: önce üretilmesi gereken hedefler, inputs: içeriği izlenen dosya/dizinler,
+# code: kod sürümü hesaplanan betikler, outputs: üretilen dosyalar,
+# run: ardışık eski hedeflerin adlarıyla bir kez çağrılır (grafik grupları birlikte çizilir),
+# params: imzaya eklenen değer üreten fonksiyon (yoksa None)
+Target = namedtuple('Target', ['name', 'deps', 'inputs', 'code', 'outputs', 'run', 'params'])
+
+
+def module_constants(script, names):
+    """
+    Modül düzeyindeki sabit (literal) atamaları modülü içe aktarmadan oku; böylece
+    grafiği kurmak pandas/matplotlib yüklemez.
+    """
+    with open(os.path.join(SRC_DIR, script), encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=script)
+    values = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            if node.targets[0].id in names:
+                values[node.targets[0].id] = ast.literal_eval(node.value)
+    missing = set(names) - set(values)
+    if missing:
+        raise KeyError(f'{script} içinde sabit bulunamadı: {sorted(missing)}')
+    return [values[name] for name in names]
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """Kayıtlı manifest; yoksa, okunamıyorsa veya biçimi eskiyse boş manifest."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    if manifest.get('format') != MANIFEST_FORMAT:
+        manifest = {'format': MANIFEST_FORMAT}
+    for section in ('files', 'imports', 'targets'):
+        manifest.setdefault(section, {})
+    return manifest
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    """Manifest'i atomik olarak yaz."""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+
+
+# ============ HEDEFLER ============
+
+def _run_cleaned_data(names):
+    import data_preprocessing_final
+    data_preprocessing_final.main()
+
+
+def _run_statistical_tests(names):
+    import sprint2_analysis
+    sprint2_analysis.perform_statistical_tests(sprint2_analysis.load_data(),
+                                               output_path=sprint2_analysis.STATISTICAL_TESTS_PATH)
+
+
+def _run_aggregates(names):
+    import plot_data
+    from data_store import load_cleaned_data
+    plot_data.ensure_tables(load_cleaned_data())
+
+
+def _run_figures(names, workers=None):
+    import sprint2_analysis
+    sprint2_analysis.ensure_dirs()
+    plots = [name.split(':', 1)[1] for name in names]
+    sprint2_analysis.render_figures(sprint2_analysis.load_data(), plots, workers)
+
+
+def _run_report(names):
+    import latex_report_generator
+    latex_report_generator.main()
+
+
+def _existing_figures():
+    """Rapor var olan grafikleri ekler; hangi grafiklerin var olduğu rapor imzasına girer."""
+    if not os.path.isdir('figures'):
+        return []
+    return sorted(entry.name for entry in os.scandir('figures') if entry.is_file())
+
+
+def build_targets(workers=None):
+    """Derleme grafiğinin hedefleri, bağımlılık sırasıyla."""
+    raw_path, state_path = module_constants('data_preprocessing_final.py', ['RAW_DATA_PATH', 'STATE_PATH'])
+    cleaned = module_constants('data_store.py', ['CLEANED_DATA_PATH', 'CLEANED_PARQUET_PATH', 'CLEANED_ARROW_PATH'])
+    vocabulary_path, = module_constants('vocabulary.py', ['VOCABULARY_PATH'])
+    fig_dir, plot_outputs, tests_path = module_constants(
+        'sprint2_analysis.py', ['FIG_DIR', 'PLOT_OUTPUTS', 'STATISTICAL_TESTS_PATH'])
+    aggregates_dir, = module_constants('plot_data.py', ['AGGREGATES_DIR'])
+
+    targets = [
+        Target('cleaned_data', [], [raw_path], ['data_preprocessing_final.py'],
+               cleaned + [state_path, vocabulary_path], _run_cleaned_data, None),
+        Target('statistical_tests', ['cleaned_data'], cleaned, ['sprint2_analysis.py'],
+               [tests_path], _run_statistical_tests, None),
+        # Grafik ve raporun okuduğu özet tablolar (dizin özeti tüm tabloları kapsar)
+        Target('aggregates', ['cleaned_data'], cleaned, ['plot_data.py'],
+               [aggregates_dir], _run_aggregates, None),
+    ]
+
+    def run_figures(names):
+        _run_figures(names, workers)
+
+    for plot, outputs in plot_outputs.items():
+        targets.append(Target(f'figure:{plot}', ['cleaned_data', 'aggregates'], cleaned + [aggregates_dir],
+                              ['sprint2_analysis.py'], [os.path.join(fig_dir, name) for name in outputs],
+                              run_figures, None))
+    targets.append(Target('report', ['cleaned_data', 'aggregates'] + [f'figure:{plot}' for plot in plot_outputs],
+                          cleaned + [aggregates_dir], ['latex_report_generator.py'],
+                          ['reports/salary_analysis_report.tex'], _run_report, _existing_figures))
+    return {target.name: target for target in targets}
+
+
+# ============ DERLEME ============
+
+def select_targets(targets, patterns=None):
+    """
+    Desenlere (örn. 'report', 'figure:box*', 'figures') uyan hedefler: (bağımlılıklarıyla
+    birlikte sıralı adlar, yalnızca desenlere uyan adlar). Desen verilmezse
+    EXPLICIT_TARGETS dışındaki tüm hedefler seçilir.
+    """
+    if not patterns:
+        requested = {name for name in targets if name not in EXPLICIT_TARGETS}
+    else:
+        requested = set()
+        for pattern in patterns:
+            pattern = 'figure:*' if pattern == 'figures' else pattern
+            matches = fnmatch.filter(targets, pattern)
+            if not matches:
+                raise ValueError(f'Bilinmeyen hedef: {pattern}. Hedefler: {", ".join(targets)}')
+            requested.update(matches)
+    wanted = set(requested)
+    stack = list(wanted)
+    while stack:
+        for dep in targets[stack.pop()].deps:
+            if dep not in wanted:
+                wanted.add(dep)
+                stack.append(dep)
+    return [name for name in targets if name in wanted], requested
+
+
+def target_signature(target, digests, code_versions):
+    """Girdi özetleri, kod sürümü ve parametrelerden hedef imzası."""
+    spec = {
+        'inputs': {path: digests.digest(path) for path in target.inputs},
+        'code': code_versions(target.code),
+        'params': target.params() if target.params else None,
+    }
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def is_stale(target, signature, record, digests):
+    """
+    İmza değişmişse, hiç üretilmemişse veya kayıtlı bir çıktı silinmiş/değişmişse eski.
+    EXPLICIT_TARGETS'ın çıktıları elle düzenlendiğinden yalnızca silinmişlerse eski sayılır.
+    """
+    if record is None or record['signature'] != signature or not record['outputs']:
+        return True
+    if target.name in EXPLICIT_TARGETS:
+        return any(digests.digest(path) is None for path in record['outputs'])
+    return any(digests.digest(path) != digest for path, digest in record['outputs'].items())
+
+
+def build(patterns=None, force=False, dry_run=False, workers=None, manifest_path=MANIFEST_PATH):
+    """
+    Seçilen hedefleri (varsayılan: rapor dışında hepsi) bağımlılık sırasıyla, yalnızca eskiyse üret;
+    force seçilen hedefleri (bağımlılıklarını değil) her durumda yeniden üretir.
+    Aynı çalıştırıcıyı paylaşan ardışık eski hedefler (grafik grupları) tek çağrıda üretilir.
+    Dönüş: yeniden üretilen (dry_run'da üretilecek) hedeflerin adları.
+    """
+    start = time.perf_counter()
+    targets = build_targets(workers)
+    names, requested = select_targets(targets, patterns)
+    manifest = load_manifest(manifest_path)
+    digests = FileDigests(manifest['files'])
+    versions = {}
+
+    def code_versions(scripts):
+        # Aynı betik kümesinin sürümü bir derleme içinde bir kez hesaplanır
+        key = tuple(scripts)
+        if key not in versions:
+            versions[key] = code_version(scripts, digests, manifest['imports'])
+        return versions[key]
+
+    rebuilt = []
+
+    i = 0
+    while i < len(names):
+        # Aynı çalıştırıcıya sahip ardışık hedefler birlikte değerlendirilir
+        group = [names[i]]
+        while i + len(group) < len(names) and targets[names[i + len(group)]].run is targets[names[i]].run:
+            group.append(names[i + len(group)])
+        i += len(group)
+
+        stale = {}
+        for name in group:
+            target = targets[name]
+            signature = target_signature(target, digests, code_versions)
+            # dry_run'da girdisini üreten bir bağımlılık eskiyse hedef de eski sayılır
+            upstream = dry_run and any(dep in rebuilt and set(targets[dep].outputs) & set(target.inputs)
+                                       for dep in target.deps)
+            if (force and name in requested) or upstream or is_stale(target, signature, manifest['targets'].get(name), digests):
+                stale[name] = signature
+        if not stale:
+            continue
+        rebuilt.extend(stale)
+        print(f"🔨 {'Üretilecek' if dry_run else 'Üretiliyor'}: {', '.join(stale)}")
+        if dry_run:
+            continue
+
+        targets[group[0]].run(list(stale))
+        for name, signature in stale.items():
+            outputs = {path: digests.digest(path) for path in targets[name].outputs}
+            manifest['targets'][name] = {
+                'signature': signature,
+                'outputs': {path: digest for path, digest in outputs.items() if digest is not None},
+                'built_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            }
+        manifest['files'] = digests.known
+        save_manifest(manifest, manifest_path)
+
+    if not dry_run:
+        manifest['files'] = digests.known
+        save_manifest(manifest, manifest_path)
+    state = 'güncel' if not rebuilt else f'{len(rebuilt)} hedef {"eski" if dry_run else "yeniden üretildi"}'
+    print(f'✅ Derleme tamamlandı ({state}, {time.perf_counter() - start:.2f} sn)')
+    return rebuilt
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Veri, grafik ve raporların artımlı derlemesi')
+    parser.add_argument('targets', nargs='*',
+                        help="Üretilecek hedefler veya desenler (varsayılan: rapor dışında hepsi), örn. report 'figure:box*' figures")
+    parser.add_argument('--force', action='store_true', help='Seçilen hedefleri eski olmasalar da yeniden üret')
+    parser.add_argument('--dry-run', action='store_true', help='Yalnızca hangi hedeflerin eski olduğunu göster')
+    parser.add_argument('--workers', type=int, default=None, help='Grafik çizim süreç sayısı (varsayılan: çekirdek sayısı)')
+    parser.add_argument('--list', action='store_true', help='Hedefleri ve bağımlılıklarını listele')
+    args = parser.parse_args()
+    if args.list:
+        for target in build_targets().values():
+            print(f"{target.name}: {', '.join(target.deps) or '-'}")
+    else:
+        try:
+            build(args.targets, force=args.force, dry_run=args.dry_run, workers=args.workers)
+        except ValueError as e:
+            parser.error(str(e))
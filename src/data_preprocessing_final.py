@@ -5,13 +5,38 @@ Bu script, 2025_maas_anket.csv dosyasını temizleyip analiz için hazır hale g
 
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import MultiLabelBinarizer
+from scipy import sparse
 from unidecode import unidecode
 import re
+import io
+import os
+import json
+import argparse
+from vocabulary import (VOCABULARY_PATH, extend_labels, make_vocabulary, load_vocabulary,
+                        save_vocabulary, field_labels, flag_columns)
+from streaming_stats import QuantileSketch, RunningMoments
+from concurrent.futures import ProcessPoolExecutor
+from data_store import (save_cleaned_data, save_cleaned_data_stream, append_cleaned_data, load_cleaned_data,
+                        save_survey_partition, code_categorical, CODE_COLUMNS, PROCESSED_STORE_PATH)
 import warnings
 warnings.filterwarnings('ignore')
 
-def _normalize_multi_label_token(value: str) -> str:
+# Çoklu seçim alias haritası (lower-case anahtar); kelime dağarcığıyla birlikte kaydedilir
+MULTI_LABEL_ALIASES = {
+    'objective c': 'Objective C',
+    'objective_c': 'Objective C',
+    'r language': 'R Language',
+    'html css': 'HTML/CSS',
+    'html/css': 'HTML/CSS',
+    'c sharp': 'C#',
+    'c plus plus': 'C++',
+    'js': 'JavaScript',
+    'ts': 'TypeScript',
+}
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def _normalize_multi_label_token(value: str, aliases=None) -> str:
     """
     Çoklu seçim alanlarındaki tekil bir değeri normalize et:
     - Kenar boşluklarını kırp
@@ -21,21 +46,11 @@ def _normalize_multi_label_token(value: str) -> str:
     if value is None:
         return ''
     text = str(value).strip()
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_PATTERN.sub(' ', text)
 
     # Alias haritası (lower-case anahtar)
     key = text.lower().replace('-', ' ').replace('_', ' ')
-    alias_map = {
-        'objective c': 'Objective C',
-        'objective_c': 'Objective C',
-        'r language': 'R Language',
-        'html css': 'HTML/CSS',
-        'html/css': 'HTML/CSS',
-        'c sharp': 'C#',
-        'c plus plus': 'C++',
-        'js': 'JavaScript',
-        'ts': 'TypeScript',
-    }
+    alias_map = MULTI_LABEL_ALIASES if aliases is None else aliases
     if key in alias_map:
         return alias_map[key]
     return text
@@ -49,85 +64,187 @@ def _slugify_label_for_column(name: str) -> str:
     name = re.sub(r'_+', '_', name).strip('_')
     return name
 
+def _clean_column_name(col):
+    """
+    Tek bir sütun adını temizle (bkz. clean_column_names).
+    """
+    # Türkçe karakterleri latinize et
+    cleaned = unidecode(col)
+    # Boşlukları _ ile değiştir
+    cleaned = re.sub(r'\s+', '_', cleaned)
+    # Özel karakterleri değiştir
+    cleaned = re.sub(r'[^a-zA-Z0-9_]', '_', cleaned)
+    # Birden fazla _'yi tek _'ye çevir
+    cleaned = re.sub(r'_+', '_', cleaned)
+    # Başındaki ve sonundaki _'leri kaldır
+    return cleaned.strip('_')
+
 def clean_column_names(df):
     """
     Sütun isimlerini temizle: boşlukları _ ile değiştir, Türkçe karakterleri latinize et
     """
-    new_columns = {}
-    for col in df.columns:
-        # Türkçe karakterleri latinize et
-        cleaned = unidecode(col)
-        # Boşlukları _ ile değiştir
-        cleaned = re.sub(r'\s+', '_', cleaned)
-        # Özel karakterleri değiştir
-        cleaned = re.sub(r'[^a-zA-Z0-9_]', '_', cleaned)
-        # Birden fazla _'yi tek _'ye çevir
-        cleaned = re.sub(r'_+', '_', cleaned)
-        # Başındaki ve sonundaki _'leri kaldır
-        cleaned = cleaned.strip('_')
-        new_columns[col] = cleaned
-    return df.rename(columns=new_columns)
-
-def normalize_salary(salary_range):
-    """
-    Maaş aralıklarını sayısal değerlere dönüştür
-    """
-    if pd.isna(salary_range):
-        return np.nan
-    
-    salary_str = str(salary_range).strip()
-    
+    return df.rename(columns={col: _clean_column_name(col) for col in df.columns})
+
+# Maaş bandı formatları: "61 - 70" (aralık) veya "45" (tek değer)
+SALARY_BAND_PATTERN = r'^(?P<low>\d+(?:\.\d+)?)(?: - (?P<high>\d+(?:\.\d+)?))?$'
+# Üstü açık bant ("300 +") için kullanılan temsili değer
+SALARY_OPEN_BAND_LOW = 300
+SALARY_OPEN_BAND_VALUE = 350
+
+def parse_salary_bands(salary_ranges):
+    """
+    Maaş aralıklarını vektörel olarak sayısal değerlere dönüştür.
+    Sütun önce kategorik kodlara ayrılır; regex ayrıştırma yalnızca farklı bantlar
+    üzerinde yapılır ve sonuç tek bir take ile satırlara dağıtılır. Böylece maliyet
+    satır sayısıyla değil, farklı bant sayısıyla ölçeklenir.
+
+    Dönüş: salary_numeric (orta nokta), salary_low ve salary_high sütunlu DataFrame.
+    Üstü açık bant için salary_high NaN, ayrıştırılamayan değerler için tümü NaN olur.
+    """
+    codes, bands = pd.factorize(salary_ranges)
+    bands = pd.Index(bands).astype(str).str.strip()
+
+    # Aralık formatı: "61 - 70" -> 65.5, tek değer formatı: "45" -> 45
+    parts = bands.str.extract(SALARY_BAND_PATTERN)
+    low = pd.to_numeric(parts['low'], errors='coerce').to_numpy(dtype=float)
+    high = pd.to_numeric(parts['high'], errors='coerce').to_numpy(dtype=float)
+    high = np.where(np.isnan(high), low, high)
+    midpoint = (low + high) / 2
+
     # 300+ durumu
-    if '300 +' in salary_str or '300+' in salary_str:
-        return 350
-    
-    # Aralık formatı: "61 - 70" -> 65.5
-    if ' - ' in salary_str:
-        try:
-            lower, upper = map(float, salary_str.split(' - '))
-            return (lower + upper) / 2
-        except:
-            return np.nan
-    
-    # Tek değer formatı
-    try:
-        return float(salary_str)
-    except:
-        return np.nan
+    is_open = np.asarray(bands.str.contains('300 +', regex=False) | bands.str.contains('300+', regex=False), dtype=bool)
+    midpoint[is_open] = SALARY_OPEN_BAND_VALUE
+    low[is_open] = SALARY_OPEN_BAND_LOW
+    high[is_open] = np.nan
+
+    # Eksik değerler -1 koduna sahip; sona eklenen NaN hücresine düşer
+    lookup = np.column_stack([midpoint, low, high])
+    lookup = np.vstack([lookup, np.full(3, np.nan)])
+    values = lookup.take(codes, axis=0)
+
+    return pd.DataFrame(values, columns=['salary_numeric', 'salary_low', 'salary_high'], index=salary_ranges.index)
 
-def process_multi_label_columns(df, columns_to_process):
+# Çalışan lokasyon tahmin kuralları. Kurallar sırayla değerlendirilir, ilk eşleşen
+# kuralın bayrağı kullanılır; `when` içindeki tüm koşullar (sütun → kabul edilen
+# değerler) birlikte sağlanmalıdır. Yeni kural (örn. ülke bazlı hub) eklemek için
+# listeye bir satır eklemek yeterlidir.
+LOCATION_INFERENCE_RULES = [
+    # "Yurtdışı TR hub" → her durumda 0 (belirsiz, aykırı değerler dahil)
+    {'when': {'company_location': ['Yurtdışı TR hub']}, 'flag': 0},
+    # Remote → 0 (ikamet kesin tahmin edilemez)
+    {'when': {'work_mode': ['Remote']}, 'flag': 0},
+    # Office veya Hybrid → yüksek ihtimal şirket lokasyonunda yaşıyor
+    {'when': {'work_mode': ['Office', 'Hybrid']}, 'flag': 1},
+]
+# Hiçbir kural eşleşmezse → belirsiz
+LOCATION_INFERENCE_DEFAULT = 0
+
+def infer_location_flags(df, rules=None, default=LOCATION_INFERENCE_DEFAULT):
     """
-    Çoklu seçim sütunlarını multi-hot encoding ile işle
+    is_likely_in_company_location bayrağını kural tablosundan sütun bazında hesapla.
+    Her kural tüm sütun üzerinde bir boolean maskeye dönüştürülür ve np.select ile
+    ilk eşleşen kuralın bayrağı seçilir (satır döngüsü yok).
     """
+    if rules is None:
+        rules = LOCATION_INFERENCE_RULES
+
+    conditions = []
+    choices = []
+    for rule in rules:
+        mask = np.ones(len(df), dtype=bool)
+        for column, values in rule['when'].items():
+            mask &= df[column].isin(values).to_numpy()
+        conditions.append(mask)
+        choices.append(rule['flag'])
+
+    flags = np.select(conditions, choices, default=default)
+    return pd.Series(flags, index=df.index, dtype='int64')
+
+def explode_multi_label(values, aliases=None):
+    """
+    Çoklu seçim hücrelerini etiketlere ayır; iş farklı değerler üzerinde yapılır.
+    Hücreler kategorik kodlara çevrilir, yalnızca farklı hücreler virgülden bir kez
+    patlatılır ve yalnızca farklı ham token'lar normalize edilir. Maliyet toplam token
+    sayısıyla değil farklı hücre/token sayısıyla orantılıdır. Boş hücreler 'Hiçbiri' kabul edilir.
+    Dönüş: (satır başına hücre kodu, hücre × etiket CSR matrisi, etiketler)
+    """
+    cell_codes, cells = pd.factorize(values.to_numpy(dtype=object))
+    cells = list(cells.astype(str))
+    if (cell_codes < 0).any():
+        # Eksik hücreler (kod -1) ayrı bir 'Hiçbiri' hücresine gider
+        cells.append('Hiçbiri')
+        cell_codes = np.where(cell_codes < 0, len(cells) - 1, cell_codes)
+
+    tokens = pd.Series(cells, dtype=object).str.split(',').explode()
+    token_codes, raw_tokens = pd.factorize(tokens.to_numpy(dtype=object))
+
+    # Farklı ham token'ları normalize et, normalize edilmiş etiketleri yeniden kodla
+    normalized = pd.Series([_normalize_multi_label_token(token, aliases) for token in raw_tokens], dtype=object)
+    label_of_token, labels = pd.factorize(normalized.where(normalized != ''))
+    label_codes = label_of_token[token_codes]
+
+    # Boş token'ları at; hücre içi tekrarlar 1'e indirilir
+    keep = label_codes >= 0
+    cell_matrix = sparse.csr_matrix(
+        (np.ones(keep.sum(), dtype=np.uint8), (tokens.index.to_numpy()[keep], label_codes[keep])),
+        shape=(len(cells), len(labels)))
+    cell_matrix.data[:] = 1
+    return cell_codes, cell_matrix, labels.to_numpy(dtype=object)
+
+def encode_multi_label(values, sparse_output=False, classes=None, aliases=None):
+    """
+    Virgülle ayrılmış çoklu seçim hücrelerini multi-hot matrise çevir.
+    Dönüş: (matris, etiket → sütun indeksi sözlüğü). sparse_output=True ise
+    matris uint8 CSR olarak döner ve hiçbir aşamada yoğunlaştırılmaz.
+    classes verilirse sütunlar bu etiketlerden ve bu sırayla oluşur (önceden
+    çıkarılmış kelime dağarcığı; bilinmeyen etiketler yok sayılır); verilmezse
+    veride görülen etiketler sıralanır.
+    """
+    cell_codes, cell_matrix, labels = explode_multi_label(values, aliases)
+    if classes is None:
+        classes = sorted(labels)
+    label_index = {label: i for i, label in enumerate(classes)}
+
+    # Etiket sütunlarını sınıf sırasına taşı (küçük hücre × etiket matrisi üzerinde)
+    remap = sparse.csr_matrix(
+        (np.ones(len(labels), dtype=np.uint8),
+         (np.arange(len(labels)), [label_index.get(label, 0) for label in labels])),
+        shape=(len(labels), len(classes)))
+    known = np.array([label in label_index for label in labels], dtype=bool)
+    remap = sparse.diags(known.astype(np.uint8)) @ remap
+    cell_matrix = (cell_matrix @ remap).astype(np.uint8)
+
+    # Hücre kodlarıyla satırlara geri eşle
+    if sparse_output:
+        return cell_matrix[cell_codes], label_index
+    return cell_matrix.toarray()[cell_codes], label_index
+
+def process_multi_label_columns(df, columns_to_process, sparse_output=False, vocabulary=None):
+    """
+    Çoklu seçim sütunlarını multi-hot encoding ile işle.
+    sparse_output=True ise bayrak sütunları SparseDtype(uint8) olarak eklenir;
+    blok `multi_hot_matrix` ile kopyasız şekilde CSR matrise geri alınabilir.
+    vocabulary (bkz. vocabulary.py) verilirse sütunlar kayıtlı etiketlerden ve
+    kayıtlı alias haritasıyla üretilir.
+    """
+    aliases = vocabulary['aliases'] if vocabulary else None
     for col in columns_to_process:
         if col in df.columns:
-            # Virgülle ayrılmış değerleri listeye çevir
-            df[col] = df[col].fillna('Hiçbiri')
-            df[col] = df[col].astype(str).str.split(',')
-
-            # Token bazlı normalizasyon ve satır içi tekilleştirme
-            def _normalize_list(values):
-                normalized = set()
-                for v in values:
-                    norm = _normalize_multi_label_token(v)
-                    if norm:
-                        normalized.add(norm)
-                # Deterministik sütun sırası için sırala
-                return sorted(normalized)
-
-            df[col] = df[col].apply(_normalize_list)
-            
-            # MultiLabelBinarizer uygula
-            mlb = MultiLabelBinarizer()
-            encoded = mlb.fit_transform(df[col])
+            # Virgülle ayrılmış değerleri token'lara ayır, normalize et ve multi-hot kodla
+            classes = field_labels(vocabulary, col) if vocabulary else None
+            encoded, label_index = encode_multi_label(df[col], sparse_output=sparse_output,
+                                                      classes=classes, aliases=aliases)
             
             # Sütun isimlerini oluştur
             prefix = col.split('_')[0] if '_' in col else col
             # Sınıf adlarını sütun adı için güvenli ve tekilleştirilmiş hale getir
-            encoded_columns = [f'{prefix}__{_slugify_label_for_column(x)}' for x in mlb.classes_]
+            encoded_columns = [f'{prefix}__{_slugify_label_for_column(x)}' for x in label_index]
             
             # DataFrame oluştur
-            encoded_df = pd.DataFrame(encoded, columns=encoded_columns, index=df.index, dtype=int)
+            if sparse_output:
+                encoded_df = pd.DataFrame.sparse.from_spmatrix(encoded, index=df.index, columns=encoded_columns)
+            else:
+                encoded_df = pd.DataFrame(encoded, columns=encoded_columns, index=df.index, dtype=int)
             
             # Ana DataFrame'e ekle
             df = pd.concat([df, encoded_df], axis=1)
@@ -137,149 +254,564 @@ def process_multi_label_columns(df, columns_to_process):
     
     return df
 
-def main():
+def multi_hot_matrix(df, prefix, vocabulary=None):
     """
-    Ana veri işleme fonksiyonu
+    prefix bloğunun bayrak sütunlarını CSR matris olarak döndür; sütunlar kelime
+    dağarcığından ve onun sırasıyla alınır (bkz. vocabulary.flag_columns).
+    Dönüş: (CSR matris, etiket → sütun indeksi sözlüğü). SparseDtype sütunlar
+    yoğunlaştırılmadan dönüştürülür; yoğun sütunlar uint8'e indirilir.
     """
-    print("Sprint 1: Veri Hazırlama ve Ön İşleme Başlıyor...")
-    
-    # 1. Veri Yükleme
-    print("1. Veri yükleniyor...")
-    df = pd.read_csv('data/2025_maas_anket.csv')
-    print(f"   Yüklenen veri boyutu: {df.shape}")
-    
-    # 2. Eksik Veri Kontrolü
-    print("2. Eksik veri kontrolü yapılıyor...")
-    missing_data = df.isna().sum()
-    print(f"   Eksik veri sayısı: {missing_data.sum()}")
-    assert missing_data.sum() == 0, "Eksik veri tespit edildi!"
-    
+    cols = flag_columns(df.columns, prefix, vocabulary)
+    block = df[cols]
+    if cols and all(isinstance(dtype, pd.SparseDtype) for dtype in block.dtypes):
+        matrix = block.sparse.to_coo().tocsr().astype(np.uint8)
+    else:
+        matrix = sparse.csr_matrix(block.to_numpy(dtype=np.uint8))
+    label_index = {c[len(prefix):]: i for i, c in enumerate(cols)}
+    return matrix, label_index
+
+RAW_DATA_PATH = 'data/2025_maas_anket.csv'
+# Artımlı mod için son işlenen konum, kelime dağarcığı (sütun listesi) ve aykırı değer sınırları
+STATE_PATH = 'data/2025_cleaned_data.state.json'
+
+COLUMN_MAPPING = {
+    'Timestamp': 'timestamp',
+    'Şirket lokasyon': 'company_location',
+    'Çalışma türü': 'employment_type',
+    'Çalışma şekli': 'work_mode',
+    'Cinsiyet': 'gender',
+    'Toplam kaç yıllık iş deneyimin var?': 'experience_years',
+    'Hangi seviyedesin?': 'level',
+    'Hangi programlama dillerini kullanıyorsun': 'programming_languages',
+    'Ne yapıyorsun?': 'role',
+    'Frontend yazıyorsan hangilerini kullanıyorsun': 'frontend_technologies',
+    'Hangi tool\'ları kullanıyorsun': 'tools',
+    'Aylık ortalama net kaç bin TL alıyorsun?': 'salary_range'
+}
+
+# Yıl bazlı anket şemaları: ham dosya, sütun eşlemesi ve eksik değere izin verilen alanlar.
+# 2024 anketinde frontend/tool soruları yoktur, cinsiyet boştur ve bazı lokasyon/çalışma
+# bilgileri eksiktir; sütun sırası da farklıdır (eşleme ada göre yapılır).
+SURVEY_SCHEMAS = {
+    2024: {
+        'raw_path': 'data/2024_maas_anket.csv',
+        'column_mapping': {k: v for k, v in COLUMN_MAPPING.items()
+                           if v not in ('frontend_technologies', 'tools')},
+        'allow_missing': ['company_location', 'employment_type', 'work_mode', 'gender'],
+    },
+    2025: {
+        'raw_path': RAW_DATA_PATH,
+        'column_mapping': COLUMN_MAPPING,
+        'allow_missing': [],
+    },
+}
+
+CATEGORICAL_COLUMNS = ['company_location', 'employment_type', 'work_mode', 'role']
+MULTI_LABEL_COLUMNS = ['programming_languages', 'frontend_technologies', 'tools']
+ORIGINAL_COLUMNS = ['salary_range', 'programming_languages', 'frontend_technologies', 'tools']
+
+EXPERIENCE_MAP = {
+    '0': 0, '1': 1, '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9,
+    '10': 10, '11 - 15': 13, '16 - 20': 18, '20 - 30': 25, '30+': 30
+}
+# Teknik seviyeler için ordinal kodlama
+IC_LEVEL_MAP = {
+    'Junior': 1, 'Mid': 2, 'Senior': 3, 'Staff Engineer': 4, 'Team Lead': 5, 'Architect': 6
+}
+MANAGEMENT_ROLES = ['Engineering Manager', 'Director Level Manager', 'C-Level Manager', 'Partner']
+SALARY_CAP = 350
+# Akış (chunk) modunda varsayılan parça boyutu
+STREAM_CHUNK_SIZE = 100_000
+# Akış modunda maaş quantile özetinin k parametresi (büyüdükçe daha doğru, daha çok bellek)
+SALARY_SKETCH_K = 200
+
+# Kelime dağarcığına giren alanlar: alan → (kodlama türü, sütun öneki)
+VOCABULARY_FIELDS = {
+    'company_location': ('one_hot', 'company_location'),
+    'employment_type': ('one_hot', 'employment_type'),
+    'work_mode': ('one_hot', 'work_mode'),
+    'role': ('one_hot', 'role'),
+    'level': ('one_hot', 'management'),
+    'programming_languages': ('multi_hot', 'programming'),
+    'frontend_technologies': ('multi_hot', 'frontend'),
+    'tools': ('multi_hot', 'tools'),
+}
+
+def encoded_column_name(kind, prefix, label):
+    """
+    Bir etiketin kodlanmış sütun adı; get_dummies/MultiLabelBinarizer + clean_column_names
+    zincirinin ürettiği adla aynıdır.
+    """
+    if kind == 'multi_hot':
+        return _clean_column_name(f'{prefix}__{_slugify_label_for_column(label)}')
+    return _clean_column_name(f'{prefix}_{label}')
+
+def collect_vocabulary_labels(df, labels=None):
+    """
+    İngilizce sütun adlı ham satırlardaki etiketleri alan bazında topla.
+    labels verilirse (alan → küme) yerinde güncellenir; parça parça okumada kullanılır.
+    """
+    labels = labels if labels is not None else {field: set() for field in VOCABULARY_FIELDS}
+    for field, (kind, _) in VOCABULARY_FIELDS.items():
+        if field not in df.columns:
+            continue
+        if kind == 'multi_hot':
+            labels[field].update(explode_multi_label(df[field])[2])
+        else:
+            labels[field].update(df[field].dropna().unique())
+    return labels
+
+def fit_vocabulary(labels, previous=None):
+    """
+    Toplanan etiketlerden kelime dağarcığı oluştur. previous verilirse mevcut
+    etiket sırası korunur ve yalnızca yeni etiketler alanın sonuna eklenir.
+    """
+    fields = {}
+    for field, (kind, prefix) in VOCABULARY_FIELDS.items():
+        known = field_labels(previous, field) if previous else None
+        ordered = extend_labels(known, labels.get(field, ()))
+        if not ordered:
+            continue
+        fields[field] = {
+            'kind': kind,
+            'prefix': prefix,
+            'labels': ordered,
+            'columns': [encoded_column_name(kind, prefix, label) for label in ordered],
+        }
+    return make_vocabulary(fields, MULTI_LABEL_ALIASES, previous)
+
+def transform_survey(df, sparse_multi_hot=False, verbose=True, vocabulary=None, column_mapping=COLUMN_MAPPING):
+    """
+    Ham anket satırlarını analiz şemasına dönüştür (adım 3-10).
+    Dönüşümler satır bazında bağımsızdır; aykırı değer kırpma (adım 11) veri
+    setinin tamamına bağlı olduğu için burada yapılmaz.
+    vocabulary (bkz. vocabulary.py) verilirse one-hot ve multi-hot sütunları
+    veride görülen değerlerden değil kayıtlı etiketlerden ve kayıtlı sırayla
+    üretilir; böylece her çalıştırma ve her parça aynı sütunlara sahip olur.
+    column_mapping, ham sütun adlarını İngilizce adlara eşler (yıla göre değişebilir;
+    bkz. SURVEY_SCHEMAS). Ham veride olmayan çoklu seçim alanları atlanır.
+    Tek seçimli alanlar one-hot sütunlarının yanında anket etiketlerini taşıyan
+    category tipli kod sütunları olarak da tutulur (bkz. data_store.CODE_COLUMNS).
+    """
+    log = print if verbose else (lambda *args, **kwargs: None)
+
+    def _with_categories(frame, columns):
+        # get_dummies, Categorical sütunlarda veride olmayan kategoriler için de sütun üretir
+        for col in columns:
+            labels = field_labels(vocabulary, col) if vocabulary else None
+            if labels is not None:
+                frame[col] = pd.Categorical(frame[col], categories=labels)
+        return frame
+
     # 3. Sütun İsimlerini İngilizce'ye Çevirme
-    print("3. Sütun isimleri İngilizce'ye çevriliyor...")
-    column_mapping = {
-        'Timestamp': 'timestamp',
-        'Şirket lokasyon': 'company_location',
-        'Çalışma türü': 'employment_type',
-        'Çalışma şekli': 'work_mode',
-        'Cinsiyet': 'gender',
-        'Toplam kaç yıllık iş deneyimin var?': 'experience_years',
-        'Hangi seviyedesin?': 'level',
-        'Hangi programlama dillerini kullanıyorsun': 'programming_languages',
-        'Ne yapıyorsun?': 'role',
-        'Frontend yazıyorsan hangilerini kullanıyorsun': 'frontend_technologies',
-        'Hangi tool\'ları kullanıyorsun': 'tools',
-        'Aylık ortalama net kaç bin TL alıyorsun?': 'salary_range'
-    }
+    log("3. Sütun isimleri İngilizce'ye çevriliyor...")
     df = df.rename(columns=column_mapping)
     
     # 4. Timestamp'i datetime objesine dönüştürme
-    print("4. Timestamp datetime objesine dönüştürülüyor...")
+    log("4. Timestamp datetime objesine dönüştürülüyor...")
     df['timestamp'] = pd.to_datetime(df['timestamp'])
     
     # 5. Maaş Normalizasyonu
-    print("5. Maaş normalizasyonu yapılıyor...")
-    df['salary_numeric'] = df['salary_range'].apply(normalize_salary)
-    print(f"   Maaş dağılımı: {df['salary_numeric'].describe()}")
+    log("5. Maaş normalizasyonu yapılıyor...")
+    salary = parse_salary_bands(df['salary_range'])
+    df['salary_numeric'] = salary['salary_numeric']
+    # Bant sınırları (üstü açık bantta salary_high NaN) orta noktanın yanında saklanır
+    df['salary_low'] = salary['salary_low']
+    df['salary_high'] = salary['salary_high']
+    log(f"   Maaş dağılımı: {df['salary_numeric'].describe()}")
     
     # 6. Çalışan Lokasyon Tahmini (One-Hot encoding'den önce)
-    print("6. Çalışan lokasyon tahmini yapılıyor...")
-
-    def infer_location_flag(row):
-        # "Yurtdışı TR hub" → her durumda 0 (belirsiz, aykırı değerler dahil)
-        if row['company_location'] == 'Yurtdışı TR hub':
-            return 0
-        
-         # Remote → 0 (ikamet kesin tahmin edilemez)
-        if row['work_mode'] == 'Remote':
-            return 0
-        
-        # Eğer Office veya Hybrid ise → yüksek ihtimal şirket lokasyonunda yaşıyor
-        if row['work_mode'] in ['Office', 'Hybrid']:
-            return 1
-        
-        # Default → belirsiz
-        return 0
-
-    df['is_likely_in_company_location'] = df.apply(infer_location_flag, axis=1)
-    print("   Tahmin sütunu oluşturuldu. Dağılım:")
-    print(df['is_likely_in_company_location'].value_counts())
+    log("6. Çalışan lokasyon tahmini yapılıyor...")
+
+    df['is_likely_in_company_location'] = infer_location_flags(df)
+    log("   Tahmin sütunu oluşturuldu. Dağılım:")
+    log(df['is_likely_in_company_location'].value_counts())
     
     # 7. Kategorik Kodlama
-    print("7. Kategorik kodlama yapılıyor...")
+    log("7. Kategorik kodlama yapılıyor...")
     
+    # Tek seçimli alanların anket etiketli kod sütunları (one-hot sütunlarından önce alınır)
+    codes = {code: code_categorical(df[code], field_labels(vocabulary, code) if vocabulary else None)
+             for code in CODE_COLUMNS}
+
     # One-Hot Encoding (kategorik sütunlar için)
-    categorical_columns = ['company_location', 'employment_type', 'work_mode', 'role']
-    df = pd.get_dummies(df, columns=categorical_columns, dtype=int)
+    df = pd.get_dummies(_with_categories(df, CATEGORICAL_COLUMNS), columns=CATEGORICAL_COLUMNS, dtype=int)
     
     # Gender encoding (binary)
     df['gender'] = df['gender'].map({'Erkek': 0, 'Kadın': 1})
     
     # Experience years encoding (ordinal)
-    experience_map = {
-        '0': 0, '1': 1, '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9,
-        '10': 10, '11 - 15': 13, '16 - 20': 18, '20 - 30': 25, '30+': 30
-    }
-    df['experience_years'] = df['experience_years'].map(experience_map)
+    df['experience_years'] = df['experience_years'].astype(str).map(EXPERIENCE_MAP)
     
     # Level encoding (seniority ve management)
-    # Teknik seviyeler için ordinal kodlama
-    ic_map = {
-        'Junior': 1, 'Mid': 2, 'Senior': 3, 'Staff Engineer': 4, 'Team Lead': 5, 'Architect': 6
-    }
-    df['seniority_level_ic'] = df['level'].map(ic_map).fillna(0)  # Yönetim rolleri için 0
+    df['seniority_level_ic'] = df['level'].map(IC_LEVEL_MAP).fillna(0)  # Yönetim rolleri için 0
     
     # Yönetici bayrağı
-    management_roles = ['Engineering Manager', 'Director Level Manager', 'C-Level Manager', 'Partner']
-    df['is_manager'] = df['level'].isin(management_roles).astype(int)
+    df['is_manager'] = df['level'].isin(MANAGEMENT_ROLES).astype(int)
     
     # Level için One-Hot Encoding (tüm seviyeler için)
-    df = pd.get_dummies(df, columns=['level'], prefix='management', dtype=int)
+    df = pd.get_dummies(_with_categories(df, ['level']), columns=['level'], prefix='management', dtype=int)
     
     # 8. Çoklu Seçim Sütunlarını İşleme
-    print("8. Çoklu seçim sütunları işleniyor...")
-    multi_label_columns = ['programming_languages', 'frontend_technologies', 'tools']
-    df = process_multi_label_columns(df, multi_label_columns)
+    log("8. Çoklu seçim sütunları işleniyor...")
+    df = process_multi_label_columns(df, MULTI_LABEL_COLUMNS, sparse_output=sparse_multi_hot,
+                                     vocabulary=vocabulary)
     
     # 9. Sütun İsimlerini Temizleme
-    print("9. Sütun isimleri temizleniyor...")
+    log("9. Sütun isimleri temizleniyor...")
     df = clean_column_names(df)
     
     # 10. Tekrarlanan Sütunları Kaldırma
-    print("10. Tekrarlanan sütunlar kaldırılıyor...")
+    log("10. Tekrarlanan sütunlar kaldırılıyor...")
     # Tekrarlanan sütunları bul ve kaldır
     duplicate_columns = df.columns[df.columns.duplicated()].tolist()
     if duplicate_columns:
-        print(f"   Tekrarlanan sütunlar bulundu: {duplicate_columns}")
+        log(f"   Tekrarlanan sütunlar bulundu: {duplicate_columns}")
         df = df.loc[:, ~df.columns.duplicated()]
-        print(f"   Tekrarlanan sütunlar kaldırıldı")
-    
-    # 11. Aykırı Değer İşleme
-    print("11. Aykırı değerler işleniyor...")
-    Q1 = df['salary_numeric'].quantile(0.25)
-    Q3 = df['salary_numeric'].quantile(0.75)
+        log(f"   Tekrarlanan sütunlar kaldırıldı")
+
+    # One-hot blokların yanında kompakt kategorik kod sütunları (role, level, work_mode, ...)
+    for code, values in codes.items():
+        df[code] = values
+    return df
+
+def compute_outlier_bounds(salary):
+    """
+    IQR ve Z-Score yöntemlerini birleştirerek maaş kırpma sınırlarını hesapla.
+    Dönüş: (alt sınır, üst sınır)
+    """
+    Q1 = salary.quantile(0.25)
+    Q3 = salary.quantile(0.75)
     IQR = Q3 - Q1
     lower_bound = Q1 - 1.5 * IQR
-    upper_bound = min(Q3 + 1.5 * IQR, 350)  # Üst sınır 350
+    upper_bound = min(Q3 + 1.5 * IQR, SALARY_CAP)  # Üst sınır 350
     
     # Z-Score yöntemi
-    z_scores = np.abs((df['salary_numeric'] - df['salary_numeric'].mean()) / df['salary_numeric'].std())
-    upper_bound_z = df['salary_numeric'][z_scores <= 3].max()
-    lower_bound_z = df['salary_numeric'][z_scores <= 3].min()
+    z_scores = np.abs((salary - salary.mean()) / salary.std())
+    upper_bound_z = salary[z_scores <= 3].max()
+    lower_bound_z = salary[z_scores <= 3].min()
     
     # IQR ve Z-Score sınırlarını birleştir
     final_lower = max(lower_bound, lower_bound_z)
-    final_upper = min(upper_bound, upper_bound_z, 350)
+    final_upper = min(upper_bound, upper_bound_z, SALARY_CAP)
+    return float(final_lower), float(final_upper)
+
+def clean_survey(df, vocabulary=None, sparse_multi_hot=False, verbose=True, column_mapping=COLUMN_MAPPING):
+    """
+    Ham anket satırlarını temizlenmiş veri setine dönüştür (adım 3-12):
+    dönüşümler, aykırı değer kırpma ve kodlanan ham sütunların kaldırılması.
+    Dönüş: (temizlenmiş DataFrame, (alt sınır, üst sınır))
+    """
+    log = print if verbose else (lambda *args, **kwargs: None)
+
+    # 3-10. Dönüşümler
+    df = transform_survey(df, sparse_multi_hot=sparse_multi_hot, verbose=verbose,
+                          vocabulary=vocabulary, column_mapping=column_mapping)
     
+    # 11. Aykırı Değer İşleme
+    log("11. Aykırı değerler işleniyor...")
+    final_lower, final_upper = compute_outlier_bounds(df['salary_numeric'])
     df['salary_numeric'] = df['salary_numeric'].clip(lower=final_lower, upper=final_upper)
     
-    print(f"   Aykırı değer sınırları: {final_lower:.1f} - {final_upper:.1f}")
+    log(f"   Aykırı değer sınırları: {final_lower:.1f} - {final_upper:.1f}")
     
     # 12. Orijinal Sütunları Kaldırma
-    print("12. Orijinal sütunlar kaldırılıyor...")
-    columns_to_drop = ['salary_range', 'programming_languages', 'frontend_technologies', 'tools']
-    for col in columns_to_drop:
-        if col in df.columns:
-            df = df.drop(columns=[col])
+    log("12. Orijinal sütunlar kaldırılıyor...")
+    return drop_original_columns(df), (final_lower, final_upper)
+
+def outlier_bounds_from_sketch(sketch, moments):
+    """
+    compute_outlier_bounds'un akış karşılığı: IQR için quantile'lar QuantileSketch'ten,
+    Z-Score için ortalama/standart sapma RunningMoments'tan alınır. Z-Score sınırları
+    özette tutulan gerçek maaş değerlerinden seçilir; özet sıkıştırılmadıysa
+    sonuç compute_outlier_bounds ile aynıdır.
+    Dönüş: (alt sınır, üst sınır)
+    """
+    Q1 = sketch.quantile(0.25)
+    Q3 = sketch.quantile(0.75)
+    IQR = Q3 - Q1
+    lower_bound = Q1 - 1.5 * IQR
+    upper_bound = min(Q3 + 1.5 * IQR, SALARY_CAP)
+
+    # Z-Score yöntemi: |z| <= 3 koşulunu sağlayan en büyük/en küçük değer
+    mean, std = moments.mean, moments.std()
+    upper_bound_z = moments.max if moments.max <= mean + 3 * std else sketch.max_at_most(mean + 3 * std)
+    lower_bound_z = moments.min if moments.min >= mean - 3 * std else sketch.min_at_least(mean - 3 * std)
+
+    final_lower = max(lower_bound, lower_bound_z)
+    final_upper = min(upper_bound, upper_bound_z, SALARY_CAP)
+    return float(final_lower), float(final_upper)
+
+def drop_original_columns(df):
+    """
+    Kodlanmış hallerine dönüştürülen ham sütunları kaldır.
+    """
+    return df.drop(columns=[c for c in ORIGINAL_COLUMNS if c in df.columns])
+
+def load_state(path=STATE_PATH):
+    """
+    Artımlı işleme durumunu oku; dosya yoksa None.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def save_state(state, path=STATE_PATH):
+    """
+    Artımlı işleme durumunu kaydet.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+
+def _build_state(raw_path, df, bounds, byte_offset):
+    """
+    İşlenen son konum, sütun listesi ve kırpma sınırlarından durum sözlüğü oluştur.
+    """
+    return {
+        'raw_path': raw_path,
+        'header': pd.read_csv(raw_path, nrows=0).columns.tolist(),
+        'byte_offset': byte_offset,
+        'row_count': int(len(df)),
+        'last_timestamp': str(df['timestamp'].max()) if len(df) else None,
+        'columns': df.columns.tolist(),
+        'outlier_bounds': list(bounds),
+    }
+
+def read_new_rows(raw_path, byte_offset, header):
+    """
+    Ham CSV'de byte_offset'ten sonra eklenen satırları oku.
+    Dönüş: (yeni satırlar DataFrame'i, yeni byte offset). Yalnızca dosyanın yeni
+    kısmı okunur; maliyet yeni satır sayısıyla orantılıdır.
+    """
+    with open(raw_path, 'rb') as f:
+        f.seek(byte_offset)
+        chunk = f.read()
+    if not chunk.strip():
+        return pd.DataFrame(columns=header), byte_offset
+    new_rows = pd.read_csv(io.BytesIO(chunk), header=None, names=header)
+    return new_rows, byte_offset + len(chunk)
+
+def main_incremental(raw_path=RAW_DATA_PATH, state_path=STATE_PATH, vocabulary_path=VOCABULARY_PATH):
+    """
+    Artımlı mod: yalnızca son çalıştırmadan sonra ham CSV'ye eklenen satırları işle.
+    Yeni satırlar kayıtlı kelime dağarcığıyla kodlanır, son tam çalıştırmanın aykırı
+    değer sınırlarıyla kırpılır ve işlenmiş veriye eklenir. Yeni bir etiket görülürse
+    dağarcık genişletilir ve eski satırlara yeni sütunlar 0 olarak eklenir.
+    Durum yoksa veya ham dosya değiştirilmişse tam çalıştırmaya düşer.
+    """
+    print("Sprint 1: Artımlı ön işleme başlıyor...")
+    state = load_state(state_path)
+    previous = load_vocabulary(vocabulary_path)
+    if state is None or previous is None:
+        print("   Durum dosyası bulunamadı, tam işleme yapılıyor.")
+        return main(raw_path=raw_path, state_path=state_path, vocabulary_path=vocabulary_path)
+
+    header = pd.read_csv(raw_path, nrows=0).columns.tolist()
+    if header != state['header'] or os.path.getsize(raw_path) < state['byte_offset']:
+        print("   Ham veri dosyası değişmiş, tam işleme yapılıyor.")
+        return main(raw_path=raw_path, state_path=state_path, vocabulary_path=vocabulary_path)
+
+    new_rows, byte_offset = read_new_rows(raw_path, state['byte_offset'], header)
+    print(f"   Yeni satır sayısı: {len(new_rows)}")
+    if new_rows.empty:
+        print("\n✅ İşlenecek yeni satır yok.")
+        return None
+    assert new_rows.isna().sum().sum() == 0, "Eksik veri tespit edildi!"
+
+    vocabulary = fit_vocabulary(collect_vocabulary_labels(new_rows.rename(columns=COLUMN_MAPPING)), previous)
+    df = transform_survey(new_rows, verbose=False, vocabulary=vocabulary)
+    lower, upper = state['outlier_bounds']
+    df['salary_numeric'] = df['salary_numeric'].clip(lower=lower, upper=upper)
+    df = drop_original_columns(df)
+
+    new_columns = [c for c in df.columns if c not in state['columns']]
+    if new_columns:
+        # Kelime dağarcığı genişledi: eski satırlara yeni sütunlar 0 olarak eklenir
+        print(f"   Kelime dağarcığı güncellendi: v{previous['version']} → v{vocabulary['version']}")
+        print(f"   Yeni sütunlar: {new_columns}")
+        existing = load_cleaned_data()
+        for col in new_columns:
+            if col not in existing.columns:
+                existing[col] = 0
+        combined = save_cleaned_data(pd.concat([existing, df], ignore_index=True)[df.columns])
+    else:
+        combined = append_cleaned_data(df[state['columns']])
+    save_vocabulary(vocabulary, vocabulary_path)
+
+    state.update({
+        'byte_offset': byte_offset,
+        'row_count': state['row_count'] + len(df),
+        'last_timestamp': str(max(pd.Timestamp(state['last_timestamp']), df['timestamp'].max())) if state['last_timestamp'] else str(df['timestamp'].max()),
+        'columns': combined.columns.tolist(),
+    })
+    save_state(state, state_path)
+    print(f"   Toplam kayıt sayısı: {state['row_count']}")
+    print("\n✅ Artımlı ön işleme tamamlandı!")
+    return df
+
+def fit_stream_vocabulary(raw_path=RAW_DATA_PATH, chunksize=STREAM_CHUNK_SIZE, sketch_k=SALARY_SKETCH_K,
+                          previous=None):
+    """
+    Akış modunun 1. geçişi: ham CSV'yi parça parça okuyup kategorik ve çoklu seçim
+    alanlarının etiketlerini toplar; maaşları bir quantile özetine (QuantileSketch)
+    ve ortalama/varyans özetine (RunningMoments) besler. Bellekte yalnızca farklı
+    etiketler ve sabit boyutlu özetler tutulur. Etiketler kayıtlı kelime dağarcığına
+    (previous) eklenir; her parça aynı sütunlarla kodlanır.
+    Dönüş: (kelime dağarcığı, maaş quantile özeti, maaş moment özeti, satır sayısı)
+    """
+    labels = None
+    salary_sketch = QuantileSketch(k=sketch_k)
+    salary_moments = RunningMoments()
+    n_rows = 0
+    for chunk in pd.read_csv(raw_path, chunksize=chunksize):
+        chunk = chunk.rename(columns=COLUMN_MAPPING)
+        labels = collect_vocabulary_labels(chunk, labels)
+        salary = parse_salary_bands(chunk['salary_range'])['salary_numeric'].to_numpy()
+        salary_sketch.update(salary)
+        salary_moments.update(salary)
+        n_rows += len(chunk)
+
+    vocabulary = fit_vocabulary(labels or {}, previous)
+    return vocabulary, salary_sketch, salary_moments, n_rows
+
+def main_streaming(raw_path=RAW_DATA_PATH, state_path=STATE_PATH, chunksize=STREAM_CHUNK_SIZE,
+                   sketch_k=SALARY_SKETCH_K, vocabulary_path=VOCABULARY_PATH):
+    """
+    Akış modu: ham CSV'yi parça parça işleyip çıktıyı parça parça yaz.
+    1. geçiş kelime dağarcığını (sütun listesi) ve aykırı değer sınırlarını belirler,
+    2. geçiş her parçayı aynı adımlarla dönüştürüp kırpar ve diske ekler. Bellek
+    kullanımı dosya boyutundan bağımsız olarak parça boyutuyla sınırlıdır.
+    sketch_k, maaş quantile özetinin doğruluk/bellek dengesini belirler.
+    """
+    print(f"Sprint 1: Akış modunda ön işleme başlıyor (parça boyutu: {chunksize})...")
+
+    print("1. Kelime dağarcığı ve maaş dağılımı çıkarılıyor (1. geçiş)...")
+    byte_offset = os.path.getsize(raw_path)
+    vocabulary, salary_sketch, salary_moments, n_rows = fit_stream_vocabulary(
+        raw_path, chunksize, sketch_k, previous=load_vocabulary(vocabulary_path))
+    sample = pd.read_csv(raw_path, nrows=1)
+    columns = drop_original_columns(transform_survey(sample, verbose=False, vocabulary=vocabulary)).columns.tolist()
+    final_lower, final_upper = outlier_bounds_from_sketch(salary_sketch, salary_moments)
+    print(f"   Satır sayısı: {n_rows}, sütun sayısı: {len(columns)}")
+    print(f"   Maaş özeti: {salary_sketch.retained} değer tutuluyor (k={sketch_k}), "
+          f"sıra hatası ≤ {salary_sketch.rank_error():.2%} (%99 güven), en kötü durum ≤ {salary_sketch.max_rank_error():.2%}")
+    for label, q in [('Q1', 0.25), ('Q3', 0.75)]:
+        low, high = salary_sketch.quantile_interval(q)
+        print(f"   {label} ≈ {salary_sketch.quantile(q):.1f} (aralık: {low:.1f} - {high:.1f})")
+    print(f"   Aykırı değer sınırları: {final_lower:.1f} - {final_upper:.1f}")
+
+    print("2. Parçalar dönüştürülüp kaydediliyor (2. geçiş)...")
+    totals = {'rows': 0, 'salary_sum': 0.0, 'male': 0, 'manager': 0, 'last_timestamp': None}
+
+    def _encoded_chunks():
+        for chunk in pd.read_csv(raw_path, chunksize=chunksize):
+            assert chunk.isna().sum().sum() == 0, "Eksik veri tespit edildi!"
+            df = transform_survey(chunk, verbose=False, vocabulary=vocabulary)
+            df['salary_numeric'] = df['salary_numeric'].clip(lower=final_lower, upper=final_upper)
+            df = drop_original_columns(df).reindex(columns=columns, fill_value=0)
+
+            totals['rows'] += len(df)
+            totals['salary_sum'] += float(df['salary_numeric'].sum())
+            totals['male'] += int((df['gender'] == 0).sum())
+            totals['manager'] += int(df['is_manager'].sum())
+            chunk_last = df['timestamp'].max()
+            if totals['last_timestamp'] is None or chunk_last > totals['last_timestamp']:
+                totals['last_timestamp'] = chunk_last
+            yield df
+
+    save_cleaned_data_stream(_encoded_chunks(), 'data/2025_cleaned_data.csv')
+    save_vocabulary(vocabulary, vocabulary_path)
+    save_state({
+        'raw_path': raw_path,
+        'header': sample.columns.tolist(),
+        'byte_offset': byte_offset,
+        'row_count': totals['rows'],
+        'last_timestamp': str(totals['last_timestamp']),
+        'columns': columns,
+        'outlier_bounds': [final_lower, final_upper],
+    }, state_path)
+    print("   ✅ 2025_cleaned_data.csv başarıyla oluşturuldu!")
+
+    print("\n3. Özet İstatistikler:")
+    print(f"   Toplam kayıt sayısı: {totals['rows']}")
+    print(f"   Toplam sütun sayısı: {len(columns)}")
+    if totals['rows']:
+        print(f"   Maaş ortalaması: {totals['salary_sum'] / totals['rows']:.1f} bin TL")
+        print(f"   Erkek oranı: {totals['male'] / totals['rows']:.1%}")
+        print(f"   Yönetici oranı: {totals['manager'] / totals['rows']:.1%}")
+    print("\n✅ Sprint 1 (akış modu) başarıyla tamamlandı!")
+    return totals['rows']
+
+def vocabulary_path_for(year):
+    """
+    Anket yılının kelime dağarcığı dosyası (2025 için VOCABULARY_PATH).
+    """
+    return f'data/{year}_cleaned_data.vocabulary.json'
+
+def process_survey_year(year, store_path=PROCESSED_STORE_PATH):
+    """
+    Tek bir anket yılını yılın şemasıyla işle ve yıl bölümlü veri setine yaz.
+    Süreç havuzunda çalıştırılır; her yıl kendi bölümünü ve kelime dağarcığını yazar.
+    Dönüş: (yıl, satır sayısı, sütun sayısı, aykırı değer sınırları)
+    """
+    schema = SURVEY_SCHEMAS[year]
+    df = pd.read_csv(schema['raw_path'])
+    renamed = df.rename(columns=schema['column_mapping'])
+    missing = renamed.drop(columns=schema['allow_missing']).isna().sum()
+    assert missing.sum() == 0, f"{year}: eksik veri tespit edildi: {missing[missing > 0].to_dict()}"
+
+    vocabulary_path = vocabulary_path_for(year)
+    vocabulary = fit_vocabulary(collect_vocabulary_labels(renamed), load_vocabulary(vocabulary_path))
+    df, bounds = clean_survey(df, vocabulary, verbose=False, column_mapping=schema['column_mapping'])
+    df = save_survey_partition(df, year, store_path)
+    save_vocabulary(vocabulary, vocabulary_path)
+    return year, len(df), df.shape[1], bounds
+
+def main_multi_year(years=None, store_path=PROCESSED_STORE_PATH, max_workers=None):
+    """
+    Birden fazla anket yılını süreç havuzunda paralel işle. Her yıl yıl bölümlü
+    ortak veri setine (data/processed/survey_year=YYYY/) yazılır.
+    """
+    years = sorted(years or SURVEY_SCHEMAS)
+    max_workers = max_workers or min(len(years), os.cpu_count() or 1)
+    print(f"Sprint 1: {len(years)} anket yılı {max_workers} süreçte işleniyor: {years}")
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(process_survey_year, year, store_path) for year in years]
+        results = [future.result() for future in futures]
+    for year, n_rows, n_columns, (lower, upper) in results:
+        print(f"   {year}: {n_rows} kayıt, {n_columns} sütun, aykırı değer sınırları {lower:.1f} - {upper:.1f}")
+    print(f"\n✅ Yıl bölümlü veri seti yazıldı: {store_path}")
+    return results
+
+def main(sparse_multi_hot=False, raw_path=RAW_DATA_PATH, state_path=STATE_PATH, vocabulary_path=VOCABULARY_PATH):
+    """
+    Ana veri işleme fonksiyonu.
+    sparse_multi_hot=True ise teknoloji bayrakları bellekte seyrek (SparseDtype uint8) tutulur.
+    Kodlama kayıtlı kelime dağarcığıyla yapılır; yeni etiketler dağarcığın sonuna eklenir.
+    """
+    print("Sprint 1: Veri Hazırlama ve Ön İşleme Başlıyor...")
+    
+    # 1. Veri Yükleme
+    print("1. Veri yükleniyor...")
+    df = pd.read_csv(raw_path)
+    byte_offset = os.path.getsize(raw_path)
+    print(f"   Yüklenen veri boyutu: {df.shape}")
+    
+    # 2. Eksik Veri Kontrolü
+    print("2. Eksik veri kontrolü yapılıyor...")
+    missing_data = df.isna().sum()
+    print(f"   Eksik veri sayısı: {missing_data.sum()}")
+    assert missing_data.sum() == 0, "Eksik veri tespit edildi!"
+    
+    # Kelime dağarcığı: kayıtlı sıra korunur, yeni etiketler sona eklenir
+    previous = load_vocabulary(vocabulary_path)
+    vocabulary = fit_vocabulary(collect_vocabulary_labels(df.rename(columns=COLUMN_MAPPING)), previous)
+    if previous is not None and vocabulary['version'] != previous['version']:
+        print(f"   Kelime dağarcığı güncellendi: v{previous['version']} → v{vocabulary['version']}")
+
+    # 3-12. Dönüşümler, aykırı değer işleme ve orijinal sütunların kaldırılması
+    df, (final_lower, final_upper) = clean_survey(df, vocabulary, sparse_multi_hot=sparse_multi_hot)
     
     # 13. Kalite Kontrol
     print("13. Kalite kontrol yapılıyor...")
@@ -289,7 +821,9 @@ def main():
     
     # 14. Temizlenmiş Veri Setini Kaydetme
     print("14. Temizlenmiş veri seti kaydediliyor...")
-    df.to_csv('data/2025_cleaned_data.csv', index=False)
+    df = save_cleaned_data(df, 'data/2025_cleaned_data.csv')
+    save_vocabulary(vocabulary, vocabulary_path)
+    save_state(_build_state(raw_path, df, (final_lower, final_upper), byte_offset), state_path)
     print("   ✅ 2025_cleaned_data.csv başarıyla oluşturuldu!")
     
     # 15. Özet İstatistikler
@@ -310,4 +844,19 @@ def main():
     return df
 
 if __name__ == "__main__":
-    df_cleaned = main()
+    parser = argparse.ArgumentParser(description="2025 maaş anketi ön işleme")
+    parser.add_argument('--incremental', action='store_true', help="Yalnızca ham CSV'ye yeni eklenen satırları işle")
+    parser.add_argument('--chunksize', type=int, default=None, help="Ham CSV'yi bu boyutta parçalar halinde akış modunda işle")
+    parser.add_argument('--sketch-k', type=int, default=SALARY_SKETCH_K,
+                        help="Akış modunda maaş quantile özetinin k parametresi (doğruluk/bellek dengesi)")
+    parser.add_argument('--years', type=int, nargs='+', default=None,
+                        help="Verilen anket yıllarını paralel işleyip yıl bölümlü veri setine yaz (örn. --years 2024 2025)")
+    args = parser.parse_args()
+    if args.years:
+        main_multi_year(args.years)
+    elif args.incremental:
+        df_cleaned = main_incremental()
+    elif args.chunksize:
+        main_streaming(chunksize=args.chunksize, sketch_k=args.sketch_k)
+    else:
+        df_cleaned = main()
@@ -0,0 +1,451 @@
+"""
+Temizlenmiş veri seti için tip şeması ve okuma/yazma yardımcıları.
+Ön işleme (yazma) ve analiz/dashboard/rapor (okuma) tarafı aynı şemayı kullanır;
+böylece bayraklar 64-bit tamsayı yerine uint8 olarak bellekte tutulur.
+Veri seti CSV'nin yanında tipli bir Parquet veri seti (part-*.parquet dosyalarından
+oluşan bir dizin) olarak da yazılır; okuyucular Parquet üzerinden yalnızca ihtiyaç
+duydukları sütunları ve satır gruplarını okur. Artımlı çalıştırmalar yeni satırları
+yeni bir part dosyası olarak ekler.
+Dashboard için ayrıca sıkıştırılmamış bir Arrow IPC dosyası yazılır; bu dosya
+bellek eşlemeli (mmap) okunur ve süreçler arasında tek bir page-cache kopyası paylaşılır.
+"""
+
+import os
+import glob
+import shutil
+import numpy as np
+import pandas as pd
+
+from vocabulary import cached_vocabulary, column_index, flag_columns
+
+CLEANED_DATA_PATH = 'data/2025_cleaned_data.csv'
+CLEANED_PARQUET_PATH = 'data/2025_cleaned_data.parquet'
+CLEANED_ARROW_PATH = 'data/2025_cleaned_data.arrow'
+# Çok yıllı, survey_year=YYYY dizinlerine bölümlenmiş Parquet veri seti
+PROCESSED_STORE_PATH = 'data/processed'
+PARTITION_COLUMN = 'survey_year'
+# Predicate pushdown için satır grubu boyutu (her grup için min/max istatistiği yazılır)
+PARQUET_ROW_GROUP_SIZE = 100_000
+
+# One-hot / multi-hot bayrak sütunlarının önekleri
+FLAG_PREFIXES = (
+    'company_location_', 'employment_type_', 'work_mode_', 'role_', 'management_',
+    'programming_', 'frontend_', 'tools_',
+)
+FLAG_DTYPE = 'uint8'
+
+# One-hot bloklarının yanında tutulan kategorik kod sütunları: kod sütunu (ham anket
+# alanının adı) → blok öneki. Değerler anket etiketleridir (örn. 'Danışmanlık', one-hot
+# sütunu role_Danismanlik); kategoriler sıralıdır. Yanıtı olmayan satırlar NaN kalır.
+CODE_COLUMNS = {
+    'role': 'role_',
+    'level': 'management_',
+    'work_mode': 'work_mode_',
+    'company_location': 'company_location_',
+    'employment_type': 'employment_type_',
+}
+
+# Adı bilinen sütunlar için sabit tipler
+COLUMN_DTYPES = {
+    'gender': 'int8',
+    'experience_years': 'int8',
+    'seniority_level_ic': 'int8',
+    'salary_numeric': 'float32',
+    'salary_low': 'float32',
+    'salary_high': 'float32',
+    'is_likely_in_company_location': FLAG_DTYPE,
+    'is_manager': FLAG_DTYPE,
+}
+
+DATETIME_COLUMNS = ['timestamp']
+
+# Eksik değer içeren tamsayı sütunları için pandas nullable karşılıkları (örn. 2024'te boş cinsiyet)
+NULLABLE_DTYPES = {'int8': 'Int8', 'uint8': 'UInt8'}
+
+def column_dtype(column):
+    """
+    Şemadaki sütun tipini döndür; şemada olmayan sütunlar için None.
+    """
+    if column in COLUMN_DTYPES:
+        return COLUMN_DTYPES[column]
+    if column.startswith(FLAG_PREFIXES):
+        return FLAG_DTYPE
+    return None
+
+def schema_dtypes(columns):
+    """
+    Verilen sütunlar için {sütun: tip} sözlüğü (read_csv dtype parametresi için).
+    """
+    dtypes = {}
+    for col in columns:
+        dtype = column_dtype(col)
+        if dtype is not None:
+            dtypes[col] = dtype
+    return dtypes
+
+def apply_schema(df):
+    """
+    DataFrame'i şemaya göre kompakt tiplere dönüştür:
+    - bayraklar uint8, sıralı kodlar int8, maaş float32
+    - timestamp datetime, kalan metin sütunları category
+    Seyrek (SparseDtype) bayrak sütunları yoğunlaştırılmadan seyrek uint8'e çevrilir.
+    Eksik değer içeren tamsayı sütunları nullable tipe (Int8/UInt8) çevrilir.
+    Zaten doğru tipte olan sütunlara dokunulmaz.
+    """
+    dtypes = {}
+    for col in df.columns:
+        current = df[col].dtype
+        dtype = column_dtype(col)
+        if dtype is not None:
+            if isinstance(current, pd.SparseDtype):
+                target = pd.SparseDtype(np.dtype(dtype), 0)
+            elif dtype in NULLABLE_DTYPES and df[col].isna().any():
+                target = pd.api.types.pandas_dtype(NULLABLE_DTYPES[dtype])
+            else:
+                target = np.dtype(dtype)
+        elif current == object and col not in DATETIME_COLUMNS:
+            target = 'category'
+        else:
+            continue
+        if current != target:
+            dtypes[col] = target
+    if dtypes:
+        df = df.astype(dtypes)
+
+    for col in DATETIME_COLUMNS:
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df = df.assign(**{col: pd.to_datetime(df[col])})
+    return df
+
+def decode_one_hot(df, prefix, vocabulary=None):
+    """
+    prefix ile başlayan one-hot bloğunu tek bir category sütununa indir (satır
+    döngüsü olmadan). Kategoriler sütun son ekleridir ve sıralıdır; böylece CSV'den
+    okunup yeniden category'ye çevrilen sütunla aynı sırayı taşır. İşaretli sütunu
+    olmayan satırlar NaN olur. Blok sütunları kelime dağarcığından okunur (bkz.
+    vocabulary.flag_columns).
+    """
+    columns = flag_columns(df.columns, prefix, vocabulary)
+    if not columns:
+        raise KeyError(f"'{prefix}' önekli one-hot blok bulunamadı")
+    labels = [c[len(prefix):] for c in columns]
+    categories = sorted(labels)
+    lookup = np.array([categories.index(label) for label in labels])
+    hot = df[columns].fillna(0).to_numpy() == 1
+    codes = np.where(hot.any(axis=1), lookup[hot.argmax(axis=1)], -1)
+    return pd.Series(pd.Categorical.from_codes(codes, categories), index=df.index)
+
+def code_categorical(values, labels=None):
+    """
+    Ham anket değerlerinden kod sütunu (one-hot kodlamadan önce). Kategoriler
+    labels'ın (yoksa görülen değerlerin) sıralı hâlidir; böylece her parça aynı
+    kategorileri taşır ve CSV'den okunup category'ye çevrilen sütunla aynı sırayı
+    korur. labels dışındaki değerler NaN olur.
+    """
+    if labels is None:
+        labels = pd.unique(values.dropna())
+    return pd.Categorical(values, categories=sorted(labels))
+
+def _decode_code(df, code, vocabulary=None):
+    """
+    Eski dosyalar için kod sütununu one-hot bloğundan türet: sütun son ekleri
+    kelime dağarcığındaki anket etiketlerine çevrilir (column_index); dağarcıkta
+    olmayan sütunlar son ekleriyle kalır.
+    """
+    prefix = CODE_COLUMNS[code]
+    values = decode_one_hot(df, prefix, vocabulary)
+    if vocabulary is None:
+        vocabulary = cached_vocabulary()
+    index = column_index(vocabulary) if vocabulary else {}
+    labels = [index[prefix + s][1] if prefix + s in index else s for s in values.cat.categories]
+    values = values.cat.rename_categories(labels)
+    return values.cat.reorder_categories(sorted(labels))
+
+def code_column(df, code, vocabulary=None):
+    """
+    Kod sütununu döndür; dosyada yoksa (eski dosyalar) one-hot bloğundan türet.
+    """
+    if code in df.columns:
+        return df[code]
+    return _decode_code(df, code, vocabulary)
+
+def add_code_columns(df, codes=None, vocabulary=None):
+    """
+    Kod sütunları olmadan yazılmış eski dosyalarda eksik kod sütunlarını one-hot
+    bloklarından türetip DataFrame'e yerinde ekle. codes verilmezse CODE_COLUMNS'taki
+    tüm kodlar denenir; bloğu olmayanlar atlanır.
+    """
+    for code in (CODE_COLUMNS if codes is None else codes):
+        if code not in df.columns and flag_columns(df.columns, CODE_COLUMNS[code], vocabulary):
+            df[code] = _decode_code(df, code, vocabulary)
+    return df
+
+def _densify(df):
+    """
+    Seyrek (SparseDtype) sütunları aynı alt tipte yoğun sütunlara çevir (Parquet için).
+    """
+    sparse_cols = {c: df[c].dtype.subtype for c in df.columns if isinstance(df[c].dtype, pd.SparseDtype)}
+    return df.astype(sparse_cols) if sparse_cols else df
+
+def _parquet_parts(parquet_path):
+    """
+    Parquet veri seti dizinindeki part dosyalarını sıralı döndür.
+    """
+    return sorted(glob.glob(os.path.join(parquet_path, 'part-*.parquet')))
+
+def _write_parquet_part(df, parquet_path):
+    """
+    DataFrame'i veri seti dizinine bir sonraki part dosyası olarak yaz.
+    """
+    os.makedirs(parquet_path, exist_ok=True)
+    part_path = os.path.join(parquet_path, f'part-{len(_parquet_parts(parquet_path)):05d}.parquet')
+    _densify(df).to_parquet(part_path, index=False, engine='pyarrow', row_group_size=PARQUET_ROW_GROUP_SIZE)
+
+def _write_arrow(df, arrow_path):
+    """
+    mmap ile okunacak sıkıştırılmamış Arrow IPC dosyasını yaz.
+    """
+    from pyarrow import feather
+    # Sıkıştırma mmap ile sıfır kopya okumayı engeller
+    feather.write_feather(_densify(df).reset_index(drop=True), arrow_path, compression='uncompressed')
+
+def save_arrow(df, arrow_path):
+    """
+    DataFrame'i şemayı uygulayarak yalnızca Arrow IPC dosyası olarak yaz; örn. bir veri
+    çerçevesini load_cleaned_data_mmap ile okuyan işçi süreçlerle paylaşmak için.
+    """
+    _write_arrow(apply_schema(df), arrow_path)
+
+def save_cleaned_data(df, path=CLEANED_DATA_PATH, parquet_path=CLEANED_PARQUET_PATH, arrow_path=CLEANED_ARROW_PATH):
+    """
+    Temizlenmiş veri setini şemayı uygulayarak kaydet (mevcut içeriğin üzerine yazar).
+    CSV (geriye dönük uyumluluk, notebook'lar), tipli Parquet veri seti ve mmap için
+    sıkıştırılmamış Arrow IPC birlikte yazılır; None verilen biçim atlanır.
+    """
+    df = apply_schema(df)
+    df.to_csv(path, index=False)
+    if parquet_path is not None:
+        if os.path.isfile(parquet_path):
+            os.remove(parquet_path)
+        elif os.path.isdir(parquet_path):
+            shutil.rmtree(parquet_path)
+        _write_parquet_part(df, parquet_path)
+    if arrow_path is not None:
+        _write_arrow(df, arrow_path)
+    return df
+
+def append_cleaned_data(df, path=CLEANED_DATA_PATH, parquet_path=CLEANED_PARQUET_PATH, arrow_path=CLEANED_ARROW_PATH):
+    """
+    Yeni satırları mevcut temizlenmiş veri setine ekle. Sütunlar mevcut veriyle aynı
+    sırada olmalıdır. CSV sonuna eklenir, Parquet veri setine yeni bir part dosyası
+    yazılır; yalnızca mmap kopyası tipli veriden yeniden oluşturulur (yeniden kodlama yok).
+    """
+    df = apply_schema(df)
+    df.to_csv(path, mode='a', header=False, index=False)
+    if parquet_path is not None:
+        _write_parquet_part(df, parquet_path)
+    if arrow_path is not None:
+        _write_arrow(load_cleaned_data(path, parquet_path=parquet_path), arrow_path)
+    return df
+
+def save_cleaned_data_stream(chunks, path=CLEANED_DATA_PATH, parquet_path=CLEANED_PARQUET_PATH, arrow_path=CLEANED_ARROW_PATH):
+    """
+    Parça parça üretilen temizlenmiş veriyi belleğe toplamadan yaz.
+    Her parça şemaya göre tiplenir; CSV'ye eklenir, tek bir Parquet dosyasına yeni
+    satır grubu(ları) ve Arrow IPC dosyasına yeni kayıt grubu olarak yazılır. Tüm
+    parçaların sütunları aynı sırada olmalıdır. Dönüş: yazılan satır sayısı.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if parquet_path is not None:
+        if os.path.isfile(parquet_path):
+            os.remove(parquet_path)
+        elif os.path.isdir(parquet_path):
+            shutil.rmtree(parquet_path)
+
+    schema = None
+    parquet_writer = None
+    arrow_writer = None
+    n_rows = 0
+    try:
+        for i, chunk in enumerate(chunks):
+            chunk = _densify(apply_schema(chunk)).reset_index(drop=True)
+            chunk.to_csv(path, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+            table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            if schema is None:
+                schema = table.schema
+                if parquet_path is not None:
+                    os.makedirs(parquet_path, exist_ok=True)
+                    parquet_writer = pq.ParquetWriter(os.path.join(parquet_path, 'part-00000.parquet'), schema)
+                if arrow_path is not None:
+                    arrow_writer = pa.ipc.new_file(arrow_path, schema)
+            if parquet_writer is not None:
+                parquet_writer.write_table(table, row_group_size=PARQUET_ROW_GROUP_SIZE)
+            if arrow_writer is not None:
+                arrow_writer.write_table(table)
+            n_rows += len(chunk)
+    finally:
+        if parquet_writer is not None:
+            parquet_writer.close()
+        if arrow_writer is not None:
+            arrow_writer.close()
+    return n_rows
+
+def partition_path(year, root=PROCESSED_STORE_PATH):
+    """
+    Anket yılının bölüm dizini (root/survey_year=YYYY).
+    """
+    return os.path.join(root, f'{PARTITION_COLUMN}={year}')
+
+def save_survey_partition(df, year, root=PROCESSED_STORE_PATH):
+    """
+    Bir anket yılını şemayı uygulayarak kendi bölümüne yaz (mevcut bölümün üzerine).
+    Yıllar ayrı dizinlere yazıldığı için farklı süreçlerden eşzamanlı çağrılabilir.
+    """
+    df = apply_schema(df)
+    path = partition_path(year, root)
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    _write_parquet_part(df, path)
+    return df
+
+def load_survey_data(root=PROCESSED_STORE_PATH, columns=None, filters=None, years=None):
+    """
+    Yıl bölümlü veri setini oku. survey_year sütunu bölüm dizininden eklenir.
+    Yıllar arasında şema birleştirilir; bir yılda olmayan sütunlar (örn. 2024'te
+    frontend/tools bayrakları) o yılın satırlarında eksik (NaN) gelir.
+    columns/filters, load_cleaned_data ile aynı biçimdedir.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    if years is None:
+        paths = sorted(glob.glob(os.path.join(root, f'{PARTITION_COLUMN}=*')))
+    else:
+        paths = [partition_path(year, root) for year in years]
+    files = [f for path in paths for f in _parquet_parts(path)]
+    if not files:
+        raise FileNotFoundError(f"Yıl bölümlü veri seti bulunamadı: {root}")
+
+    partition_schema = pa.schema([(PARTITION_COLUMN, pa.int16())])
+    schema = pa.unify_schemas([pq.read_schema(f) for f in files] + [partition_schema])
+    dataset = ds.dataset(files, schema=schema, format='parquet', partition_base_dir=root,
+                         partitioning=ds.partitioning(partition_schema, flavor='hive'))
+    # Yıllar farklı kelime dağarcıklarıyla kodlanır; bloklar sütun adlarından taranır
+    read_cols, usecols, derived = _read_plan(columns, schema.names, vocabulary={})
+    if read_cols is not None:
+        for cols in (read_cols, usecols):
+            if PARTITION_COLUMN not in cols:
+                cols.append(PARTITION_COLUMN)
+    expression = pq.filters_to_expression(filters) if filters else None
+    df = add_code_columns(dataset.to_table(columns=read_cols, filter=expression).to_pandas(), derived, vocabulary={})
+    return df if usecols is None else df[usecols]
+
+def _expand_columns(columns, available, vocabulary=None):
+    """
+    Sütun listesindeki 'tools_*' gibi önek kalıplarını dosyadaki sütunlara genişlet.
+    """
+    if columns is None:
+        return None
+    expanded = []
+    for col in columns:
+        if col.endswith('*'):
+            prefix = col[:-1]
+            expanded.extend(c for c in flag_columns(available, prefix, vocabulary) if c not in expanded)
+        elif col not in expanded:
+            expanded.append(col)
+    return expanded
+
+def _read_plan(columns, available, vocabulary=None):
+    """
+    Okuma planı: (okunacak sütunlar, döndürülecek sütunlar, türetilecek kod sütunları).
+    Dosyada olmayan bir kod sütunu istenirse (eski dosyalar) yerine one-hot bloğu okunur.
+    columns None ise tüm sütunlar okunur ve eksik kodların tamamı türetilir.
+    """
+    usecols = _expand_columns(columns, available, vocabulary)
+    if usecols is None:
+        return None, None, [c for c in CODE_COLUMNS if c not in available]
+    derived = [c for c in usecols if c in CODE_COLUMNS and c not in available]
+    read_cols = _expand_columns([c for c in usecols if c not in derived]
+                                + [f'{CODE_COLUMNS[c]}*' for c in derived], available, vocabulary)
+    return read_cols, usecols, derived
+
+def _apply_filters(df, filters):
+    """
+    pyarrow filtre sözdizimindeki ([(sütun, operatör, değer), ...]) koşulları
+    bellekteki DataFrame'e uygula (CSV yedek yolu için).
+    """
+    operators = {
+        '==': lambda s, v: s == v,
+        '=': lambda s, v: s == v,
+        '!=': lambda s, v: s != v,
+        '<': lambda s, v: s < v,
+        '<=': lambda s, v: s <= v,
+        '>': lambda s, v: s > v,
+        '>=': lambda s, v: s >= v,
+        'in': lambda s, v: s.isin(v),
+        'not in': lambda s, v: ~s.isin(v),
+    }
+    mask = np.ones(len(df), dtype=bool)
+    for column, op, value in filters:
+        if op not in operators:
+            raise ValueError(f"Desteklenmeyen filtre operatörü: {op}")
+        mask &= operators[op](df[column], value).to_numpy(dtype=bool)
+    return df[mask].reset_index(drop=True)
+
+def load_cleaned_data(path=CLEANED_DATA_PATH, columns=None, filters=None, parquet_path=CLEANED_PARQUET_PATH):
+    """
+    Temizlenmiş veri setini şemadaki tiplerle oku.
+    - columns: okunacak sütunlar; 'tools_*' gibi önek kalıpları desteklenir
+    - filters: pyarrow filtre listesi, örn. [('seniority_level_ic', 'in', [1, 2, 3])]
+    Parquet dosyası varsa yalnızca seçilen sütunlar okunur ve filtreler satır grubu
+    istatistikleriyle diske inilmeden elenir; yoksa CSV'den okunur (bayraklar
+    metinden doğrudan uint8 olarak ayrıştırılır). Kod sütunları (CODE_COLUMNS) olmadan
+    yazılmış eski dosyalarda bu sütunlar one-hot bloklarından türetilir.
+    """
+    if parquet_path is not None and os.path.exists(parquet_path):
+        import pyarrow.dataset as ds
+        available = ds.dataset(parquet_path, format='parquet').schema.names
+        read_cols, usecols, derived = _read_plan(columns, available)
+        df = add_code_columns(pd.read_parquet(parquet_path, engine='pyarrow', columns=read_cols, filters=filters), derived)
+        return apply_schema(df if usecols is None else df[usecols])
+
+    available = pd.read_csv(path, nrows=0).columns
+    read_cols, usecols, derived = _read_plan(columns, available)
+    if read_cols is not None and filters:
+        # Filtre sütunlarını da oku, filtreden sonra at
+        read_cols = read_cols + [c for c, _, _ in filters if c not in read_cols]
+    names = read_cols if read_cols is not None else available
+    dtypes = schema_dtypes(names)
+    parse_dates = [c for c in DATETIME_COLUMNS if c in names]
+    df = pd.read_csv(path, usecols=read_cols, dtype=dtypes, parse_dates=parse_dates)
+    if read_cols is not None:
+        df = df[read_cols]
+    if filters:
+        df = _apply_filters(df, filters)
+    df = add_code_columns(df, derived)
+    if usecols is not None:
+        df = df[usecols]
+    return apply_schema(df)
+
+def load_cleaned_data_mmap(path=CLEANED_ARROW_PATH, columns=None):
+    """
+    Arrow IPC dosyasını bellek eşlemeli (mmap) ve sıfır kopya oku.
+    Sütunlar doğrudan eşlenen sayfalara bakan salt-okunur dizilerdir; aynı dosyayı
+    okuyan tüm süreçler işletim sisteminin tek page-cache kopyasını paylaşır.
+    Dosya yoksa `load_cleaned_data` ile Parquet/CSV'den okunur.
+    """
+    if not os.path.exists(path):
+        return load_cleaned_data(columns=columns)
+
+    import pyarrow as pa
+    source = pa.memory_map(path, 'r')
+    table = pa.ipc.open_file(source).read_all()
+    read_cols, usecols, derived = _read_plan(columns, table.column_names)
+    if read_cols is not None:
+        table = table.select(read_cols)
+    # split_blocks: sütunlar tek bir 2D blokta birleştirilmez (kopyalanmaz)
+    df = add_code_columns(table.to_pandas(split_blocks=True), derived)
+    return apply_schema(df if usecols is None else df[usecols])
@@ -5,15 +5,17 @@ Bu script, analiz sonuçlarını LaTeX formatında rapor olarak oluşturur.
 
 import pandas as pd
 import numpy as np
-from scipy.stats import ttest_ind
 import os
 from datetime import datetime
+from data_store import load_cleaned_data
+from results_cache import ResultsCache, dataset_fingerprint
+from stat_kernels import group_pair_tests
+from technology_roi import technology_roi
+from plot_data import ensure_tables, load_table
 
 def load_data():
     """Veri setini yükle"""
-    df = pd.read_csv('data/2025_cleaned_data.csv')
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    return df
+    return load_cleaned_data()
 
 def calculate_key_statistics(df):
     """Temel istatistikleri hesapla"""
@@ -36,119 +38,37 @@ def calculate_key_statistics(df):
     
     return stats
 
-def calculate_effect_size(group1, group2):
-    """Calculate Cohen's d effect size"""
-    n1, n2 = len(group1), len(group2)
-    pooled_std = np.sqrt(((n1 - 1) * group1.var() + (n2 - 1) * group2.var()) / (n1 + n2 - 2))
-    return (group1.mean() - group2.mean()) / pooled_std
-
 def perform_hypothesis_tests(df):
-    """Hipotez testlerini gerçekleştir"""
-    tests = {}
-    
-    # 1. React vs Non-React
-    react_salaries = df[df['frontend_React'] == 1]['salary_numeric']
-    non_react_salaries = df[df['frontend_React'] == 0]['salary_numeric']
-    
-    t_stat, p_value = ttest_ind(react_salaries, non_react_salaries, equal_var=False)
-    mean_diff = react_salaries.mean() - non_react_salaries.mean()
-    effect_size = calculate_effect_size(react_salaries, non_react_salaries)
-    
-    tests['react_vs_non_react'] = {
-        'react_mean': react_salaries.mean(),
-        'non_react_mean': non_react_salaries.mean(),
-        'mean_diff': mean_diff,
-        'p_value': p_value,
-        'effect_size': effect_size,
-        'significant': p_value < 0.05,
-        'react_count': len(react_salaries),
-        'non_react_count': len(non_react_salaries)
+    """Hipotez testlerini tek bir toplu Welch/Cohen's d çağrısıyla gerçekleştir"""
+    pairs = {
+        # 1. React vs Non-React
+        'react_vs_non_react': (('react', df['frontend_React'] == 1), ('non_react', df['frontend_React'] == 0)),
+        # 2. Remote vs Office
+        'remote_vs_office': (('remote', df['work_mode_Remote'] == 1), ('office', df['work_mode_Office'] == 1)),
+        # 3. Europe vs Turkey
+        'europe_vs_turkey': (('europe', df['company_location_Avrupa'] == 1), ('turkey', df['company_location_Turkiye'] == 1)),
+        # 4. Gender gap
+        'gender_gap': (('male', df['gender'] == 0), ('female', df['gender'] == 1)),
     }
-    
-    # 2. Remote vs Office
-    remote_salaries = df[df['work_mode_Remote'] == 1]['salary_numeric']
-    office_salaries = df[df['work_mode_Office'] == 1]['salary_numeric']
-    
-    t_stat, p_value = ttest_ind(remote_salaries, office_salaries, equal_var=False)
-    mean_diff = remote_salaries.mean() - office_salaries.mean()
-    effect_size = calculate_effect_size(remote_salaries, office_salaries)
-    
-    tests['remote_vs_office'] = {
-        'remote_mean': remote_salaries.mean(),
-        'office_mean': office_salaries.mean(),
-        'mean_diff': mean_diff,
-        'p_value': p_value,
-        'effect_size': effect_size,
-        'significant': p_value < 0.05,
-        'remote_count': len(remote_salaries),
-        'office_count': len(office_salaries)
-    }
-    
-    # 3. Europe vs Turkey
-    europe_salaries = df[df['company_location_Avrupa'] == 1]['salary_numeric']
-    turkey_salaries = df[df['company_location_Turkiye'] == 1]['salary_numeric']
-    
-    t_stat, p_value = ttest_ind(europe_salaries, turkey_salaries, equal_var=False)
-    mean_diff = europe_salaries.mean() - turkey_salaries.mean()
-    effect_size = calculate_effect_size(europe_salaries, turkey_salaries)
-    
-    tests['europe_vs_turkey'] = {
-        'europe_mean': europe_salaries.mean(),
-        'turkey_mean': turkey_salaries.mean(),
-        'mean_diff': mean_diff,
-        'p_value': p_value,
-        'effect_size': effect_size,
-        'significant': p_value < 0.05,
-        'europe_count': len(europe_salaries),
-        'turkey_count': len(turkey_salaries)
-    }
-    
-    # 4. Gender gap
-    male_salaries = df[df['gender'] == 0]['salary_numeric']
-    female_salaries = df[df['gender'] == 1]['salary_numeric']
-    
-    t_stat, p_value = ttest_ind(male_salaries, female_salaries, equal_var=False)
-    mean_diff = male_salaries.mean() - female_salaries.mean()
-    effect_size = calculate_effect_size(male_salaries, female_salaries)
-    
-    tests['gender_gap'] = {
-        'male_mean': male_salaries.mean(),
-        'female_mean': female_salaries.mean(),
-        'mean_diff': mean_diff,
-        'p_value': p_value,
-        'effect_size': effect_size,
-        'significant': p_value < 0.05,
-        'male_count': len(male_salaries),
-        'female_count': len(female_salaries)
-    }
-    
-    return tests
+    return group_pair_tests(df['salary_numeric'], pairs)
 
 def calculate_technology_roi(df):
     """Teknoloji ROI hesaplamaları"""
     roi_data = {}
     
-    # Programlama dilleri ROI
-    lang_columns = [col for col in df.columns if col.startswith('programming_') and col != 'programming_Hicbiri']
+    # Programlama dilleri ROI (kullanıcı ve kullanmayan sayısı 10'dan fazla)
+    lang_roi = technology_roi(df, 'programming_', exclude={'programming_Hicbiri'}, min_count=11)
     
-    for col in lang_columns:
-        lang_name = col.replace('programming_', '')
-        users = df[df[col] == 1]
-        non_users = df[df[col] == 0]
-        
-        if len(users) > 10 and len(non_users) > 10:
-            user_avg = users['salary_numeric'].mean()
-            non_user_avg = non_users['salary_numeric'].mean()
-            roi = user_avg - non_user_avg
-            # Only include if ROI is significant (>5% difference)
-            if abs(roi) > user_avg * 0.05:
-                roi_data[lang_name] = {
-                    'roi': roi,
-                    'user_count': len(users),
-                    'user_avg': user_avg,
-                    'non_user_avg': non_user_avg,
-                    'percentage_increase': (roi / non_user_avg) * 100
-                }
+    for row in lang_roi.itertuples():
+        # Only include if ROI is significant (>5% difference)
+        if abs(row.roi) > row.user_mean * 0.05:
+            roi_data[row.technology.replace('programming_', '')] = {
+                'roi': row.roi,
+                'user_count': row.users,
+                'user_avg': row.user_mean,
+                'non_user_avg': row.non_user_mean,
+                'percentage_increase': row.percentage_increase
+            }
     
     # En yüksek ROI'li teknolojiler
     top_roi = sorted(roi_data.items(), key=lambda x: x[1]['roi'], reverse=True)[:10]
@@ -173,10 +93,15 @@ def generate_latex_report():
     # Veri yükle
     df = load_data()
     
-    # İstatistikleri hesapla
-    stats = calculate_key_statistics(df)
-    tests = perform_hypothesis_tests(df)
-    roi_data = calculate_technology_roi(df)
+    # İstatistikleri hesapla (aynı veri için önceki çalıştırmaların sonuçları kullanılır)
+    cache = ResultsCache()
+    fingerprint = dataset_fingerprint(df)
+    stats = cache.cached(fingerprint, 'report.key_statistics', lambda: calculate_key_statistics(df))
+    tests = cache.cached(fingerprint, 'report.hypothesis_tests', lambda: perform_hypothesis_tests(df))
+    roi_data = cache.cached(fingerprint, 'report.technology_roi', lambda: calculate_technology_roi(df),
+                            params={'min_count': 11, 'min_roi_share': 0.05, 'top': 10})
+    # Grafiklerle ortak özet tablolar (data/aggregates/, veri değiştiyse yeniden üretilir)
+    ensure_tables(df, fingerprint=fingerprint)
     
     # LaTeX içeriği
     latex_content = f"""
@@ -233,7 +158,7 @@ Raw data underwent comprehensive cleaning and preprocessing:
     \\item Missing value handling and outlier treatment using IQR and Z-score methods
     \\item Salary normalization and validation
     \\item Categorical variable encoding with One-Hot Encoding
-    \\item Multi-label technology columns processing using MultiLabelBinarizer
+    \\item Multi-label technology columns encoded as multi-hot indicators: each distinct answer is split and normalized once, with columns ordered by a persisted category vocabulary
     \\item Duplicate column removal and data quality checks
 \\end{{itemize}}
 
@@ -314,10 +239,11 @@ Career progression shows clear salary differentiation across levels:
 \\midrule
 """
 
+    levels = load_table('seniority_salaries').set_index('seniority_level_ic')
     for level, name in career_levels.items():
-        level_data = df[df['seniority_level_ic'] == level]
-        if len(level_data) > 0:
-            latex_content += f"{name} & {len(level_data):,} & {level_data['salary_numeric'].mean():.1f} \\\\\n"
+        if level in levels.index:
+            row = levels.loc[level]
+            latex_content += f"{name} & {row['respondents']:,} & {row['mean_salary']:.1f} \\\\\n"
     
     latex_content += f"""
 \\bottomrule
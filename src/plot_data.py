@@ -0,0 +1,394 @@
+"""
+Plot Data (English)
+Tidy aggregate tables behind the Sprint 2 figures, the dashboard and the LaTeX report.
+Every builder reduces the cleaned dataset to a small long-format table (one row per
+group, category or cell); renderers only reshape, sort and draw these tables, so the
+same numbers feed matplotlib, Plotly and LaTeX. The tables of the full dataset are
+persisted as Parquet under data/aggregates/ together with a manifest holding the dataset
+fingerprint and the version of the code that built them; ensure_tables() rebuilds them
+only when either changed.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from matplotlib import cbook
+
+from atomic_write import atomic_path
+from data_store import code_column
+from results_cache import dataset_fingerprint
+from source_digests import FileDigests, code_version as source_version
+from stat_kernels import masked_stats
+from tech_itemsets import mine_stacks_by_role
+from technology_roi import technology_roi
+from vocabulary import flag_columns
+
+AGGREGATES_DIR = 'data/aggregates'
+MANIFEST_NAME = 'manifest.json'
+# Bumped when the persisted layout changes incompatibly
+AGGREGATES_FORMAT = 1
+
+LEVEL_LABELS = {0: 'Management', 1: 'Junior', 2: 'Mid', 3: 'Senior', 4: 'Staff Engineer', 5: 'Team Lead',
+                6: 'Architect'}
+WORK_MODES = ['Remote', 'Hybrid', 'Office']
+LOCATION_LABELS = {'Turkiye': 'Türkiye', 'Avrupa': 'Europe', 'Amerika': 'America',
+                   'Yurtdisi_TR_hub': 'Overseas TR hub'}
+EMPLOYMENT_LABELS = {'Freelance': 'Freelance', 'Kendi_isim': 'Self-employed', 'Tam_zamanli': 'Full-time',
+                     'Yari_zamanli': 'Part-time'}
+# Technology blocks: prefix and the "none of these" answer left out of usage and ROI views
+TECH_BLOCKS = (('programming_', 'programming_Hicbiri'), ('frontend_', 'frontend_Kullanmiyorum'),
+               ('tools_', 'tools_Kullanmiyorum'))
+ROI_MIN_COUNT = 10
+COMBINATION_MIN_COUNT = 10
+STACK_MIN_SUPPORT = 10
+
+
+def label(column: str, prefix: str = '') -> str:
+    """Display label of a one-hot column: prefix removed, underscores as spaces."""
+    return column[len(prefix):].replace('_', ' ')
+
+
+def block_columns(df: pd.DataFrame, prefix: str, exclude=()) -> list[str]:
+    return [c for c in flag_columns(df.columns, prefix) if c not in exclude]
+
+
+def survey_hour(df: pd.DataFrame) -> pd.Series:
+    return pd.to_datetime(df['timestamp']).dt.hour.rename('hour')
+
+
+def primary_role(df: pd.DataFrame) -> pd.Series:
+    """Survey label of every respondent's role from the role code column, None without a role."""
+    roles = code_column(df, 'role')
+    return roles.astype(object).where(roles.notna(), None)
+
+
+def first_true_index(df: pd.DataFrame, cols: list[str]) -> np.ndarray:
+    """Position in cols of the first flag equal to 1 for every row, -1 where none is set."""
+    if not cols:
+        return np.full(len(df), -1)
+    hot = df[cols].to_numpy() == 1
+    return np.where(hot.any(axis=1), hot.argmax(axis=1), -1)
+
+
+# ============ TABLE BUILDERS ============
+
+def seniority_salaries(df: pd.DataFrame) -> pd.DataFrame:
+    """Respondents and mean salary per career level."""
+    table = df.groupby('seniority_level_ic')['salary_numeric'].agg(respondents='size', mean_salary='mean')
+    table = table.reset_index()
+    table.insert(1, 'level', table['seniority_level_ic'].map(LEVEL_LABELS))
+    return table
+
+
+def role_salaries(df: pd.DataFrame) -> pd.DataFrame:
+    """Respondents with a salary and their mean salary per role flag."""
+    cols = block_columns(df, 'role_')
+    count, mean, _ = masked_stats(df[cols].to_numpy().T == 1, df['salary_numeric'])
+    return pd.DataFrame({'role': [label(c, 'role_') for c in cols], 'respondents': count.astype(int),
+                         'mean_salary': mean})
+
+
+def technology_roi_table(df: pd.DataFrame) -> pd.DataFrame:
+    """ROI of every programming language, frontend technology and tool with enough users."""
+    tables = []
+    for prefix, excluded in TECH_BLOCKS:
+        # Tools keep the Kullanmiyorum answer, as in the original tools ROI chart
+        exclude = {excluded} if prefix != 'tools_' else set()
+        roi = technology_roi(df, prefix, exclude=exclude, min_count=ROI_MIN_COUNT)
+        roi.insert(0, 'block', prefix.rstrip('_'))
+        roi.insert(2, 'label', [label(c, prefix) for c in roi['technology']])
+        tables.append(roi)
+    return pd.concat(tables, ignore_index=True)
+
+
+def technology_usage_by_gender(df: pd.DataFrame) -> pd.DataFrame:
+    """Overall usage share and usage percentage of men and women per language and frontend technology."""
+    tables = []
+    for prefix, excluded in TECH_BLOCKS[:2]:
+        cols = block_columns(df, prefix, {excluded})
+        tables.append(pd.DataFrame({
+            'block': prefix.rstrip('_'),
+            'technology': [label(c, prefix) for c in cols],
+            'usage': df[cols].mean().to_numpy(),
+            'male_pct': (df[df['gender'] == 0][cols].mean() * 100).to_numpy(),
+            'female_pct': (df[df['gender'] == 1][cols].mean() * 100).to_numpy(),
+        }))
+    return pd.concat(tables, ignore_index=True)
+
+
+def tech_salary_correlation(df: pd.DataFrame) -> pd.DataFrame:
+    """Pearson correlation of every non-constant technology/tool flag with salary."""
+    rows = []
+    for c in block_columns(df, ('programming_', 'frontend_', 'tools_')):
+        if df[c].nunique() > 1:
+            rows.append((c, label(c.split('_', 1)[1]), df[[c, 'salary_numeric']].corr().iloc[0, 1]))
+    return pd.DataFrame(rows, columns=['column', 'technology', 'correlation'])
+
+
+def feature_correlations(df: pd.DataFrame, top: int = 20) -> pd.DataFrame:
+    """Correlation matrix (long format) of the top features by absolute correlation with salary."""
+    base_cols = [c for c in ['salary_numeric', 'experience_years', 'seniority_level_ic'] if c in df.columns]
+    sub = df[base_cols + block_columns(df, ('programming_', 'frontend_', 'tools_'))]
+    # Keep only columns with variance
+    sub = sub[[c for c in sub.columns if sub[c].nunique() > 1]]
+    if 'salary_numeric' not in sub.columns or sub.shape[1] < 3:
+        return pd.DataFrame(columns=['feature', 'other', 'correlation'])
+    corr = sub.corr()
+    top_cols = corr['salary_numeric'].abs().sort_values(ascending=False).index[:top].tolist()
+    corr = corr.loc[top_cols, top_cols].rename_axis(index='feature', columns='other')
+    return corr.stack().rename('correlation').reset_index()
+
+
+def hourly_participation(df: pd.DataFrame) -> pd.DataFrame:
+    """Mean salary and number of participants per survey hour."""
+    hourly = df['salary_numeric'].groupby(survey_hour(df)).agg(avg_salary='mean', participants='size')
+    return hourly.reset_index()
+
+
+def role_share_by_hour(df: pd.DataFrame) -> pd.DataFrame:
+    """Share of each role among the participants of every survey hour (roles in column order)."""
+    cols = block_columns(df, 'role_')
+    shares = df[cols].groupby(survey_hour(df)).mean()
+    shares.columns = pd.Index([label(c, 'role_') for c in cols], name='role')
+    return shares.stack().rename('share').reset_index()
+
+
+def level_role_flows(df: pd.DataFrame) -> pd.DataFrame:
+    """Respondents per (career level, role) pair with at least one respondent."""
+    cols = block_columns(df, 'role_')
+    counts = (df[cols] == 1).groupby(df['seniority_level_ic']).sum()
+    counts = counts.reindex([lvl for lvl in LEVEL_LABELS if lvl in counts.index])
+    counts.columns = pd.Index([label(c, 'role_') for c in cols], name='role')
+    flows = counts.stack().rename('count').reset_index()
+    flows.insert(1, 'level', flows['seniority_level_ic'].map(LEVEL_LABELS))
+    return flows[flows['count'] > 0].reset_index(drop=True)
+
+
+def career_progression(df: pd.DataFrame) -> pd.DataFrame:
+    """Mean salary of Junior, Mid and Senior respondents per company location.
+    Respondents likely to live in the company location are preferred; a location whose
+    levels are not all covered falls back to every respondent of that location.
+    """
+    levels = [1, 2, 3]
+    in_levels = df['seniority_level_ic'].isin(levels)
+    subset = df[in_levels]
+    if 'is_likely_in_company_location' in df.columns:
+        subset = subset[subset['is_likely_in_company_location'] == 1]
+    rows = []
+    if subset.empty:
+        return pd.DataFrame(rows, columns=['company_location', 'seniority_level_ic', 'mean_salary'])
+    for raw in ['Turkiye', 'Avrupa', 'Amerika']:
+        col = f'company_location_{raw}'
+        if col not in df.columns:
+            continue
+        grp = subset[subset[col] == 1].groupby('seniority_level_ic')['salary_numeric'].mean()
+        y = [grp.get(lvl, np.nan) for lvl in levels]
+        if any(np.isnan(y)):
+            grp = df[(df[col] == 1) & in_levels].groupby('seniority_level_ic')['salary_numeric'].mean()
+            y = [grp.get(lvl, fallback) for lvl, fallback in zip(levels, y)]
+        rows.extend((LOCATION_LABELS[raw], lvl, mean) for lvl, mean in zip(levels, y))
+    return pd.DataFrame(rows, columns=['company_location', 'seniority_level_ic', 'mean_salary'])
+
+
+def work_mode_location_salary(df: pd.DataFrame) -> pd.DataFrame:
+    """Respondents and mean salary for every work mode x company location cell."""
+    modes = [m for m in WORK_MODES if f'work_mode_{m}' in df.columns]
+    locs = [loc for loc in LOCATION_LABELS if f'company_location_{loc}' in df.columns]
+    rows = []
+    for m in modes:
+        for loc in locs:
+            s = df[(df[f'work_mode_{m}'] == 1) & (df[f'company_location_{loc}'] == 1)]['salary_numeric']
+            rows.append((m, LOCATION_LABELS[loc], len(s), s.mean() if len(s) > 0 else np.nan))
+    return pd.DataFrame(rows, columns=['work_mode', 'company_location', 'respondents', 'mean_salary'])
+
+
+def work_arrangement_by_role(df: pd.DataFrame) -> pd.DataFrame:
+    """Respondents and share of each work mode per primary role (roles in alphabetical order)."""
+    modes = [m for m in WORK_MODES if f'work_mode_{m}' in df.columns]
+    counts = (df[[f'work_mode_{m}' for m in modes]] == 1).groupby(primary_role(df)).sum()
+    counts.columns = pd.Index(modes, name='work_mode')
+    total = counts.sum(axis=1)
+    table = counts.rename_axis(index='role').stack().rename('count').reset_index()
+    table['respondents'] = table['role'].map(total)
+    table['share'] = table['count'] / table['respondents']
+    return table
+
+
+def tool_adoption_by_role(df: pd.DataFrame) -> pd.DataFrame:
+    """Adoption percentage of every tool per primary role, roles by descending respondent count."""
+    cols = [c for c in block_columns(df, 'tools_') if not c.endswith('Kullanmiyorum')]
+    roles = primary_role(df)
+    role_counts = roles.value_counts()
+    adoption = (df[cols].groupby(roles).mean() * 100).reindex(role_counts.index)
+    adoption.columns = pd.Index([label(c, 'tools_') for c in cols], name='tool')
+    table = adoption.rename_axis(index='role').stack().rename('adoption_pct').reset_index()
+    table.insert(1, 'respondents', table['role'].map(role_counts))
+    return table
+
+
+def tech_combinations_by_role(df: pd.DataFrame, min_count: int = COMBINATION_MIN_COUNT) -> pd.DataFrame:
+    """Mean salary per (role, language, frontend, tool) combination of every respondent's first
+    selection in each block; combinations with fewer than min_count respondents are dropped.
+    """
+    blocks = [(block_columns(df, 'role_'), 'role_')]
+    blocks += [(block_columns(df, prefix, {excluded}), prefix) for prefix, excluded in TECH_BLOCKS]
+    columns = ['role', 'combo', 'avg_salary', 'count']
+    if not blocks[0][0] or not any(cols for cols, _ in blocks[1:]):
+        return pd.DataFrame(columns=columns)
+
+    # First selected role/language/frontend/tool per respondent as column positions
+    codes = np.column_stack([first_true_index(df, cols) for cols, _ in blocks])
+    salary = df['salary_numeric'].to_numpy(dtype=np.float64)
+    # Skip respondents with a missing selection in any block (or no salary)
+    keep = (codes >= 0).all(axis=1) & ~np.isnan(salary)
+    if not keep.any():
+        return pd.DataFrame(columns=columns)
+
+    # One integer code per (role, language, frontend, tool) combination
+    shape = [len(cols) for cols, _ in blocks]
+    keys = np.ravel_multi_index(codes[keep].T, shape)
+    combo_ids, combo_keys = pd.factorize(keys)
+    count = np.bincount(combo_ids)
+    avg_salary = np.bincount(combo_ids, weights=salary[keep]) / count
+    adequate = count >= min_count
+
+    # Labels only for the surviving combinations
+    labels = [np.asarray([label(c, prefix) for c in cols], dtype=object)[col_codes]
+              for (cols, prefix), col_codes in zip(blocks, np.unravel_index(combo_keys[adequate], shape))]
+    return pd.DataFrame({
+        'role': labels[0],
+        'combo': [f'{lang} + {fe} + {tool}' for lang, fe, tool in zip(*labels[1:])],
+        'avg_salary': avg_salary[adequate],
+        'count': count[adequate],
+    }, columns=columns).sort_values(['role', 'combo'], ignore_index=True)
+
+
+def frequent_stacks_by_role(df: pd.DataFrame) -> pd.DataFrame:
+    """Frequent technology stacks per role with salary confidence intervals (see tech_itemsets)."""
+    return mine_stacks_by_role(df, min_support=STACK_MIN_SUPPORT)
+
+
+def salary_boxes(df: pd.DataFrame) -> pd.DataFrame:
+    """Box plot statistics (quartiles, 1.5 IQR whiskers, outliers) of salary per work mode,
+    company location and employment type, in the layout matplotlib's Axes.bxp draws.
+    """
+    groups = [
+        ('work_mode', [(f'work_mode_{m}', m) for m in WORK_MODES]),
+        ('company_location', [(f'company_location_{raw}', name) for raw, name in LOCATION_LABELS.items()]),
+        ('employment_type', [(f'employment_type_{raw}', EMPLOYMENT_LABELS.get(raw, label(raw)))
+                             for raw in [c[len('employment_type_'):] for c in block_columns(df, 'employment_type_')]]),
+    ]
+    tables = []
+    for group, members in groups:
+        data, labels = [], []
+        for col, name in members:
+            if col in df.columns:
+                vals = df.loc[df[col] == 1, 'salary_numeric']
+                if len(vals) > 0:
+                    data.append(vals)
+                    labels.append(name)
+        if data:
+            stats = pd.DataFrame(cbook.boxplot_stats(data, labels=labels))
+            stats.insert(0, 'group', group)
+            tables.append(stats)
+    return pd.concat(tables, ignore_index=True) if tables else pd.DataFrame(columns=['group', 'label'])
+
+
+TABLES = {
+    'seniority_salaries': seniority_salaries,
+    'role_salaries': role_salaries,
+    'technology_roi': technology_roi_table,
+    'technology_usage_by_gender': technology_usage_by_gender,
+    'tech_salary_correlation': tech_salary_correlation,
+    'feature_correlations': feature_correlations,
+    'hourly_participation': hourly_participation,
+    'role_share_by_hour': role_share_by_hour,
+    'level_role_flows': level_role_flows,
+    'career_progression': career_progression,
+    'work_mode_location_salary': work_mode_location_salary,
+    'work_arrangement_by_role': work_arrangement_by_role,
+    'tool_adoption_by_role': tool_adoption_by_role,
+    'tech_combinations_by_role': tech_combinations_by_role,
+    'frequent_stacks_by_role': frequent_stacks_by_role,
+    'salary_boxes': salary_boxes,
+}
+
+
+def sankey_links(flows: pd.DataFrame, level_order):
+    """Sankey nodes (levels in level_order, then roles alphabetically) and link source,
+    target and value lists from a (level, role, count) flow table.
+    """
+    levels = [lvl for lvl in level_order if lvl in set(flows['level'])]
+    nodes = levels + sorted(set(flows['role']))
+    node_index = {n: i for i, n in enumerate(nodes)}
+    source = [node_index[s] for s in flows['level']]
+    target = [node_index[t] for t in flows['role']]
+    return nodes, source, target, flows['count'].astype(int).tolist()
+
+
+# ============ PERSISTENCE ============
+
+def code_version() -> str:
+    """Hash of this module and of every local module it imports, transitively (as for build targets)."""
+    return source_version([os.path.basename(__file__)], FileDigests(), {})
+
+
+def table_path(name: str, directory: str = AGGREGATES_DIR) -> str:
+    return os.path.join(directory, f'{name}.parquet')
+
+
+def build_tables(df: pd.DataFrame, names=None) -> dict:
+    """Build the given tables (all by default) from df."""
+    names = list(TABLES) if names is None else list(names)
+    unknown = [n for n in names if n not in TABLES]
+    if unknown:
+        raise ValueError(f'Unknown tables: {unknown}. Available: {list(TABLES)}')
+    return {name: TABLES[name](df) for name in names}
+
+
+def read_manifest(directory: str = AGGREGATES_DIR):
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def tables_current(fingerprint: str, directory: str = AGGREGATES_DIR) -> bool:
+    """True when every table on disk was built from this dataset by the current code."""
+    manifest = read_manifest(directory)
+    return (manifest is not None and manifest.get('format') == AGGREGATES_FORMAT
+            and manifest.get('dataset') == fingerprint and manifest.get('code') == code_version()
+            and sorted(manifest.get('tables', [])) == sorted(TABLES)
+            and all(os.path.exists(table_path(name, directory)) for name in TABLES))
+
+
+def write_tables(tables: dict, fingerprint: str, directory: str = AGGREGATES_DIR):
+    """Write every table as Parquet, then the manifest (each file atomically)."""
+    os.makedirs(directory, exist_ok=True)
+    for name, table in tables.items():
+        with atomic_path(table_path(name, directory)) as tmp_path:
+            table.to_parquet(tmp_path, index=False)
+    manifest = {'format': AGGREGATES_FORMAT, 'dataset': fingerprint, 'code': code_version(),
+                'tables': sorted(tables)}
+    with atomic_path(os.path.join(directory, MANIFEST_NAME)) as tmp_path:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+
+def ensure_tables(df: pd.DataFrame, directory: str = AGGREGATES_DIR, fingerprint: str | None = None) -> bool:
+    """Rebuild and persist all tables unless the stored ones match df and the code; True if rebuilt."""
+    fingerprint = fingerprint or dataset_fingerprint(df)
+    if tables_current(fingerprint, directory):
+        return False
+    write_tables(build_tables(df), fingerprint, directory)
+    return True
+
+
+def load_table(name: str, directory: str = AGGREGATES_DIR) -> pd.DataFrame:
+    """Persisted table by name (see ensure_tables)."""
+    if name not in TABLES:
+        raise ValueError(f'Unknown table: {name}. Available: {list(TABLES)}')
+    return pd.read_parquet(table_path(name, directory))
@@ -0,0 +1,116 @@
+"""
+İstatistiksel sonuçlar için kalıcı, içerik adresli önbellek.
+Anahtar; işlenmiş veri setinin içerik özeti (fingerprint), hesaplama adı, filtre tanımı ve
+test parametrelerinin kanonik JSON'unun SHA-256 özetidir. Veri değiştiğinde özet de
+değişir, böylece eski sonuçlar hiçbir zaman yanlışlıkla kullanılmaz. Sonuçlar pickle
+yerine JSON olarak (her giriş ayrı bir dosyada, atomik yazımla) saklanır; giriş sayısı ve
+toplam boyut sınırı aşıldığında en uzun süredir kullanılmayan (LRU) girişler silinir.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from atomic_write import atomic_path
+
+CACHE_DIR = 'data/cache'
+CACHE_MAX_ENTRIES = 512
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+# Kayıt biçimi sürümü; biçim uyumsuz değişirse artırılır (eski anahtarlar geçersiz olur)
+CACHE_FORMAT = 1
+
+
+def _to_builtin(value):
+    """NumPy/pandas skalerlerini ve kümeleri JSON'a yazılabilir Python türlerine çevir."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    raise TypeError(f"JSON'a yazılamayan tür: {type(value).__name__}")
+
+
+def dataset_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Veri çerçevesinin içerik özeti: satır değerlerinin pandas hash'i, sütun adları ve türleri.
+    """
+    h = hashlib.sha256()
+    h.update(json.dumps([[str(c), str(t)] for c, t in df.dtypes.items()]).encode('utf-8'))
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def cache_key(fingerprint, name, filters=None, params=None):
+    """Veri özeti, hesaplama adı, filtreler ve parametrelerden kanonik anahtar."""
+    spec = {'format': CACHE_FORMAT, 'dataset': fingerprint, 'name': name,
+            'filters': filters or {}, 'params': params or {}}
+    payload = json.dumps(spec, sort_keys=True, default=_to_builtin, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResultsCache:
+    """
+    Dizin tabanlı JSON sonuç önbelleği. Her giriş `<anahtar>.json` dosyasıdır;
+    son kullanım zamanı dosyanın mtime değeridir (okumada güncellenir).
+    """
+
+    def __init__(self, directory=CACHE_DIR, max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key):
+        """Kayıtlı sonuç; yoksa veya okunamıyorsa None."""
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            return None
+        os.utime(path)
+        return value
+
+    def put(self, key, value):
+        """Sonucu atomik olarak yaz ve sınırlar aşıldıysa eski girişleri sil."""
+        os.makedirs(self.directory, exist_ok=True)
+        with atomic_path(self._path(key)) as tmp_path:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(value, f, default=_to_builtin, ensure_ascii=False)
+        self.evict()
+
+    def evict(self):
+        """Giriş sayısı veya toplam boyut sınırı aşılırken en eski kullanılan girişleri sil."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.json'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_entries or total > self.max_bytes):
+            _, size, path = entries.pop(0)
+            os.remove(path)
+            total -= size
+
+    def cached(self, fingerprint, name, compute, filters=None, params=None):
+        """
+        Önbellekte varsa sonucu döndür, yoksa compute() ile hesaplayıp kaydet.
+        Sonuç JSON'dan okunduğu için tuple'lar liste, NumPy skalerleri Python türü olarak döner.
+        """
+        key = cache_key(fingerprint, name, filters, params)
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+            # İlk çalıştırma da önbellekten okunan sonuçla aynı türleri görsün
+            value = json.loads(json.dumps(value, default=_to_builtin))
+        return value
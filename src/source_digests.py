@@ -0,0 +1,86 @@
+"""
+Kaynak kod ve dosya içerik özetleri.
+Dosya özetleri boyut + mtime değişmedikçe yeniden hesaplanmaz. Bir betiğin kod sürümü,
+kendisinin ve (geçişli olarak) içe aktardığı src/ modüllerinin özetidir; derleme grafiği
+(build) ve kalıcı grafik tabloları (plot_data) eski çıktıları bununla tanır. Modül yalnızca
+standart kütüphaneyi kullanır, böylece kod sürümüne başka yerel modül eklemez.
+"""
+
+import ast
+import hashlib
+import os
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+class FileDigests:
+    """
+    Dosya/dizin içerik özetleri; boyut ve mtime değişmemişse önceki özet kullanılır.
+    Dizinin özeti içindeki dosyaların göreli yolları ve özetlerinden hesaplanır.
+    Olmayan yolun özeti None'dır.
+    """
+
+    def __init__(self, known=None):
+        self.known = dict(known or {})  # yol -> [boyut, mtime_ns, özet]
+
+    def digest(self, path):
+        if os.path.isdir(path):
+            h = hashlib.sha256()
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    file_path = os.path.join(root, name)
+                    h.update(f'{os.path.relpath(file_path, path)}\0{self.digest(file_path)}\0'.encode('utf-8'))
+            return h.hexdigest()
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        entry = self.known.get(path)
+        if entry is not None and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        value = _sha256_file(path)
+        self.known[path] = [stat.st_size, stat.st_mtime_ns, value]
+        return value
+
+
+def local_imports(module_path):
+    """Betiğin doğrudan içe aktardığı src/ modüllerinin yolları."""
+    with open(module_path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=module_path)
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module.split('.')[0])
+    paths = (os.path.join(SRC_DIR, f'{name}.py') for name in names)
+    return sorted(p for p in paths if os.path.exists(p))
+
+
+def code_version(scripts, digests, imports):
+    """
+    Betiklerin ve (geçişli olarak) içe aktardıkları yerel modüllerin ortak özeti.
+    imports: yol -> [dosya özeti, içe aktarılan yollar]; dosya değişmedikçe yeniden ayrıştırılmaz.
+    """
+    seen, stack = set(), [os.path.join(SRC_DIR, s) for s in scripts]
+    while stack:
+        path = stack.pop()
+        if path not in seen:
+            seen.add(path)
+            digest = digests.digest(path)
+            if path not in imports or imports[path][0] != digest:
+                imports[path] = [digest, local_imports(path)]
+            stack.extend(imports[path][1])
+    h = hashlib.sha256()
+    for path in sorted(seen):
+        h.update(f'{os.path.basename(path)}\0{digests.digest(path)}\0'.encode('utf-8'))
+    return h.hexdigest()
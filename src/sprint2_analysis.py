@@ -5,33 +5,99 @@ All titles/labels are in English. Location-related plots include the mandatory d
 """
 
 import os
+import json
+import argparse
+import time
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.graph_objects as go
-from scipy.stats import ttest_ind, f_oneway, kruskal
+from scipy.stats import f_oneway, kruskal
 from statsmodels.stats.multicomp import pairwise_tukeyhsd
+from data_store import code_column, load_cleaned_data, load_cleaned_data_mmap, save_arrow
+from results_cache import ResultsCache, dataset_fingerprint
+from stat_kernels import group_pair_tests
+from plot_data import LEVEL_LABELS, ensure_tables, load_table, sankey_links
+from vocabulary import flag_columns
 
 sns.set_palette("husl")
 plt.rcParams['font.family'] = 'DejaVu Sans'
 
 FIG_DIR = 'figures'
+STATISTICAL_TESTS_PATH = 'data/statistical_test_results.json'
 LOCATION_NOTE = 'Note: Estimated location is inferred from company location and work mode (Office/Hybrid → company location). Not definitive. "Yurtdışı TR hub" responses are excluded from location-based inference.'
 
 def load_data() -> pd.DataFrame:
-    df = pd.read_csv('data/2025_cleaned_data.csv')
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    return df
+    return load_cleaned_data()
 
 def ensure_dirs():
     os.makedirs(FIG_DIR, exist_ok=True)
 
-def calculate_effect_size(group1, group2):
-    """Calculate Cohen's d effect size"""
-    n1, n2 = len(group1), len(group2)
-    pooled_std = np.sqrt(((n1 - 1) * group1.var() + (n2 - 1) * group2.var()) / (n1 + n2 - 2))
-    return (group1.mean() - group2.mean()) / pooled_std
+# ============ RENDER PROFILES ============
+
+# Resolution, bounding box, output formats and Agg settings of every saved figure.
+# Draft renders go to their own directory so they never replace the publication figures.
+RENDER_PROFILES = {
+    'publication': {'dir': FIG_DIR, 'dpi': 300, 'bbox_inches': 'tight', 'formats': ['png'], 'rc': {},
+                    'plotlyjs': True},
+    # plotly.js is loaded from the CDN instead of being embedded in every HTML file
+    'draft': {'dir': os.path.join(FIG_DIR, 'draft'), 'dpi': 72, 'bbox_inches': None, 'formats': ['png'],
+              'rc': {'path.simplify_threshold': 1.0, 'agg.path.chunksize': 10000}, 'plotlyjs': 'cdn'},
+}
+FIGURE_FORMATS = ['png', 'svg', 'pdf', 'webp']
+RENDER_TIMINGS_PATH = 'data/render_timings.json'
+# Plotly static export scale at the publication resolution (scale=2 at 300 dpi)
+PLOTLY_BASE_DPI = 150
+
+_profile = dict(RENDER_PROFILES['publication'], name='publication')
+# (file, seconds) of every figure file saved by this process
+_saved_files = []
+
+def set_render_profile(name: str = 'publication', formats=None):
+    """Select the render profile (and optionally other output formats) for save_figure."""
+    global _profile
+    if name not in RENDER_PROFILES:
+        raise ValueError(f'Unknown render profile: {name}. Available: {list(RENDER_PROFILES)}')
+    unknown = [f for f in formats or [] if f not in FIGURE_FORMATS]
+    if unknown:
+        raise ValueError(f'Unknown figure formats: {unknown}. Available: {FIGURE_FORMATS}')
+    _profile = dict(RENDER_PROFILES[name], name=name)
+    if formats:
+        _profile['formats'] = list(formats)
+    os.makedirs(_profile['dir'], exist_ok=True)
+
+def save_figure(name: str):
+    """Save the current matplotlib figure as <name>.<format> for each format of the render profile."""
+    for fmt in _profile['formats']:
+        path = os.path.join(_profile['dir'], f'{name}.{fmt}')
+        start = time.perf_counter()
+        with plt.rc_context(_profile['rc']):
+            plt.savefig(path, dpi=_profile['dpi'], bbox_inches=_profile['bbox_inches'])
+        _saved_files.append((os.path.basename(path), time.perf_counter() - start))
+
+def save_plotly_figure(fig, name: str):
+    """Save a Plotly figure as interactive HTML, plus static formats if kaleido is installed."""
+    start = time.perf_counter()
+    fig.write_html(os.path.join(_profile['dir'], f'{name}.html'), include_plotlyjs=_profile['plotlyjs'])
+    _saved_files.append((f'{name}.html', time.perf_counter() - start))
+    for fmt in _profile['formats']:
+        start = time.perf_counter()
+        try:
+            fig.write_image(os.path.join(_profile['dir'], f'{name}.{fmt}'), format=fmt,
+                            scale=_profile['dpi'] / PLOTLY_BASE_DPI)
+        except Exception:
+            # Skip static image if engine is missing; HTML is sufficient
+            continue
+        _saved_files.append((f'{name}.{fmt}', time.perf_counter() - start))
+
+def management_level_labels(df: pd.DataFrame) -> pd.Series:
+    """Survey label of the level per row from the level code column ('Unknown' when no level is set)."""
+    return code_column(df, 'level').astype(object).fillna('Unknown')
 
 # ============ BOX PLOTS ============
 
@@ -39,30 +105,21 @@ def boxplots(df: pd.DataFrame):
     print('Creating boxplots...')
     # Seniority vs Salary
     plt.figure(figsize=(12, 6))
-    sns.boxplot(data=df, x='seniority_level_ic', y='salary_numeric')
+    # Levels are int8 in the schema; plotted as floats to keep the published tick labels (0.0, 1.0, ...)
+    sns.boxplot(data=df, x=df['seniority_level_ic'].astype('float64'), y='salary_numeric')
     plt.title('Salary Distribution by Career Level', fontsize=14, fontweight='bold')
     plt.xlabel('Career Level (0=Management, 1=Junior, 2=Mid, 3=Senior, 4=Staff Engineer, 5=Team Lead, 6=Architect)', fontsize=16)
     plt.ylabel('Monthly Net Salary (thousand TL)', fontsize=18)
     plt.tight_layout()
-    plt.savefig(os.path.join(FIG_DIR, 'boxplot_seniority.png'), dpi=300, bbox_inches='tight')
+    save_figure('boxplot_seniority')
     plt.close()
 
     # Management Level vs Salary (derived from is_manager + management_* one-hots)
     if 'is_manager' in df.columns:
-        management_cols = [c for c in df.columns if c.startswith('management_')]
+        management_cols = flag_columns(df.columns, 'management_')
         managers = df[df['is_manager'] == 1].copy()
         if not managers.empty and management_cols:
-            # Derive a human-readable management level per row from one-hot columns
-            def get_management_level(row):
-                for col in management_cols:
-                    try:
-                        if row[col] == 1:
-                            return col.replace('management_', '').replace('_', ' ')
-                    except KeyError:
-                        continue
-                return 'Unknown'
-
-            managers['management_level_label'] = managers.apply(get_management_level, axis=1)
+            managers['management_level_label'] = management_level_labels(managers)
             if managers['management_level_label'].nunique() > 1 or managers['management_level_label'].iloc[0] != 'Unknown':
                 plt.figure(figsize=(12, 6))
                 sns.boxplot(data=managers, x='management_level_label', y='salary_numeric')
@@ -71,52 +128,30 @@ def boxplots(df: pd.DataFrame):
                 plt.ylabel('Monthly Net Salary (thousand TL)', fontsize=18)
                 plt.xticks(rotation=45)
                 plt.tight_layout()
-                plt.savefig(os.path.join(FIG_DIR, 'boxplot_management_level.png'), dpi=300, bbox_inches='tight')
+                save_figure('boxplot_management_level')
                 plt.close()
 
     # Work Mode vs Salary
-    work_modes = []
-    work_labels = []
-    for mode in ['Remote', 'Hybrid', 'Office']:
-        col = f'work_mode_{mode}'
-        if col in df.columns:
-            vals = df.loc[df[col] == 1, 'salary_numeric']
-            if len(vals) > 0:
-                work_modes.append(vals)
-                work_labels.append(mode)
-    if work_modes:
+    boxes = load_table('salary_boxes')
+    work_boxes = boxes[boxes['group'] == 'work_mode']
+    if not work_boxes.empty:
         plt.figure(figsize=(12, 6))
-        plt.boxplot(work_modes, tick_labels=work_labels)
+        plt.gca().bxp(work_boxes.to_dict('records'))
         plt.title('Salary Distribution by Work Mode', fontsize=14, fontweight='bold')
         plt.ylabel('Monthly Net Salary (thousand TL)', fontsize=18)
         plt.tight_layout()
-        plt.savefig(os.path.join(FIG_DIR, 'boxplot_work_mode.png'), dpi=300, bbox_inches='tight')
+        save_figure('boxplot_work_mode')
         plt.close()
 
     # Company Location vs Salary
-    # data_dict mapping for Turkish → English labels
-    location_label_map = {
-        'Turkiye': 'Türkiye',
-        'Avrupa': 'Europe',
-        'Amerika': 'America',
-        'Yurtdisi_TR_hub': 'Overseas TR hub'
-    }
-    loc_series = []
-    loc_labels = []
-    for loc in ['Turkiye', 'Avrupa', 'Amerika', 'Yurtdisi_TR_hub']:
-        col = f'company_location_{loc}'
-        if col in df.columns:
-            vals = df.loc[df[col] == 1, 'salary_numeric']
-            if len(vals) > 0:
-                loc_series.append(vals)
-                loc_labels.append(location_label_map.get(loc, loc.replace('_', ' ')))
-    if loc_series:
+    loc_boxes = boxes[boxes['group'] == 'company_location']
+    if not loc_boxes.empty:
         plt.figure(figsize=(12, 6))
-        plt.boxplot(loc_series, tick_labels=loc_labels)
+        plt.gca().bxp(loc_boxes.to_dict('records'))
         plt.title('Salary Distribution by Company Location', fontsize=14, fontweight='bold')
         plt.ylabel('Monthly Net Salary (thousand TL)', fontsize=18)
         plt.tight_layout()
-        plt.savefig(os.path.join(FIG_DIR, 'boxplot_company_location.png'), dpi=300, bbox_inches='tight')
+        save_figure('boxplot_company_location')
         plt.close()
 
     # Gender vs Salary
@@ -126,52 +161,30 @@ def boxplots(df: pd.DataFrame):
     plt.xlabel('Gender (0=Male, 1=Female)', fontsize=18)
     plt.ylabel('Monthly Net Salary (thousand TL)', fontsize=18)
     plt.tight_layout()
-    plt.savefig(os.path.join(FIG_DIR, 'boxplot_gender.png'), dpi=300, bbox_inches='tight')
+    save_figure('boxplot_gender')
     plt.close()
 
     # Employment Type vs Salary (if columns exist)
-    # data_dict mapping for Turkish → English labels
-    employment_label_map = {
-        'Freelance': 'Freelance',
-        'Kendi_isim': 'Self-employed',
-        'Tam_zamanli': 'Full-time',
-        'Yari_zamanli': 'Part-time'
-    }
-    emp_cols = [c for c in df.columns if c.startswith('employment_type_')]
-    if emp_cols:
-        data = []
-        labels = []
-        for c in emp_cols:
-            vals = df.loc[df[c] == 1, 'salary_numeric']
-            if len(vals) > 0:
-                data.append(vals)
-                raw = c.replace('employment_type_', '')
-                labels.append(employment_label_map.get(raw, raw.replace('_', ' ')))
-        if data:
-            plt.figure(figsize=(12, 6))
-            plt.boxplot(data, tick_labels=labels)
-            plt.title('Salary Distribution by Employment Type', fontsize=14, fontweight='bold')
-            plt.ylabel('Monthly Net Salary (thousand TL)', fontsize=12)
-            plt.xticks(rotation=20)
-            plt.tight_layout()
-            plt.savefig(os.path.join(FIG_DIR, 'boxplot_employment_type.png'), dpi=300, bbox_inches='tight')
-            plt.close()
+    emp_boxes = boxes[boxes['group'] == 'employment_type']
+    if not emp_boxes.empty:
+        plt.figure(figsize=(12, 6))
+        plt.gca().bxp(emp_boxes.to_dict('records'))
+        plt.title('Salary Distribution by Employment Type', fontsize=14, fontweight='bold')
+        plt.ylabel('Monthly Net Salary (thousand TL)', fontsize=12)
+        plt.xticks(rotation=20)
+        plt.tight_layout()
+        save_figure('boxplot_employment_type')
+        plt.close()
 
 # ============ BAR PLOTS (ROI and Roles) ============
 
-def barplots(df: pd.DataFrame):
+def barplots():
     print('Creating bar plots (ROI and roles)...')
     # Role average salaries (top 15)
-    role_cols = [c for c in df.columns if c.startswith('role_')]
-    role_stats = []
-    for c in role_cols:
-        role_name = c.replace('role_', '').replace('_', ' ')
-        vals = df.loc[df[c] == 1, 'salary_numeric']
-        if len(vals) >= 5:
-            role_stats.append((role_name, float(vals.mean()), int(len(vals))))
-    role_stats.sort(key=lambda x: x[1], reverse=True)
-    if role_stats:
-        names, means, counts = zip(*role_stats[:15])
+    roles = load_table('role_salaries')
+    roles = roles[roles['respondents'] >= 5].sort_values('mean_salary', ascending=False, kind='stable').head(15)
+    if not roles.empty:
+        names, means, counts = roles['role'].tolist(), roles['mean_salary'].tolist(), roles['respondents'].tolist()
         plt.figure(figsize=(12, 8))
         bars = plt.barh(names, means, color='skyblue')
         plt.gca().invert_yaxis()
@@ -180,22 +193,16 @@ def barplots(df: pd.DataFrame):
         for i, (bar, m, n) in enumerate(zip(bars, means, counts)):
             plt.text(m + 2, i, f'{m:.1f}\n({n} people)', va='center', fontsize=9)
         plt.tight_layout()
-        plt.savefig(os.path.join(FIG_DIR, 'barplot_role_salaries.png'), dpi=300, bbox_inches='tight')
+        save_figure('barplot_role_salaries')
         plt.close()
 
     # Technology ROI (programming_, frontend_, tools_)
-    def roi_for_prefix(prefix: str, exclude: set[str], out_name: str, title: str, ylabel: str):
-        cols = [c for c in df.columns if c.startswith(prefix) and c not in exclude]
-        rows = []
-        for c in cols:
-            users = df.loc[df[c] == 1, 'salary_numeric']
-            non_users = df.loc[df[c] == 0, 'salary_numeric']
-            if len(users) >= 10 and len(non_users) >= 10:
-                roi = float(users.mean() - non_users.mean())
-                rows.append((c.replace(prefix, '').replace('_', ' '), roi, int(len(users))))
-        rows.sort(key=lambda x: x[1], reverse=True)
-        if rows:
-            names, rois, counts = zip(*rows[:15])
+    roi = load_table('technology_roi')
+
+    def roi_for_block(block: str, out_name: str, title: str, ylabel: str):
+        rows = roi[roi['block'] == block].sort_values('roi', ascending=False, kind='stable').head(15)
+        if not rows.empty:
+            names, rois, counts = rows['label'].tolist(), rows['roi'].tolist(), rows['users'].tolist()
             plt.figure(figsize=(12, 8))
             colors = ['green' if r > 0 else 'red' for r in rois]
             bars = plt.barh(names, rois, color=colors)
@@ -209,92 +216,44 @@ def barplots(df: pd.DataFrame):
                 plt.text(r + xoff, i, f'{r:.1f}\n({n} users)', va='center', ha=halign, fontsize=9)
             plt.axvline(0, color='black', lw=0.8, alpha=0.3)
             plt.tight_layout()
-            plt.savefig(os.path.join(FIG_DIR, out_name), dpi=300, bbox_inches='tight')
+            save_figure(out_name)
             plt.close()
 
-    roi_for_prefix('programming_', {'programming_Hicbiri'}, 'barplot_programming_roi.png', 'Programming Languages Salary ROI', 'Programming Language')
-    roi_for_prefix('frontend_', {'frontend_Kullanmiyorum'}, 'barplot_frontend_roi.png', 'Frontend Technologies Salary ROI', 'Frontend Technology')
-    roi_for_prefix('tools_', set(), 'barplot_tools_roi.png', 'Tools Salary ROI', 'Tool')
+    roi_for_block('programming', 'barplot_programming_roi', 'Programming Languages Salary ROI', 'Programming Language')
+    roi_for_block('frontend', 'barplot_frontend_roi', 'Frontend Technologies Salary ROI', 'Frontend Technology')
+    roi_for_block('tools', 'barplot_tools_roi', 'Tools Salary ROI', 'Tool')
 
 # ============ GENDER-BASED TECHNOLOGY USAGE ============
 
-def gender_technology_usage(df: pd.DataFrame):
+def gender_technology_usage():
     print('Creating gender-based technology usage plots...')
-    
-    # Programming languages by gender
-    lang_cols = [c for c in df.columns if c.startswith('programming_') and c != 'programming_Hicbiri']
-    if lang_cols:
-        # Top 10 languages by overall usage
-        lang_usage = []
-        for col in lang_cols:
-            usage = df[col].mean()
-            lang_usage.append((col.replace('programming_', '').replace('_', ' '), usage))
-        
-        lang_usage.sort(key=lambda x: x[1], reverse=True)
-        top_langs = [col.replace('programming_', '') for col, _ in lang_usage[:10]]
-        
-        # Create gender comparison for top languages
-        gender_data = []
-        for lang in top_langs:
-            col = f'programming_{lang}'
-            if col in df.columns:
-                male_usage = df[df['gender'] == 0][col].mean() * 100
-                female_usage = df[df['gender'] == 1][col].mean() * 100
-                gender_data.append((lang.replace('_', ' '), male_usage, female_usage))
-        
-        if gender_data:
-            langs, male_pct, female_pct = zip(*gender_data)
-            x = np.arange(len(langs))
-            width = 0.35
-            
-            plt.figure(figsize=(14, 8))
-            plt.bar(x - width/2, male_pct, width, label='Male', color='skyblue')
-            plt.bar(x + width/2, female_pct, width, label='Female', color='lightcoral')
-            plt.xlabel('Programming Language', fontsize=18)
-            plt.ylabel('Usage Percentage (%)', fontsize=18)
-            plt.title('Programming Language Usage by Gender (Top 10)', fontsize=14, fontweight='bold')
-            plt.xticks(x, langs, rotation=45)
-            plt.legend(loc='upper right', frameon=True, fontsize="large", fancybox=True, shadow=True, borderpad=1)
-            plt.tight_layout()
-            plt.savefig(os.path.join(FIG_DIR, 'barplot_gender_programming.png'), dpi=300, bbox_inches='tight')
-            plt.close()
-    
-    # Frontend technologies by gender
-    frontend_cols = [c for c in df.columns if c.startswith('frontend_') and c != 'frontend_Kullanmiyorum']
-    if frontend_cols:
-        # Top 8 frontend technologies
-        frontend_usage = []
-        for col in frontend_cols:
-            usage = df[col].mean()
-            frontend_usage.append((col.replace('frontend_', '').replace('_', ' '), usage))
-        frontend_usage.sort(key=lambda x: x[1], reverse=True)
-        top_frontend = [col.replace('frontend_', '') for col, _ in frontend_usage[:8]]
-        
-        # Create gender comparison for top frontend technologies
-        gender_data = []
-        for tech in top_frontend:
-            col = f'frontend_{tech}'
-            if col in df.columns:
-                male_usage = df[df['gender'] == 0][col].mean() * 100
-                female_usage = df[df['gender'] == 1][col].mean() * 100
-                gender_data.append((tech.replace('_', ' '), male_usage, female_usage))
-        
-        if gender_data:
-            techs, male_pct, female_pct = zip(*gender_data)
-            x = np.arange(len(techs))
-            width = 0.35
-            
-            plt.figure(figsize=(12, 6))
-            plt.bar(x - width/2, male_pct, width, label='Male', color='skyblue')
-            plt.bar(x + width/2, female_pct, width, label='Female', color='lightcoral')
-            plt.xlabel('Frontend Technology', fontsize=18)
-            plt.ylabel('Usage Percentage (%)', fontsize=18)
-            plt.title('Frontend Technology Usage by Gender (Top 8)', fontsize=14, fontweight='bold')
-            plt.xticks(x, techs, rotation=45)
-            plt.legend(loc='upper right', frameon=True, fontsize="large", fancybox=True, shadow=True, borderpad=1)
-            plt.tight_layout()
-            plt.savefig(os.path.join(FIG_DIR, 'barplot_gender_frontend.png'), dpi=300, bbox_inches='tight')
-            plt.close()
+    usage = load_table('technology_usage_by_gender')
+    # Top technologies by overall usage, compared between men and women
+    specs = [
+        ('programming', 10, (14, 8), 'Programming Language', 'Programming Language Usage by Gender (Top 10)',
+         'barplot_gender_programming'),
+        ('frontend', 8, (12, 6), 'Frontend Technology', 'Frontend Technology Usage by Gender (Top 8)',
+         'barplot_gender_frontend'),
+    ]
+    for block, top, figsize, xlabel, title, out_name in specs:
+        gender_data = usage[usage['block'] == block].sort_values('usage', ascending=False, kind='stable').head(top)
+        if gender_data.empty:
+            continue
+        techs = gender_data['technology'].tolist()
+        x = np.arange(len(techs))
+        width = 0.35
+
+        plt.figure(figsize=figsize)
+        plt.bar(x - width/2, gender_data['male_pct'].tolist(), width, label='Male', color='skyblue')
+        plt.bar(x + width/2, gender_data['female_pct'].tolist(), width, label='Female', color='lightcoral')
+        plt.xlabel(xlabel, fontsize=18)
+        plt.ylabel('Usage Percentage (%)', fontsize=18)
+        plt.title(title, fontsize=14, fontweight='bold')
+        plt.xticks(x, techs, rotation=45)
+        plt.legend(loc='upper right', frameon=True, fontsize="large", fancybox=True, shadow=True, borderpad=1)
+        plt.tight_layout()
+        save_figure(out_name)
+        plt.close()
 
 # ============ SCATTER (Career Timeline) ============
 
@@ -307,52 +266,38 @@ def scatter_career_timeline(df: pd.DataFrame):
     plt.ylabel('Monthly Net Salary (thousand TL)', fontsize=18)
     plt.legend(title='Career Level', bbox_to_anchor=(1.02, 1), loc='upper left')
     plt.tight_layout()
-    plt.savefig(os.path.join(FIG_DIR, 'scatter_experience_salary.png'), dpi=300, bbox_inches='tight')
+    save_figure('scatter_experience_salary')
     plt.close()
 
 # ============ HEATMAP (Tech/Tools vs Salary correlation) ============
 
-def heatmap_tech_salary(df: pd.DataFrame):
+def heatmap_tech_salary():
     print('Creating technology/tool salary heatmap...')
-    tech_cols = [c for c in df.columns if c.startswith('programming_') or c.startswith('frontend_') or c.startswith('tools_')]
-    if not tech_cols:
+    corr = load_table('tech_salary_correlation')
+    if corr.empty:
         return
-    corr_rows = []
-    index = []
-    for c in tech_cols:
-        if df[c].nunique() > 1:
-            corr = df[[c, 'salary_numeric']].corr().iloc[0, 1]
-            corr_rows.append([corr])
-            index.append(c.replace('programming_', '').replace('frontend_', '').replace('tools_', '').replace('_', ' '))
-    if not corr_rows:
-        return
-    mat = np.array(corr_rows)
+    index = corr['technology'].tolist()
+    mat = corr[['correlation']].to_numpy()
     plt.figure(figsize=(8, max(6, len(index) * 0.2)))
     sns.heatmap(mat, annot=False, cmap='RdYlGn', center=0, yticklabels=index, xticklabels=['Correlation with Salary'])
     plt.title('Correlation of Technologies/Tools with Salary', fontsize=14, fontweight='bold')
     plt.tight_layout()
-    plt.savefig(os.path.join(FIG_DIR, 'heatmap_tech_tool_salary.png'), dpi=300, bbox_inches='tight')
+    save_figure('heatmap_tech_tool_salary')
     plt.close()
 
 # ============ HOURLY PARTICIPATION (bar + optional role heatmap) ============
 
-def hourly_participation(df: pd.DataFrame):
+def hourly_participation():
     print('Creating hourly participation plots...')
-    df = df.copy()
-    df['hour'] = pd.to_datetime(df['timestamp']).dt.hour
-
     # Average salary by hour bar plot
-    hourly = df.groupby('hour', as_index=False).agg(
-        avg_salary=('salary_numeric', 'mean'),
-        participants=('salary_numeric', 'size')
-    )
+    hourly = load_table('hourly_participation')
     plt.figure(figsize=(12, 6))
     sns.barplot(data=hourly, x='hour', y='avg_salary', color='steelblue')
     plt.title('Average Salary by Survey Hour', fontsize=14, fontweight='bold')
     plt.xlabel('Hour of Day (0-23)', fontsize=18)
     plt.ylabel('Average Monthly Net Salary (thousand TL)', fontsize=18)
     plt.tight_layout()
-    plt.savefig(os.path.join(FIG_DIR, 'barplot_hourly_avg_salary.png'), dpi=300, bbox_inches='tight')
+    save_figure('barplot_hourly_avg_salary')
     plt.close()
 
     # Participants count by hour bar plot
@@ -362,19 +307,14 @@ def hourly_participation(df: pd.DataFrame):
     plt.xlabel('Hour of Day (0-23)', fontsize=18)
     plt.ylabel('Number of Participants', fontsize=18)
     plt.tight_layout()
-    plt.savefig(os.path.join(FIG_DIR, 'barplot_hourly_participants.png'), dpi=300, bbox_inches='tight')
+    save_figure('barplot_hourly_participants')
     plt.close()
 
     # Optional: Role distribution heatmap by hour (share of each role among participants at that hour)
-    role_cols = [c for c in df.columns if c.startswith('role_')]
-    if role_cols:
-        role_long = []
-        for rc in role_cols:
-            rname = rc.replace('role_', '').replace('_', ' ')
-            tmp = df.groupby('hour')[rc].mean()  # share using 0/1 columns
-            role_long.append(tmp.rename(rname))
-        
-        role_mat = pd.concat(role_long, axis=1).fillna(0.0)
+    shares = load_table('role_share_by_hour')
+    if not shares.empty:
+        role_mat = shares.pivot(index='hour', columns='role', values='share')
+        role_mat = role_mat[pd.unique(shares['role'])].rename_axis(columns=None).fillna(0.0)
         # Keep top 12 roles by overall mean share to keep it readable
         top_roles = role_mat.mean().sort_values(ascending=False).head(12).index
         role_mat = role_mat[top_roles]
@@ -385,41 +325,18 @@ def hourly_participation(df: pd.DataFrame):
         plt.xlabel('Hour of Day (0-23)', fontsize=18)
         plt.ylabel('Role', fontsize=18)
         plt.tight_layout()
-        plt.savefig(os.path.join(FIG_DIR, 'heatmap_roles_by_hour.png'), dpi=300, bbox_inches='tight')
+        save_figure('heatmap_roles_by_hour')
         plt.close()
 
 # ============ SANKEY (Career Level → Role distribution) ============
 
-def sankey_seniority_to_role(df: pd.DataFrame):
+def sankey_seniority_to_role():
     print('Creating Sankey diagram (career level to role)...')
-    # Build nodes: career levels + roles
-    level_map = {
-        0: 'Management', 1: 'Junior', 2: 'Mid', 3: 'Senior', 4: 'Staff Engineer', 5: 'Team Lead', 6: 'Architect'
-    }
-    role_cols = [c for c in df.columns if c.startswith('role_')]
-
-    # Count flows from level to each role
-    flows = []  # (level_name, role_name, count)
-    for lvl, lvl_name in level_map.items():
-        subset = df[df['seniority_level_ic'] == lvl]
-        if subset.empty:
-            continue
-        for rc in role_cols:
-            role_name = rc.replace('role_', '').replace('_', ' ')
-            count = int((subset[rc] == 1).sum())
-            if count > 0:
-                flows.append((lvl_name, role_name, count))
-    if not flows:
+    # Nodes: career levels + roles, links: respondents per (level, role)
+    flows = load_table('level_role_flows')
+    if flows.empty:
         return
-
-    levels = sorted(list({f[0] for f in flows}), key=lambda x: list(level_map.values()).index(x))
-    roles = sorted(list({f[1] for f in flows}))
-    nodes = levels + roles
-    node_index = {n: i for i, n in enumerate(nodes)}
-
-    source = [node_index[s] for s, _, _ in flows]
-    target = [node_index[t] for _, t, _ in flows]
-    value = [v for _, _, v in flows]
+    nodes, source, target, value = sankey_links(flows, LEVEL_LABELS.values())
 
     fig = go.Figure(data=[go.Sankey(
         node=dict(pad=15, thickness=18, line=dict(color='black', width=0.5), label=nodes),
@@ -427,233 +344,130 @@ def sankey_seniority_to_role(df: pd.DataFrame):
     )])
     fig.update_layout(title_text='Career Level to Role Distribution (Sankey)', font_size=12)
 
-    # Save interactive and attempt static export if kaleido is installed
-    html_path = os.path.join(FIG_DIR, 'sankey_career_level_role.html')
-    fig.write_html(html_path)
-    
-    try:
-        fig.write_image(os.path.join(FIG_DIR, 'sankey_career_level_role.png'), scale=2)
-    except Exception:
-        # Skip static image if engine is missing; HTML is sufficient
-        pass
+    save_plotly_figure(fig, 'sankey_career_level_role')
 
 # ============ STATISTICAL TESTS WITH EFFECT SIZES ============
 
-def perform_statistical_tests(df: pd.DataFrame):
-    """Perform hypothesis tests with effect sizes"""
-    print('Performing statistical tests with effect sizes...')
-    
-    results = {}
-    
-    # React vs Non-React
+def salary_group_comparison(groups: pd.Series, salary: pd.Series, min_size: int, alpha: float = 0.05):
+    """ANOVA and Kruskal-Wallis over groups with at least min_size respondents, plus significant
+    Tukey HSD pairs over all groups; None when fewer than two groups are large enough"""
+    valid = pd.DataFrame({'group': groups, 'salary': salary}).dropna()
+    sized = [(k, g['salary'].values) for k, g in valid.groupby('group') if len(g) >= min_size]
+    if len(sized) < 2:
+        return None
+    arrays = [values for _, values in sized]
+    try:
+        _, p_anova = f_oneway(*arrays)
+    except Exception:
+        p_anova = np.nan
+    try:
+        _, p_kruskal = kruskal(*arrays)
+    except Exception:
+        p_kruskal = np.nan
+    try:
+        tukey = pairwise_tukeyhsd(endog=valid['salary'], groups=valid['group'].astype(str), alpha=alpha)
+        # Extract significant pairs
+        tukey_pairs = [[grp1, grp2, meandiff, p_adj]
+                       for grp1, grp2, meandiff, p_adj, lower, upper, reject in tukey.summary().data[1:] if reject]
+    except Exception:
+        tukey_pairs = None
+    return {'groups': [str(k) for k, _ in sized], 'anova_p': p_anova, 'kruskal_p': p_kruskal,
+            'tukey_pairs': tukey_pairs}
+
+def compute_statistical_tests(df: pd.DataFrame, min_count: int = 11, seniority_min_size: int = 10,
+                              management_min_size: int = 5, alpha: float = 0.05) -> dict:
+    """Two-group hypothesis tests and seniority/management group comparisons as plain data"""
+    # Two-group hypotheses (both groups need at least min_count respondents)
+    pairs = {}
     if 'frontend_React' in df.columns:
-        react_salaries = df[df['frontend_React'] == 1]['salary_numeric']
-        non_react_salaries = df[df['frontend_React'] == 0]['salary_numeric']
-        
-        if len(react_salaries) > 10 and len(non_react_salaries) > 10:
-            t_stat, p_value = ttest_ind(react_salaries, non_react_salaries, equal_var=False)
-            effect_size = calculate_effect_size(react_salaries, non_react_salaries)
-            
-            results['react_vs_non_react'] = {
-                'react_mean': react_salaries.mean(),
-                'non_react_mean': non_react_salaries.mean(),
-                'mean_diff': react_salaries.mean() - non_react_salaries.mean(),
-                'p_value': p_value,
-                'effect_size': effect_size,
-                'significant': p_value < 0.05,
-                'react_count': len(react_salaries),
-                'non_react_count': len(non_react_salaries)
-            }
-    
-    # Remote vs Office
+        pairs['react_vs_non_react'] = (('react', df['frontend_React'] == 1), ('non_react', df['frontend_React'] == 0))
     if 'work_mode_Remote' in df.columns and 'work_mode_Office' in df.columns:
-        remote_salaries = df[df['work_mode_Remote'] == 1]['salary_numeric']
-        office_salaries = df[df['work_mode_Office'] == 1]['salary_numeric']
-        
-        if len(remote_salaries) > 10 and len(office_salaries) > 10:
-            t_stat, p_value = ttest_ind(remote_salaries, office_salaries, equal_var=False)
-            effect_size = calculate_effect_size(remote_salaries, office_salaries)
-            
-            results['remote_vs_office'] = {
-                'remote_mean': remote_salaries.mean(),
-                'office_mean': office_salaries.mean(),
-                'mean_diff': remote_salaries.mean() - office_salaries.mean(),
-                'p_value': p_value,
-                'effect_size': effect_size,
-                'significant': p_value < 0.05,
-                'remote_count': len(remote_salaries),
-                'office_count': len(office_salaries)
-            }
-    
-    # Europe vs Turkey
+        pairs['remote_vs_office'] = (('remote', df['work_mode_Remote'] == 1), ('office', df['work_mode_Office'] == 1))
     if 'company_location_Avrupa' in df.columns and 'company_location_Turkiye' in df.columns:
-        europe_salaries = df[df['company_location_Avrupa'] == 1]['salary_numeric']
-        turkey_salaries = df[df['company_location_Turkiye'] == 1]['salary_numeric']
-        
-        if len(europe_salaries) > 10 and len(turkey_salaries) > 10:
-            t_stat, p_value = ttest_ind(europe_salaries, turkey_salaries, equal_var=False)
-            effect_size = calculate_effect_size(europe_salaries, turkey_salaries)
-            
-            results['europe_vs_turkey'] = {
-                'europe_mean': europe_salaries.mean(),
-                'turkey_mean': turkey_salaries.mean(),
-                'mean_diff': europe_salaries.mean() - turkey_salaries.mean(),
-                'p_value': p_value,
-                'effect_size': effect_size,
-                'significant': p_value < 0.05,
-                'europe_count': len(europe_salaries),
-                'turkey_count': len(turkey_salaries)
-            }
-    
-    # Gender gap
-    male_salaries = df[df['gender'] == 0]['salary_numeric']
-    female_salaries = df[df['gender'] == 1]['salary_numeric']
-    
-    if len(male_salaries) > 10 and len(female_salaries) > 10:
-        t_stat, p_value = ttest_ind(male_salaries, female_salaries, equal_var=False)
-        effect_size = calculate_effect_size(male_salaries, female_salaries)
-        
-        results['gender_gap'] = {
-            'male_mean': male_salaries.mean(),
-            'female_mean': female_salaries.mean(),
-            'mean_diff': male_salaries.mean() - female_salaries.mean(),
-            'p_value': p_value,
-            'effect_size': effect_size,
-            'significant': p_value < 0.05,
-            'male_count': len(male_salaries),
-            'female_count': len(female_salaries)
-        }
-    
-    # Print results
-    for test_name, result in results.items():
-        print(f"\n{test_name.replace('_', ' ').title()}:")
-        print(f"  Mean difference: {result['mean_diff']:.1f} thousand TL")
-        print(f"  P-value: {result['p_value']:.4f}")
-        print(f"  Effect size (Cohen's d): {result['effect_size']:.3f}")
-        print(f"  Significant: {result['significant']}")
-    
+        pairs['europe_vs_turkey'] = (('europe', df['company_location_Avrupa'] == 1), ('turkey', df['company_location_Turkiye'] == 1))
+    pairs['gender_gap'] = (('male', df['gender'] == 0), ('female', df['gender'] == 1))
+    results = {'pairs': group_pair_tests(df['salary_numeric'], pairs, min_count=min_count),
+               'seniority': None, 'management': None}
+
     # ================= GROUP COMPARISONS: Seniority Levels =================
     if 'seniority_level_ic' in df.columns:
-        valid = df[['seniority_level_ic', 'salary_numeric']].dropna()
-        groups = [g['salary_numeric'].values for _, g in valid.groupby('seniority_level_ic') if len(g) >= 10]
-        labels = [str(k) for k, g in valid.groupby('seniority_level_ic') if len(g) >= 10]
-        if len(groups) >= 2:
-            try:
-                f_stat, p_anova = f_oneway(*groups)
-            except Exception:
-                f_stat, p_anova = np.nan, np.nan
-            try:
-                h_stat, p_kruskal = kruskal(*groups)
-            except Exception:
-                h_stat, p_kruskal = np.nan, np.nan
-
-            print("\nSeniority level group comparison:")
-            print(f"  Groups (n>=10): {labels}")
-            print(f"  ANOVA p-value: {p_anova:.4f}" if not np.isnan(p_anova) else "  ANOVA p-value: NA")
-            print(f"  Kruskal-Wallis p-value: {p_kruskal:.4f}" if not np.isnan(p_kruskal) else "  Kruskal-Wallis p-value: NA")
-
-            # Tukey HSD post-hoc
-            try:
-                tukey = pairwise_tukeyhsd(endog=valid['salary_numeric'], groups=valid['seniority_level_ic'].astype(str), alpha=0.05)
-                print("  Tukey HSD (significant pairs):")
-                # Extract significant pairs
-                for res in tukey.summary().data[1:]:
-                    grp1, grp2, meandiff, p_adj, lower, upper, reject = res
-                    if reject:
-                        print(f"    {grp1} vs {grp2}: diff={meandiff:.1f}, p_adj={p_adj:.4f}")
-            except Exception:
-                print("  Tukey HSD: NA")
+        # Levels are int8 in the schema; compared as floats to keep the published group labels ('0.0', '1.0', ...)
+        results['seniority'] = salary_group_comparison(df['seniority_level_ic'].astype('float64'),
+                                                       df['salary_numeric'], seniority_min_size, alpha)
 
     # ================= GROUP COMPARISONS: Management Levels =================
     if 'is_manager' in df.columns:
-        management_cols = [c for c in df.columns if c.startswith('management_')]
+        management_cols = flag_columns(df.columns, 'management_')
         managers = df[df['is_manager'] == 1].copy()
         if not managers.empty and management_cols:
-            def get_management_level(row):
-                for col in management_cols:
-                    try:
-                        if row[col] == 1:
-                            return col.replace('management_', '').replace('_', ' ')
-                    except KeyError:
-                        continue
-                return 'Unknown'
-
-            managers['management_level_label'] = managers.apply(get_management_level, axis=1)
+            managers['management_level_label'] = management_level_labels(managers)
             managers = managers[managers['management_level_label'] != 'Unknown']
             if not managers.empty:
-                valid_m = managers[['management_level_label', 'salary_numeric']].dropna()
-                mgroups = [g['salary_numeric'].values for _, g in valid_m.groupby('management_level_label') if len(g) >= 5]
-                mlabels = [k for k, g in valid_m.groupby('management_level_label') if len(g) >= 5]
-                if len(mgroups) >= 2:
-                    try:
-                        f_stat_m, p_anova_m = f_oneway(*mgroups)
-                    except Exception:
-                        f_stat_m, p_anova_m = np.nan, np.nan
-                    try:
-                        h_stat_m, p_kruskal_m = kruskal(*mgroups)
-                    except Exception:
-                        h_stat_m, p_kruskal_m = np.nan, np.nan
-
-                    print("\nManagement level group comparison:")
-                    print(f"  Groups (n>=5): {mlabels}")
-                    print(f"  ANOVA p-value: {p_anova_m:.4f}" if not np.isnan(p_anova_m) else "  ANOVA p-value: NA")
-                    print(f"  Kruskal-Wallis p-value: {p_kruskal_m:.4f}" if not np.isnan(p_kruskal_m) else "  Kruskal-Wallis p-value: NA")
-
-                    # Tukey HSD post-hoc
-                    try:
-                        tukey_m = pairwise_tukeyhsd(endog=valid_m['salary_numeric'], groups=valid_m['management_level_label'], alpha=0.05)
-                        print("  Tukey HSD (significant pairs):")
-                        for res in tukey_m.summary().data[1:]:
-                            grp1, grp2, meandiff, p_adj, lower, upper, reject = res
-                            if reject:
-                                print(f"    {grp1} vs {grp2}: diff={meandiff:.1f}, p_adj={p_adj:.4f}")
-                    except Exception:
-                        print("  Tukey HSD: NA")
+                results['management'] = salary_group_comparison(managers['management_level_label'],
+                                                                 managers['salary_numeric'],
+                                                                 management_min_size, alpha)
+    return results
+
+def print_group_comparison(title: str, min_size: int, comparison: dict):
+    """Print one group comparison from compute_statistical_tests"""
+    p_anova, p_kruskal = comparison['anova_p'], comparison['kruskal_p']
+    print(f"\n{title} group comparison:")
+    print(f"  Groups (n>={min_size}): {comparison['groups']}")
+    print(f"  ANOVA p-value: {p_anova:.4f}" if not np.isnan(p_anova) else "  ANOVA p-value: NA")
+    print(f"  Kruskal-Wallis p-value: {p_kruskal:.4f}" if not np.isnan(p_kruskal) else "  Kruskal-Wallis p-value: NA")
+    if comparison['tukey_pairs'] is None:
+        print("  Tukey HSD: NA")
+        return
+    print("  Tukey HSD (significant pairs):")
+    for grp1, grp2, meandiff, p_adj in comparison['tukey_pairs']:
+        print(f"    {grp1} vs {grp2}: diff={meandiff:.1f}, p_adj={p_adj:.4f}")
+
+def perform_statistical_tests(df: pd.DataFrame, cache: ResultsCache | None = None, output_path: str | None = None):
+    """Perform hypothesis tests with effect sizes, reusing cached results for the same data.
+    With output_path the full results (pairs, seniority, management) are also written there as JSON.
+    """
+    print('Performing statistical tests with effect sizes...')
+    params = {'min_count': 11, 'seniority_min_size': 10, 'management_min_size': 5, 'alpha': 0.05}
+    cache = cache or ResultsCache()
+    tests = cache.cached(dataset_fingerprint(df), 'sprint2.statistical_tests',
+                         lambda: compute_statistical_tests(df, **params), params=params)
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(tests, f, indent=2, ensure_ascii=False)
+    results = tests['pairs']
+
+    # Print results
+    for test_name, result in results.items():
+        print(f"\n{test_name.replace('_', ' ').title()}:")
+        print(f"  Mean difference: {result['mean_diff']:.1f} thousand TL")
+        print(f"  P-value: {result['p_value']:.4f}")
+        print(f"  Effect size (Cohen's d): {result['effect_size']:.3f}")
+        print(f"  Significant: {result['significant']}")
+
+    if tests['seniority'] is not None:
+        print_group_comparison('Seniority level', params['seniority_min_size'], tests['seniority'])
+    if tests['management'] is not None:
+        print_group_comparison('Management level', params['management_min_size'], tests['management'])
 
     return results
 
 # ============ NEW PLOTS FROM DOCS ============
 
-def career_progression_salary_growth(df: pd.DataFrame):
+def career_progression_salary_growth():
     """Line plot: salary growth across career levels (1=Junior,2=Mid,3=Senior) per company location,
     filtered to likely-in-company-location respondents.
     """
     print('Creating career progression (salary growth) line plot...')
-    has_likely = 'is_likely_in_company_location' in df.columns
-    subset = df[df['seniority_level_ic'].isin([1, 2, 3])]
-    if has_likely:
-        subset = subset[subset['is_likely_in_company_location'] == 1]
-    if subset.empty:
+    progression = load_table('career_progression')
+    if progression.empty:
         return
-
-    # Map columns for company locations if one-hot encoded
-    loc_map = {
-        'Turkiye': 'Türkiye',
-        'Avrupa': 'Europe',
-        'Amerika': 'America'
-    }
-    # Build tidy frame: for each location column present, compute means by seniority 1-3
     plt.figure(figsize=(10, 6))
     has_any = False
-    for raw, label in loc_map.items():
-        col = f'company_location_{raw}'
-        if col in df.columns:
-            # Primary attempt: with likely filter if available
-            grp = subset[subset[col] == 1].groupby('seniority_level_ic')['salary_numeric'].mean()
-            x = [1, 2, 3]
-            y = [grp.get(1, np.nan), grp.get(2, np.nan), grp.get(3, np.nan)]
-
-            # Fallback 1: if any NaN, recompute without likely-location filter
-            if any(np.isnan(y)):
-                grp2 = df[(df[col] == 1) & (df['seniority_level_ic'].isin([1, 2, 3]))].groupby('seniority_level_ic')['salary_numeric'].mean()
-                y = [
-                    grp2.get(1, y[0]),
-                    grp2.get(2, y[1]),
-                    grp2.get(3, y[2])
-                ]
-            if not np.all(np.isnan(y)):
-                plt.plot(x, y, marker='o', label=label)
-                has_any = True
+    for location, g in progression.groupby('company_location', sort=False):
+        y = g['mean_salary'].tolist()
+        if not np.all(np.isnan(y)):
+            plt.plot(g['seniority_level_ic'].tolist(), y, marker='o', label=location)
+            has_any = True
     if not has_any:
         plt.close()
         return
@@ -663,63 +477,18 @@ def career_progression_salary_growth(df: pd.DataFrame):
     plt.legend()
     plt.figtext(0.5, 0.01, LOCATION_NOTE, ha='center', fontsize=9, style='italic')
     plt.tight_layout()
-    plt.savefig(os.path.join(FIG_DIR, 'line_career_progression_salary_growth.png'), dpi=300, bbox_inches='tight')
+    save_figure('line_career_progression_salary_growth')
     plt.close()
 
 
-def top_tech_combinations_by_role(df: pd.DataFrame):
+def top_tech_combinations_by_role():
     """Bar plots for top tech combinations (programming + frontend + tool) by role.
-    We derive a primary role and one primary flag per tech category per respondent, then aggregate.
+    Combinations come from each respondent's primary role and first flag per tech category.
     Focuses on salary-based analysis rather than frontend-focused approach.
     """
     print('Creating Top Tech Combinations by Role plots...')
-    role_cols = [c for c in df.columns if c.startswith('role_')]
-    prog_cols = [c for c in df.columns if c.startswith('programming_') and c != 'programming_Hicbiri']
-    fe_cols = [c for c in df.columns if c.startswith('frontend_') and c != 'frontend_Kullanmiyorum']
-    # Exclude Kullanmiyorum tools at source
-    tool_cols = [c for c in df.columns if c.startswith('tools_') and not c.endswith('Kullanmiyorum')]
-    if not role_cols or (not prog_cols and not fe_cols and not tool_cols):
-        return
-
-    def pick_first_true(cols: list[str], row: pd.Series) -> str:
-        for c in cols:
-            try:
-                if row[c] == 1:
-                    return c
-            except KeyError:
-                continue
-        return ''
-
-    records = []
-    for _, row in df.iterrows():
-        role_c = pick_first_true(role_cols, row)
-        if not role_c:
-            continue
-        role_name = role_c.replace('role_', '').replace('_', ' ')
-        lang_c = pick_first_true(prog_cols, row)
-        fe_c = pick_first_true(fe_cols, row)
-        tool_c = pick_first_true(tool_cols, row)
-        lang = lang_c.replace('programming_', '').replace('_', ' ') if lang_c else ''
-        fe = fe_c.replace('frontend_', '').replace('_', ' ') if fe_c else ''
-        tool = tool_c.replace('tools_', '').replace('_', ' ') if tool_c else ''
-        # Skip records that include missing/none-like selections
-        if lang in ['', 'None'] or fe in ['', 'None'] or tool in ['', 'None', 'Kullanmiyorum']:
-            continue
-        combo = f'{lang} + {fe} + {tool}'
-        records.append((role_name, combo, row.get('salary_numeric', np.nan)))
-
-    if not records:
-        return
-    combos_df = pd.DataFrame(records, columns=['role', 'combo', 'salary'])
-    combos_df = combos_df.dropna(subset=['salary'])
-    grouped = combos_df.groupby(['role', 'combo']).agg(avg_salary=('salary', 'mean'), count=('salary', 'size')).reset_index()
-    # Focus on adequately represented combos
-    grouped = grouped[grouped['count'] >= 10]
-    if grouped.empty:
-        return
-
     # Show top 10 combinations by salary
-    top_combinations = grouped.sort_values('avg_salary', ascending=False).head(10)
+    top_combinations = load_table('tech_combinations_by_role').sort_values('avg_salary', ascending=False).head(10)
     if top_combinations.empty:
         return
     
@@ -735,73 +504,70 @@ def top_tech_combinations_by_role(df: pd.DataFrame):
     for i, (bar, m, n) in enumerate(zip(bars, vals, counts)):
         plt.text(m + 2, i, f'{m:.1f}\n(n={n})', va='center', fontsize=9)
     plt.tight_layout()
-    plt.savefig(os.path.join(FIG_DIR, 'barplot_tech_combinations_by_role.png'), dpi=300, bbox_inches='tight')
+    save_figure('barplot_tech_combinations_by_role')
     plt.close()
 
 
-def correlation_heatmap_general(df: pd.DataFrame):
+def frequent_tech_stacks_by_role():
+    """Bar plot of the best-paid frequent language + frontend + tool stacks by role.
+    Unlike the primary-flag view above, every combination of the respondent's selections counts;
+    error bars are 95% confidence intervals of the mean salary.
+    """
+    print('Creating Frequent Tech Stacks by Role plots...')
+    stacks = load_table('frequent_stacks_by_role')
+    if stacks.empty:
+        return
+    full = stacks[stacks['size'] == stacks['size'].max()]
+    top = full.sort_values('mean', ascending=False).head(10)
+
+    names = (top['role'] + ' | ' + top['stack']).tolist()
+    vals = top['mean'].to_numpy()
+    errors = [vals - top['ci_low'].to_numpy(), top['ci_high'].to_numpy() - vals]
+    plt.figure(figsize=(14, 10))
+    plt.barh(names, vals, xerr=errors, color='seagreen', ecolor='gray', capsize=3)
+    plt.gca().invert_yaxis()
+    plt.title('Frequent Technology Stacks by Role (95% CI)', fontsize=14, fontweight='bold')
+    plt.xlabel('Average Monthly Net Salary (thousand TL)', fontsize=18)
+    for i, (m, hi, n) in enumerate(zip(vals, top['ci_high'], top['count'])):
+        plt.text(hi + 2, i, f'{m:.1f}\n(n={n})', va='center', fontsize=9)
+    plt.tight_layout()
+    save_figure('barplot_frequent_tech_stacks_by_role')
+    plt.close()
+
+
+def correlation_heatmap_general():
     """Correlation heatmap across salary, experience, seniority and tech/tool features.
     Shows top absolute correlations with salary.
     """
     print('Creating correlation heatmap (general)...')
-    base_cols = [c for c in ['salary_numeric', 'experience_years', 'seniority_level_ic'] if c in df.columns]
-    tech_cols = [c for c in df.columns if c.startswith('programming_') or c.startswith('frontend_') or c.startswith('tools_')]
-    cols = base_cols + tech_cols
-    if 'salary_numeric' not in cols:
-        return
-    sub = df[cols].copy()
-    # Keep only columns with variance
-    keep = [c for c in sub.columns if sub[c].nunique() > 1]
-    sub = sub[keep]
-    if sub.shape[1] < 3:
+    corr = load_table('feature_correlations')
+    if corr.empty:
         return
-    corr = sub.corr()
-    # Rank by absolute correlation with salary
-    if 'salary_numeric' not in corr.columns:
-        return
-    target = corr['salary_numeric'].abs().sort_values(ascending=False)
-    top_cols = target.index[:20].tolist()
-    corr_top = corr.loc[top_cols, top_cols]
+    top_cols = pd.unique(corr['feature'])
+    corr_top = corr.pivot(index='feature', columns='other', values='correlation')
+    corr_top = corr_top.reindex(index=top_cols, columns=top_cols).rename_axis(index=None, columns=None)
     plt.figure(figsize=(10, 8))
     sns.heatmap(corr_top, cmap='vlag', center=0, annot=False)
     plt.title('Correlation Heatmap (Top features)', fontsize=14, fontweight='bold')
     plt.tight_layout()
-    plt.savefig(os.path.join(FIG_DIR, 'heatmap_correlation.png'), dpi=300, bbox_inches='tight')
+    save_figure('heatmap_correlation')
     plt.close()
 
 
-def work_arrangement_distribution_by_role(df: pd.DataFrame):
+def work_arrangement_distribution_by_role():
     """100% stacked bar: work mode shares per top roles by sample size."""
     print('Creating work arrangement distribution by role...')
-    role_cols = [c for c in df.columns if c.startswith('role_')]
-    modes = [m for m in ['Remote', 'Hybrid', 'Office'] if f'work_mode_{m}' in df.columns]
-    if not role_cols or not modes:
+    table = load_table('work_arrangement_by_role')
+    if table.empty:
         return
-    # Determine role per row
-    def pick_role(row: pd.Series) -> str:
-        for c in role_cols:
-            if row.get(c, 0) == 1:
-                return c.replace('role_', '').replace('_', ' ')
-        return ''
-    tmp = df.copy()
-    tmp['role_primary'] = tmp.apply(pick_role, axis=1)
-    tmp = tmp[tmp['role_primary'] != '']
-    if tmp.empty:
+    modes = pd.unique(table['work_mode']).tolist()
+    share_df = table.pivot(index='role', columns='work_mode', values='share')
+    share_df['n'] = table.groupby('role')['respondents'].first()
+    share_df = share_df[share_df['n'] >= 20]
+    if share_df.empty:
         return
-    # Compute shares
-    agg = []
-    for role, g in tmp.groupby('role_primary'):
-        counts = {m: int((g[f'work_mode_{m}'] == 1).sum()) for m in modes}
-        total = sum(counts.values())
-        if total >= 20:
-            shares = {m: (counts[m] / total) for m in modes}
-            shares['role'] = role
-            shares['n'] = total
-            agg.append(shares)
-    if not agg:
-        return
-    share_df = pd.DataFrame(agg).sort_values('n', ascending=False).head(15)
-    roles = share_df['role'].tolist()
+    share_df = share_df.sort_values('n', ascending=False).head(15)
+    roles = share_df.index.tolist()
     bottoms = np.zeros(len(roles))
     plt.figure(figsize=(12, 7))
     # Use a perceptually uniform colormap for consistent stacking colors
@@ -817,75 +583,46 @@ def work_arrangement_distribution_by_role(df: pd.DataFrame):
     plt.title('Work Arrangement Distribution by Role (Remote/Hybrid/Office)', fontsize=14, fontweight='bold')
     plt.legend()
     plt.tight_layout()
-    plt.savefig(os.path.join(FIG_DIR, 'barplot_work_arrangement_by_role.png'), dpi=300, bbox_inches='tight')
+    save_figure('barplot_work_arrangement_by_role')
     plt.close()
 
 
-def top_tool_adoption_by_role(df: pd.DataFrame):
+def top_tool_adoption_by_role():
     """Heatmap of tool adoption (mean of binary columns) per role for popular roles."""
     print('Creating top tool adoption by role heatmap...')
-    role_cols = [c for c in df.columns if c.startswith('role_')]
-    tool_cols = [c for c in df.columns if c.startswith('tools_') and not c.endswith('Kullanmiyorum')]
-    if not role_cols or not tool_cols:
-        return
-    # Role primary
-    def pick_role(row: pd.Series) -> str:
-        for c in role_cols:
-            if row.get(c, 0) == 1:
-                return c.replace('role_', '').replace('_', ' ')
-        return ''
-    tmp = df.copy()
-    tmp['role_primary'] = tmp.apply(pick_role, axis=1)
-    tmp = tmp[tmp['role_primary'] != '']
-    if tmp.empty:
-        return
-
-    role_counts = tmp['role_primary'].value_counts()
-    popular_roles = role_counts[role_counts >= 20].index.tolist()[:15]
+    table = load_table('tool_adoption_by_role')
+    # Roles come in descending respondent order
+    popular_roles = pd.unique(table.loc[table['respondents'] >= 20, 'role']).tolist()[:15]
     if not popular_roles:
         return
-    mat = []
-    for role in popular_roles:
-        g = tmp[tmp['role_primary'] == role]
-        vals = [g[c].mean() * 100 for c in tool_cols]
-        mat.append(vals)
-    heat = np.array(mat)
-    col_labels = [c.replace('tools_', '').replace('_', ' ') for c in tool_cols]
-
-    plt.figure(figsize=(max(12, len(tool_cols) * 0.4), 8))
+    col_labels = pd.unique(table['tool']).tolist()
+    heat = table.pivot(index='role', columns='tool', values='adoption_pct').loc[popular_roles, col_labels].to_numpy()
+
+    plt.figure(figsize=(max(12, len(col_labels) * 0.4), 8))
     sns.heatmap(heat, annot=False, cmap='YlGnBu', yticklabels=popular_roles, xticklabels=col_labels, cbar_kws={'label': 'Adoption (%)'})
     plt.title('Top Tool Adoption by Role', fontsize=14, fontweight='bold')
     plt.tight_layout()
-    plt.savefig(os.path.join(FIG_DIR, 'heatmap_tool_adoption_by_role.png'), dpi=300, bbox_inches='tight')
+    save_figure('heatmap_tool_adoption_by_role')
     plt.close()
 
 
-def heatmap_worktype_location_salary(df: pd.DataFrame):
+def heatmap_worktype_location_salary():
     """Heatmap of average salary by work type (Remote/Hybrid/Office) and company location."""
     print('Creating Work Type x Location salary heatmap...')
-    modes = [m for m in ['Remote', 'Hybrid', 'Office'] if f'work_mode_{m}' in df.columns]
-    locs = [l for l in ['Turkiye', 'Avrupa', 'Amerika', 'Yurtdisi_TR_hub'] if f'company_location_{l}' in df.columns]
-    if not modes or not locs:
-        return
-    # Build cells
-    avg_mat = np.full((len(modes), len(locs)), np.nan)
-    for i, m in enumerate(modes):
-        for j, l in enumerate(locs):
-            s = df[(df[f'work_mode_{m}'] == 1) & (df[f'company_location_{l}'] == 1)]['salary_numeric']
-            # Compute mean if any data exists; leave NaN if none (renders as white)
-            if len(s) > 0:
-                avg_mat[i, j] = s.mean()
-    # If all NaN, skip
-    if np.isnan(avg_mat).all():
+    cells = load_table('work_mode_location_salary')
+    # Empty cells are NaN (render as white); skip when there is no data at all
+    if cells['mean_salary'].isna().all():
         return
+    modes = pd.unique(cells['work_mode']).tolist()
+    loc_labels = pd.unique(cells['company_location']).tolist()
+    avg_mat = cells.pivot(index='work_mode', columns='company_location', values='mean_salary').loc[modes, loc_labels].to_numpy()
     plt.figure(figsize=(10, 6))
-    loc_labels = ['Türkiye', 'Europe', 'America', 'Overseas TR hub'][:len(locs)]
     sns.heatmap(avg_mat, annot=False, cmap='RdYlGn', center=np.nanmean(avg_mat), yticklabels=modes, xticklabels=loc_labels)
     plt.title('Work Type × Company Location: Average Salary', fontsize=14, fontweight='bold')
     plt.xlabel('Company Location', fontsize=18)
     plt.ylabel('Work Type', fontsize=18)
     plt.tight_layout()
-    plt.savefig(os.path.join(FIG_DIR, 'heatmap_worktype_location_salary.png'), dpi=300, bbox_inches='tight')
+    save_figure('heatmap_worktype_location_salary')
     plt.close()
 
 
@@ -897,9 +634,9 @@ def violin_skill_diversity(df: pd.DataFrame):
     if 'skill_diversity_total' in df.columns:
         vals = df['skill_diversity_total']
     else:
-        prog_cols = [c for c in df.columns if c.startswith('programming_')]
-        fe_cols = [c for c in df.columns if c.startswith('frontend_')]
-        tool_cols = [c for c in df.columns if c.startswith('tools_')]
+        prog_cols = flag_columns(df.columns, 'programming_')
+        fe_cols = flag_columns(df.columns, 'frontend_')
+        tool_cols = flag_columns(df.columns, 'tools_')
         if not prog_cols and not fe_cols and not tool_cols:
             return
         vals = df[prog_cols].sum(axis=1).fillna(0)
@@ -939,12 +676,127 @@ def violin_skill_diversity(df: pd.DataFrame):
     ]
     plt.xticks(ticks=range(len(labels_order)), labels=xtick_labels)
     plt.tight_layout()
-    plt.savefig(os.path.join(FIG_DIR, 'violin_skill_diversity.png'), dpi=300, bbox_inches='tight')
+    save_figure('violin_skill_diversity')
     plt.close()
 
+# ============ FIGURE RENDERING ==========
+
+# Independent figure groups: each writes its own files under figures/. Most draw only the
+# persisted plot_data tables; the distribution plots below also read the row-level df.
+PLOTS = {
+    'boxplots': boxplots,
+    'barplots': barplots,
+    'gender_technology_usage': gender_technology_usage,
+    'scatter_career_timeline': scatter_career_timeline,
+    'heatmap_tech_salary': heatmap_tech_salary,
+    'hourly_participation': hourly_participation,
+    'sankey_seniority_to_role': sankey_seniority_to_role,
+    'career_progression_salary_growth': career_progression_salary_growth,
+    'top_tech_combinations_by_role': top_tech_combinations_by_role,
+    'frequent_tech_stacks_by_role': frequent_tech_stacks_by_role,
+    'correlation_heatmap_general': correlation_heatmap_general,
+    'work_arrangement_distribution_by_role': work_arrangement_distribution_by_role,
+    'top_tool_adoption_by_role': top_tool_adoption_by_role,
+    'heatmap_worktype_location_salary': heatmap_worktype_location_salary,
+    'violin_skill_diversity': violin_skill_diversity,
+}
+
+ROW_LEVEL_PLOTS = {'boxplots', 'scatter_career_timeline', 'violin_skill_diversity'}
+
+# Files written by each figure group with the publication profile (some are skipped when their
+# data or engine is missing)
+PLOT_OUTPUTS = {
+    'boxplots': ['boxplot_seniority.png', 'boxplot_management_level.png', 'boxplot_work_mode.png',
+                 'boxplot_company_location.png', 'boxplot_gender.png', 'boxplot_employment_type.png'],
+    'barplots': ['barplot_role_salaries.png', 'barplot_programming_roi.png', 'barplot_frontend_roi.png',
+                 'barplot_tools_roi.png'],
+    'gender_technology_usage': ['barplot_gender_programming.png', 'barplot_gender_frontend.png'],
+    'scatter_career_timeline': ['scatter_experience_salary.png'],
+    'heatmap_tech_salary': ['heatmap_tech_tool_salary.png'],
+    'hourly_participation': ['barplot_hourly_avg_salary.png', 'barplot_hourly_participants.png',
+                             'heatmap_roles_by_hour.png'],
+    'sankey_seniority_to_role': ['sankey_career_level_role.html', 'sankey_career_level_role.png'],
+    'career_progression_salary_growth': ['line_career_progression_salary_growth.png'],
+    'top_tech_combinations_by_role': ['barplot_tech_combinations_by_role.png'],
+    'frequent_tech_stacks_by_role': ['barplot_frequent_tech_stacks_by_role.png'],
+    'correlation_heatmap_general': ['heatmap_correlation.png'],
+    'work_arrangement_distribution_by_role': ['barplot_work_arrangement_by_role.png'],
+    'top_tool_adoption_by_role': ['heatmap_tool_adoption_by_role.png'],
+    'heatmap_worktype_location_salary': ['heatmap_worktype_location_salary.png'],
+    'violin_skill_diversity': ['violin_skill_diversity.png'],
+}
+
+# Dataset of a render worker process (memory-mapped, read-only)
+_worker_df = None
+
+def _init_render_worker(arrow_path: str, profile: str, formats):
+    global _worker_df
+    matplotlib.use('Agg')
+    set_render_profile(profile, formats)
+    _worker_df = load_cleaned_data_mmap(arrow_path)
+
+def _render(name: str, df: pd.DataFrame):
+    """Render one figure group: (seconds, [(file, seconds), ...] of the files it saved)."""
+    first_file = len(_saved_files)
+    start = time.perf_counter()
+    if name in ROW_LEVEL_PLOTS:
+        PLOTS[name](df)
+    else:
+        PLOTS[name]()
+    return time.perf_counter() - start, _saved_files[first_file:]
+
+def _render_in_worker(name: str):
+    return (name,) + _render(name, _worker_df)
+
+def render_figures(df: pd.DataFrame, names=None, workers=None, profile='publication', formats=None):
+    """Render the given figure groups (all by default) and return {name: seconds}.
+    With more than one worker the groups run in a process pool; df is spilled once to a
+    temporary Arrow file that every worker memory-maps, so the frame is shared read-only
+    through the page cache instead of being pickled to each task. A single worker renders
+    in-process from df; both paths render the same data.
+    The plot_data tables are rebuilt first if df or their code changed. Figures are saved
+    with the given render profile (and formats, default: the profile's); the time of every
+    group and saved file is written to RENDER_TIMINGS_PATH.
+    """
+    names = list(PLOTS) if names is None else list(names)
+    unknown = [n for n in names if n not in PLOTS]
+    if unknown:
+        raise ValueError(f'Unknown plots: {unknown}. Available: {list(PLOTS)}')
+    set_render_profile(profile, formats)
+    if ensure_tables(df):
+        print('Plot data tables rebuilt under data/aggregates/')
+    workers = min(len(names), workers or os.cpu_count() or 1)
+    timings, file_timings = {}, {}
+    if workers <= 1:
+        for name in names:
+            timings[name], files = _render(name, df)
+            file_timings.update(files)
+    else:
+        print(f'Rendering {len(names)} figure groups in {workers} processes...')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            arrow_path = os.path.join(tmp_dir, 'render_data.arrow')
+            save_arrow(df, arrow_path)
+            # spawn: workers must not inherit the parent's pyarrow/matplotlib thread state
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_render_worker,
+                                     initargs=(arrow_path, profile, formats)) as executor:
+                futures = [executor.submit(_render_in_worker, name) for name in names]
+                for future in as_completed(futures):
+                    name, seconds, files = future.result()
+                    timings[name] = seconds
+                    file_timings.update(files)
+    for name in names:
+        print(f'   {name}: {timings[name]:.1f}s')
+    slowest = sorted(file_timings.items(), key=lambda item: item[1], reverse=True)[:5]
+    print(f"Slowest saves ({_profile['name']}): " + ', '.join(f'{f} {s:.2f}s' for f, s in slowest))
+    with open(RENDER_TIMINGS_PATH, 'w', encoding='utf-8') as f:
+        json.dump({'profile': _profile['name'], 'formats': _profile['formats'], 'dpi': _profile['dpi'],
+                   'groups': timings, 'files': file_timings}, f, indent=2)
+    return timings
+
 # ============ MAIN ==========
 
-def main():
+def main(plots=None, workers=None, profile='publication', formats=None):
     print('Sprint 2 analyses (English) started...')
     ensure_dirs()
     df = load_data()
@@ -954,23 +806,19 @@ def main():
     test_results = perform_statistical_tests(df)
 
     # Generate plots
-    # boxplots(df)
-    # barplots(df)
-    # gender_technology_usage(df)
-    # scatter_career_timeline(df)
-    # heatmap_tech_salary(df)
-    # hourly_participation(df)
-    # sankey_seniority_to_role(df)
-    # # New plots from docs
-    # career_progression_salary_growth(df)
-    top_tech_combinations_by_role(df)
-    # correlation_heatmap_general(df)
-    # work_arrangement_distribution_by_role(df)
-    # top_tool_adoption_by_role(df)
-    # heatmap_worktype_location_salary(df)
-    # violin_skill_diversity(df)
-
-    print('✅ Sprint 2 analyses completed. Files saved under figures/.')
+    render_figures(df, plots, workers, profile, formats)
+
+    print(f"✅ Sprint 2 analyses completed. Files saved under {RENDER_PROFILES[profile]['dir']}/.")
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='Sprint 2 analyses and figures')
+    parser.add_argument('--plots', nargs='+', default=None, choices=list(PLOTS), metavar='PLOT',
+                        help=f'Figure groups to render (default: all): {", ".join(PLOTS)}')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Rendering processes (default: one per CPU core; 1 renders in-process)')
+    parser.add_argument('--profile', default='publication', choices=list(RENDER_PROFILES),
+                        help='Render profile: publication (300 dpi, tight bbox) or draft (72 dpi, under figures/draft/)')
+    parser.add_argument('--formats', nargs='+', default=None, choices=FIGURE_FORMATS, metavar='FORMAT',
+                        help=f'Output formats instead of the profile default (png): {", ".join(FIGURE_FORMATS)}')
+    args = parser.parse_args()
+    main(args.plots, args.workers, args.profile, args.formats)
@@ -0,0 +1,93 @@
+"""
+Statistical Kernels (English)
+Batched two-sample tests on sufficient statistics. Groups are described by count, mean
+and sample variance (ddof=1) instead of materialized value subsets, so any number of
+group pairs is tested with a handful of array operations: Welch's t statistic, its
+Welch-Satterthwaite degrees of freedom, the two-sided p-value and Cohen's d (pooled
+standard deviation) all come back as NumPy arrays from one call.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+from scipy import special
+
+PairTests = namedtuple('PairTests', ['t_stat', 'dof', 'p_value', 'cohens_d'])
+
+
+def moment_stats(count, total, total_sq):
+    """Mean and sample variance (ddof=1) from count, sum and sum of squares."""
+    count = np.asarray(count, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.asarray(total, dtype=np.float64) / count
+        var = (np.asarray(total_sq, dtype=np.float64) - count * mean ** 2) / (count - 1)
+    return mean, np.clip(var, 0, None)
+
+
+def masked_stats(masks, values):
+    """
+    Count, mean and sample variance of values under each boolean row mask
+    (k masks x n rows), from one product masks @ [1, y, y^2]. NaN values are ignored.
+    """
+    y = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(y)
+    y = np.where(valid, y, 0.0)
+    moments = np.asarray(masks, dtype=np.float64) @ np.column_stack([valid, y, y ** 2]).astype(np.float64)
+    mean, var = moment_stats(moments[:, 0], moments[:, 1], moments[:, 2])
+    return moments[:, 0], mean, var
+
+
+def pairwise_tests(n1, mean1, var1, n2, mean2, var2):
+    """
+    Welch t-test (two-sided) and Cohen's d of group 1 vs group 2 for every pair.
+    Inputs broadcast against each other; pairs with too few observations give NaN.
+    """
+    n1, mean1, var1, n2, mean2, var2 = (np.asarray(a, dtype=np.float64)
+                                        for a in (n1, mean1, var1, n2, mean2, var2))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        se1, se2 = var1 / n1, var2 / n2
+        t = (mean1 - mean2) / np.sqrt(se1 + se2)
+        dof = (se1 + se2) ** 2 / (se1 ** 2 / (n1 - 1) + se2 ** 2 / (n2 - 1))
+        p = 2 * special.stdtr(dof, -np.abs(t))
+        pooled = np.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2))
+        d = (mean1 - mean2) / pooled
+    return PairTests(t, dof, p, d)
+
+
+def group_pair_tests(values, pairs, min_count=0):
+    """
+    Welch test and Cohen's d for named group pairs with one product and one kernel call.
+    pairs maps a test name to ((label1, mask1), (label2, mask2)) with boolean row masks.
+    Returns name -> {'<label1>_mean', '<label2>_mean', 'mean_diff', 'p_value',
+    'effect_size', 'significant', '<label1>_count', '<label2>_count'} for the pairs whose
+    groups both have at least min_count values.
+    """
+    masks = [np.asarray(mask) for (_, mask1), (_, mask2) in pairs.values() for mask in (mask1, mask2)]
+    if not masks:
+        return {}
+    n, mean, var = masked_stats(np.vstack(masks), values)
+    tests = pairwise_tests(n[0::2], mean[0::2], var[0::2], n[1::2], mean[1::2], var[1::2])
+    results = {}
+    for i, (name, ((label1, _), (label2, _))) in enumerate(pairs.items()):
+        n1, n2 = int(n[2 * i]), int(n[2 * i + 1])
+        if n1 < min_count or n2 < min_count:
+            continue
+        results[name] = {
+            f'{label1}_mean': mean[2 * i],
+            f'{label2}_mean': mean[2 * i + 1],
+            'mean_diff': mean[2 * i] - mean[2 * i + 1],
+            'p_value': tests.p_value[i],
+            'effect_size': tests.cohens_d[i],
+            'significant': tests.p_value[i] < 0.05,
+            f'{label1}_count': n1,
+            f'{label2}_count': n2
+        }
+    return results
+
+
+def mean_confidence_interval(n, mean, var, level=0.95):
+    """Two-sided Student t confidence interval (low, high) of the mean for every group."""
+    n, mean, var = (np.asarray(a, dtype=np.float64) for a in (n, mean, var))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        half = special.stdtrit(n - 1, (1 + level) / 2) * np.sqrt(var / n)
+    return mean - half, mean + half
@@ -0,0 +1,206 @@
+"""
+Akış (chunk) modunda tek geçişte hesaplanabilen, birleştirilebilir özet istatistikler.
+RunningMoments ortalama/varyansı Welford (parçalar için Chan) güncellemesiyle,
+QuantileSketch ise quantile'ları KLL tarzı bir sıkıştırıcı yığınıyla tutar. Her ikisi de
+parça parça beslenebilir ve farklı parçalardan/süreçlerden gelen özetler `merge` ile
+birleştirilebilir; bellek kullanımı satır sayısından bağımsızdır.
+"""
+
+import numpy as np
+
+
+def weighted_quantile(values, weights, q):
+    """
+    Değerler ve ağırlıklarından (frekanslarından), pandas'ın varsayılan (linear)
+    interpolasyonuyla quantile. Tüm ağırlıklar 1 ise Series.quantile ile aynı sonucu verir.
+    """
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    order = np.argsort(values, kind='stable')
+    values = values[order]
+    cumulative = np.cumsum(weights[order])
+    h = (cumulative[-1] - 1) * q
+    lower, upper = int(np.floor(h)), int(np.ceil(h))
+    # k. sıra istatistiği (0 tabanlı): kümülatif ağırlığı k'yı aşan ilk değer
+    value_lower = values[np.searchsorted(cumulative, lower, side='right')]
+    value_upper = values[np.searchsorted(cumulative, upper, side='right')]
+    return float(value_lower + (value_upper - value_lower) * (h - lower))
+
+
+class RunningMoments:
+    """
+    Sayı, ortalama, varyans, min ve max için tek geçişli birleştirilebilir özet.
+    Parçalar vektörel olarak özetlenip Chan et al. formülüyle birleştirilir
+    (Welford güncellemesinin parça hali); büyük/küçük değer farklarında
+    naif toplam-kareler yöntemine göre sayısal olarak kararlıdır.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        mean = values.mean()
+        self._combine(len(values), mean, float(((values - mean) ** 2).sum()), values.min(), values.max())
+        return self
+
+    def merge(self, other):
+        if other.count:
+            self._combine(other.count, other.mean, other.m2, other.min, other.max)
+        return self
+
+    def _combine(self, count, mean, m2, minimum, maximum):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+        self.min = min(self.min, float(minimum))
+        self.max = max(self.max, float(maximum))
+
+    def variance(self, ddof=1):
+        if self.count <= ddof:
+            return np.nan
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof=1):
+        return float(np.sqrt(self.variance(ddof)))
+
+
+class QuantileSketch:
+    """
+    KLL tarzı birleştirilebilir quantile özeti.
+    Seviye h'deki her öğe 2**h ağırlığındadır. Bir seviye kapasitesini aştığında
+    sıralanır ve rastgele ofsetle her iki öğeden biri bir üst seviyeye taşınır.
+    k doğruluk/bellek dengesini belirler: en fazla ~3k öğe tutulur, sıra (rank)
+    hatası ~1/k mertebesindedir. Hiç sıkıştırma yapılmadıysa (n <= k) sonuçlar kesindir.
+    """
+
+    def __init__(self, k=200, seed=0):
+        if k < 8:
+            raise ValueError("k en az 8 olmalıdır")
+        self.k = k
+        self.count = 0
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+        # Sıkıştırmalarda taşınan ağırlıkların toplamı ve kareleri toplamı (hata sınırları için)
+        self._compacted_weight = 0.0
+        self._compacted_weight_sq = 0.0
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def retained(self):
+        """Bellekte tutulan öğe sayısı."""
+        return int(sum(len(level) for level in self._levels))
+
+    def _capacity(self, level):
+        depth = len(self._levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values):
+            self._levels[0] = np.concatenate([self._levels[0], values])
+            self.count += len(values)
+            self._compress()
+        return self
+
+    def merge(self, other):
+        if other.k != self.k:
+            raise ValueError("Yalnızca aynı k ile oluşturulmuş özetler birleştirilebilir")
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for h, level in enumerate(other._levels):
+            self._levels[h] = np.concatenate([self._levels[h], level])
+        self.count += other.count
+        self._compacted_weight += other._compacted_weight
+        self._compacted_weight_sq += other._compacted_weight_sq
+        self._compress()
+        return self
+
+    def _compress(self):
+        while self.retained > sum(self._capacity(h) for h in range(len(self._levels))):
+            for h in range(len(self._levels)):
+                if len(self._levels[h]) >= self._capacity(h):
+                    self._compact(h)
+                    break
+
+    def _compact(self, h):
+        items = np.sort(self._levels[h])
+        # Tek sayıda öğe varsa biri seviyede kalır
+        keep, items = items[:len(items) % 2], items[len(items) % 2:]
+        offset = int(self._rng.integers(2))
+        if h + 1 == len(self._levels):
+            self._levels.append(np.empty(0))
+        self._levels[h + 1] = np.concatenate([self._levels[h + 1], items[offset::2]])
+        self._levels[h] = keep
+        # Bir sıkıştırma herhangi bir sorgunun sırasını en fazla taşınan öğe ağırlığı kadar değiştirir
+        weight = 2.0 ** h
+        self._compacted_weight += weight
+        self._compacted_weight_sq += weight ** 2
+
+    def _weighted_items(self):
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self._levels)])
+        return values, weights
+
+    def quantile(self, q):
+        """q. quantile tahmini (pandas'ın linear interpolasyonuyla)."""
+        if self.count == 0:
+            return np.nan
+        values, weights = self._weighted_items()
+        return weighted_quantile(values, weights, q)
+
+    def rank(self, x):
+        """x'ten küçük veya eşit değerlerin oranı tahmini."""
+        if self.count == 0:
+            return np.nan
+        values, weights = self._weighted_items()
+        return float(weights[values <= x].sum() / weights.sum())
+
+    def max_at_most(self, x):
+        """Özetteki x'ten küçük veya eşit en büyük değer (yoksa NaN)."""
+        values = np.concatenate(self._levels)
+        values = values[values <= x]
+        return float(values.max()) if len(values) else np.nan
+
+    def min_at_least(self, x):
+        """Özetteki x'ten büyük veya eşit en küçük değer (yoksa NaN)."""
+        values = np.concatenate(self._levels)
+        values = values[values >= x]
+        return float(values.min()) if len(values) else np.nan
+
+    def rank_error(self, confidence=0.99):
+        """
+        Normalize sıra hatası için olasılıksal üst sınır.
+        Her sıkıştırma bir sorgunun sırasını ağırlığı kadar (±w) ve ortalaması sıfır
+        olacak şekilde değiştirir; Hoeffding eşitsizliğiyle verilen güven düzeyinde
+        |hata| <= sqrt(2 ln(2/δ) Σw²) / n. Sınır, kesin üst sınırdan (max_rank_error)
+        büyük çıkarsa o kullanılır. Sıkıştırma yoksa 0.
+        """
+        if self.count == 0 or self._compacted_weight_sq == 0:
+            return 0.0
+        delta = 1 - confidence
+        bound = np.sqrt(2 * np.log(2 / delta) * self._compacted_weight_sq) / self.count
+        return float(min(bound, self.max_rank_error()))
+
+    def max_rank_error(self):
+        """Normalize sıra hatası için kesin (en kötü durum) üst sınır."""
+        if self.count == 0:
+            return 0.0
+        return float(self._compacted_weight / self.count)
+
+    def quantile_interval(self, q, confidence=0.99):
+        """q. quantile için, rank_error ile genişletilmiş değer aralığı (alt, üst)."""
+        eps = self.rank_error(confidence)
+        return self.quantile(max(0.0, q - eps)), self.quantile(min(1.0, q + eps))
@@ -11,7 +11,14 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import seaborn as sns
 import matplotlib.pyplot as plt
-from scipy.stats import ttest_ind
+from aggregate_cube import AggregateCube
+from bitmap_index import BitmapIndex
+from stat_kernels import pairwise_tests
+from technology_roi import roi_from_moments
+from tech_itemsets import mine_stacks
+from plot_data import hourly_participation, sankey_links
+from data_store import load_cleaned_data_mmap
+from vocabulary import flag_columns
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -28,18 +35,58 @@ LOCATION_NOTE = (
     "(Office/Hybrid → company location). Not definitive."
 )
 
-@st.cache_data
+@st.cache_resource
 def load_data():
-    """Load and cache the dataset"""
-    df = pd.read_csv('data/2025_cleaned_data.csv')
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    return df
-
-def calculate_effect_size(group1, group2):
-    """Calculate Cohen's d effect size"""
-    n1, n2 = len(group1), len(group2)
-    pooled_std = np.sqrt(((n1 - 1) * group1.var() + (n2 - 1) * group2.var()) / (n1 + n2 - 2))
-    return (group1.mean() - group2.mean()) / pooled_std
+    """Load the dataset once per process.
+
+    The Arrow file is memory-mapped, so worker processes share a single page-cache
+    copy and sessions get the same read-only frame without pickling or copying.
+    """
+    return load_cleaned_data_mmap()
+
+@st.cache_resource
+def load_cube():
+    """Build the aggregate cube over the filter dimensions once per process.
+
+    Widget changes are answered by summing cube cells instead of copying and
+    re-filtering the frame, so the KPIs, insights and bar charts cost the same
+    regardless of the number of respondents.
+    """
+    return AggregateCube.from_frame(load_data())
+
+@st.cache_resource
+def load_index():
+    """Build the bitmap index over the filter dimensions once per process.
+
+    Row-level charts take their rows from the AND/OR of packed level bitmaps
+    instead of re-scanning the filter columns on every widget change.
+    """
+    return BitmapIndex.from_frame(load_data())
+
+# Stats of an empty group (count/mean/std/median as returned by the cube)
+EMPTY_GROUP = pd.Series({'count': 0.0, 'mean': np.nan, 'std': np.nan, 'median': np.nan})
+
+def group_stats(table, key):
+    """Row of a cube stats table, or empty stats when the group has no respondents"""
+    return table.loc[key] if key in table.index else EMPTY_GROUP
+
+def pair_tests(pairs):
+    """Welch p-values and Cohen's d for named (group1, group2) stat pairs in one kernel call"""
+    first = pd.DataFrame([g1 for g1, _ in pairs.values()])
+    second = pd.DataFrame([g2 for _, g2 in pairs.values()])
+    tests = pairwise_tests(first['count'], first['mean'], first['std'] ** 2,
+                           second['count'], second['mean'], second['std'] ** 2)
+    return pd.DataFrame({'p_value': tests.p_value, 'cohens_d': tests.cohens_d}, index=list(pairs))
+
+def roi_table(roi, prefix, exclude=None, label='Technology'):
+    """Rows of the technology ROI table for one prefix, labelled for the charts"""
+    rows = roi[roi['technology'].str.startswith(prefix) & (roi['technology'] != exclude)]
+    return pd.DataFrame({
+        label: [c.replace(prefix, '').replace('_', ' ') for c in rows['technology']],
+        'ROI': rows['roi'].to_numpy(),
+        'Users': rows['users'].to_numpy(),
+        'Percentage Increase': rows['percentage_increase'].to_numpy()
+    })
 
 def interpret_effect_size(d):
     """Interpret Cohen's d effect size"""
@@ -62,6 +109,8 @@ def main():
 
     # Data
     df = load_data()
+    cube = load_cube()
+    index = load_index()
 
     # Sidebar
     st.sidebar.header("📊 Filters")
@@ -72,13 +121,15 @@ def main():
         default=sorted(df['experience_years'].dropna().unique())
     )
 
+    # Levels are int8 in the schema; offered as floats to keep the published labels (0.0, 1.0, ...)
+    seniority_levels = sorted(df['seniority_level_ic'].dropna().astype('float64').unique())
     seniority_filter = st.sidebar.multiselect(
         "Career Level (IC scale)",
-        options=sorted(df['seniority_level_ic'].dropna().unique()),
-        default=sorted(df['seniority_level_ic'].dropna().unique())
+        options=seniority_levels,
+        default=seniority_levels
     )
 
-    work_mode_options = [c.replace('work_mode_', '') for c in df.columns if c.startswith('work_mode_')]
+    work_mode_options = [c.replace('work_mode_', '') for c in flag_columns(df.columns, 'work_mode_')]
     work_mode_filter = st.sidebar.multiselect(
         "Work Mode",
         options=work_mode_options,
@@ -92,23 +143,25 @@ def main():
         format_func=lambda x: "Male" if x == 0 else "Female"
     )
 
-    # Apply filters
-    filtered_df = df.copy()
-    if experience_filter:
-        filtered_df = filtered_df[filtered_df['experience_years'].isin(experience_filter)]
-    if seniority_filter:
-        filtered_df = filtered_df[filtered_df['seniority_level_ic'].isin(seniority_filter)]
-    if work_mode_filter:
-        mask = filtered_df[[f'work_mode_{m}' for m in work_mode_filter]].sum(axis=1) > 0
-        filtered_df = filtered_df[mask]
-    if gender_filter:
-        filtered_df = filtered_df[filtered_df['gender'].isin(gender_filter)]
+    # Apply filters: aggregates come from the cube, rows only for the distribution charts
+    filters = {
+        'experience_years': experience_filter,
+        'seniority_level_ic': seniority_filter,
+        'work_mode': work_mode_filter,
+        'gender': gender_filter
+    }
+    filtered_df = df[index.mask(index.select(filters))]
+    selected = cube.summary(filters)
+    by_mode = cube.by_dimension('work_mode', filters)
+    by_gender = cube.by_dimension('gender', filters)
+    by_level = cube.by_dimension('seniority_level_ic', filters)
+    flag_users, flag_non_users = cube.flag_stats(filters)
 
     # KPIs
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        avg_salary = filtered_df['salary_numeric'].mean()
-        overall_avg = df['salary_numeric'].mean()
+        avg_salary = selected['mean']
+        overall_avg = cube.summary()['mean']
         delta = avg_salary - overall_avg
         st.metric(
             label="📈 Average Salary",
@@ -116,11 +169,11 @@ def main():
             delta=f"{delta:+.1f}k TL" if abs(delta) > 0.1 else None
         )
     with col2:
-        st.metric(label="📊 Median Salary", value=f"{filtered_df['salary_numeric'].median():.1f}k TL")
+        st.metric(label="📊 Median Salary", value=f"{selected['median']:.1f}k TL")
     with col3:
-        st.metric(label="👥 Participants", value=f"{len(filtered_df):,}")
+        st.metric(label="👥 Participants", value=f"{int(selected['count']):,}")
     with col4:
-        male_ratio = (filtered_df['gender'] == 0).mean() * 100
+        male_ratio = group_stats(by_gender, 0)['count'] / selected['count'] * 100
         st.metric(label="👨 Male Ratio", value=f"{male_ratio:.1f}%")
 
     # Key Insights Panel
@@ -128,34 +181,42 @@ def main():
     st.subheader("🔍 Key Insights")
     
     # Calculate key statistics
-    remote_salaries = filtered_df[filtered_df['work_mode_Remote'] == 1]['salary_numeric'] if 'work_mode_Remote' in filtered_df.columns else pd.Series(dtype=float)
-    office_salaries = filtered_df[filtered_df['work_mode_Office'] == 1]['salary_numeric'] if 'work_mode_Office' in filtered_df.columns else pd.Series(dtype=float)
-    europe_salaries = filtered_df[filtered_df['company_location_Avrupa'] == 1]['salary_numeric'] if 'company_location_Avrupa' in filtered_df.columns else pd.Series(dtype=float)
-    turkey_salaries = filtered_df[filtered_df['company_location_Turkiye'] == 1]['salary_numeric'] if 'company_location_Turkiye' in filtered_df.columns else pd.Series(dtype=float)
-    male_salaries = filtered_df[filtered_df['gender'] == 0]['salary_numeric']
-    female_salaries = filtered_df[filtered_df['gender'] == 1]['salary_numeric']
+    remote_salaries = group_stats(by_mode, 'Remote')
+    office_salaries = group_stats(by_mode, 'Office')
+    europe_salaries = group_stats(flag_users, 'company_location_Avrupa')
+    turkey_salaries = group_stats(flag_users, 'company_location_Turkiye')
+    male_salaries = group_stats(by_gender, 0)
+    female_salaries = group_stats(by_gender, 1)
+    react = group_stats(flag_users, 'frontend_React')
+    non_react = group_stats(flag_non_users, 'frontend_React')
+    tests = pair_tests({
+        'remote': (remote_salaries, office_salaries),
+        'europe': (europe_salaries, turkey_salaries),
+        'gender': (male_salaries, female_salaries),
+        'react': (react, non_react)
+    })
 
     insight_col1, insight_col2, insight_col3 = st.columns(3)
     
     with insight_col1:
-        if len(remote_salaries) > 10 and len(office_salaries) > 10:
-            remote_office_diff = remote_salaries.mean() - office_salaries.mean()
-            _, p_remote = ttest_ind(remote_salaries, office_salaries, equal_var=False)
-            effect_remote = calculate_effect_size(remote_salaries, office_salaries)
+        if remote_salaries['count'] > 10 and office_salaries['count'] > 10:
+            remote_office_diff = remote_salaries['mean'] - office_salaries['mean']
+            p_remote = tests.at['remote', 'p_value']
+            effect_remote = tests.at['remote', 'cohens_d']
             st.info(f"🏠 **Remote Work Premium**: {remote_office_diff:.1f}k TL more (p={p_remote:.4f}, d={effect_remote:.3f})")
     
     with insight_col2:
-        if len(europe_salaries) > 10 and len(turkey_salaries) > 10:
-            europe_turkey_diff = europe_salaries.mean() - turkey_salaries.mean()
-            _, p_europe = ttest_ind(europe_salaries, turkey_salaries, equal_var=False)
-            effect_europe = calculate_effect_size(europe_salaries, turkey_salaries)
+        if europe_salaries['count'] > 10 and turkey_salaries['count'] > 10:
+            europe_turkey_diff = europe_salaries['mean'] - turkey_salaries['mean']
+            p_europe = tests.at['europe', 'p_value']
+            effect_europe = tests.at['europe', 'cohens_d']
             st.info(f"🌍 **European Premium**: {europe_turkey_diff:.1f}k TL more (p={p_europe:.4f}, d={effect_europe:.3f})")
     
     with insight_col3:
-        if len(male_salaries) > 10 and len(female_salaries) > 10:
-            gender_diff = male_salaries.mean() - female_salaries.mean()
-            _, p_gender = ttest_ind(male_salaries, female_salaries, equal_var=False)
-            effect_gender = calculate_effect_size(male_salaries, female_salaries)
+        if male_salaries['count'] > 10 and female_salaries['count'] > 10:
+            gender_diff = male_salaries['mean'] - female_salaries['mean']
+            p_gender = tests.at['gender', 'p_value']
+            effect_gender = tests.at['gender', 'cohens_d']
             st.info(f"👥 **Gender Gap**: {gender_diff:.1f}k TL difference (p={p_gender:.4f}, d={effect_gender:.3f})")
 
     st.markdown("---")
@@ -182,19 +243,19 @@ def main():
                 title="Salary Distribution",
                 labels={'salary_numeric': 'Monthly Net Salary (thousand TL)', 'count': 'Count'}
             )
-            fig.add_vline(x=filtered_df['salary_numeric'].mean(), line_dash="dash", line_color="red",
-                          annotation_text=f"Avg: {filtered_df['salary_numeric'].mean():.1f}")
+            fig.add_vline(x=selected['mean'], line_dash="dash", line_color="red",
+                          annotation_text=f"Avg: {selected['mean']:.1f}")
             st.plotly_chart(fig, use_container_width=True)
             
             # Summary statistics
             st.markdown("**Summary Statistics:**")
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Mean", f"{filtered_df['salary_numeric'].mean():.1f}k TL")
+                st.metric("Mean", f"{selected['mean']:.1f}k TL")
             with col2:
-                st.metric("Median", f"{filtered_df['salary_numeric'].median():.1f}k TL")
+                st.metric("Median", f"{selected['median']:.1f}k TL")
             with col3:
-                st.metric("Std Dev", f"{filtered_df['salary_numeric'].std():.1f}k TL")
+                st.metric("Std Dev", f"{selected['std']:.1f}k TL")
         
         with c2:
             fig = px.box(
@@ -208,11 +269,11 @@ def main():
             st.plotly_chart(fig, use_container_width=True)
             
             # Gender insights
-            if len(male_salaries) > 0 and len(female_salaries) > 0:
+            if male_salaries['count'] > 0 and female_salaries['count'] > 0:
                 st.markdown("**Gender Analysis:**")
-                st.write(f"• Male average: {male_salaries.mean():.1f}k TL")
-                st.write(f"• Female average: {female_salaries.mean():.1f}k TL")
-                st.write(f"• Difference: {male_salaries.mean() - female_salaries.mean():.1f}k TL")
+                st.write(f"• Male average: {male_salaries['mean']:.1f}k TL")
+                st.write(f"• Female average: {female_salaries['mean']:.1f}k TL")
+                st.write(f"• Difference: {male_salaries['mean'] - female_salaries['mean']:.1f}k TL")
 
     with tab2:
         st.header("💼 Career Analysis")
@@ -234,12 +295,12 @@ def main():
         career_levels = {0: 'Management', 1: 'Junior', 2: 'Mid', 3: 'Senior', 4: 'Staff', 5: 'Architect'}
         career_data = []
         for level, name in career_levels.items():
-            level_salaries = filtered_df[filtered_df['seniority_level_ic'] == level]['salary_numeric']
-            if len(level_salaries) > 0:
+            level_salaries = group_stats(by_level, level)
+            if level_salaries['count'] > 0:
                 career_data.append({
                     'Level': name,
-                    'Average Salary': level_salaries.mean(),
-                    'Count': len(level_salaries)
+                    'Average Salary': level_salaries['mean'],
+                    'Count': int(level_salaries['count'])
                 })
         
         if career_data:
@@ -251,13 +312,13 @@ def main():
 
         # Role analysis
         st.subheader("Average Salary by Role (Top 15)")
-        role_cols = [c for c in filtered_df.columns if c.startswith('role_')]
+        role_cols = flag_columns(flag_users.index, 'role_')
         rows = []
         for c in role_cols:
             name = c.replace('role_', '').replace('_', ' ')
-            vals = filtered_df.loc[filtered_df[c] == 1, 'salary_numeric']
-            if len(vals) > 5:
-                rows.append({'Role': name, 'Average Salary': vals.mean(), 'Participants': len(vals)})
+            vals = flag_users.loc[c]
+            if vals['count'] > 5:
+                rows.append({'Role': name, 'Average Salary': vals['mean'], 'Participants': int(vals['count'])})
         
         if rows:
             role_df = pd.DataFrame(rows).sort_values('Average Salary', ascending=False).head(15)
@@ -270,27 +331,20 @@ def main():
         st.subheader("Career Level → Role Flow (Sankey)")
         try:
             level_map = {0: 'Management', 1: 'Junior', 2: 'Mid', 3: 'Senior', 4: 'Staff', 5: 'Architect'}
-            role_cols = [c for c in filtered_df.columns if c.startswith('role_')]
+            role_counts = cube.flag_counts_by('seniority_level_ic', filters).loc[role_cols]
             flows = []  # (level_name, role_name, count)
             for lvl, lvl_name in level_map.items():
-                subset = filtered_df[filtered_df['seniority_level_ic'] == lvl]
-                if subset.empty:
+                if lvl not in by_level.index:
                     continue
                 for rc in role_cols:
                     role_name = rc.replace('role_', '').replace('_', ' ')
-                    count = int((subset[rc] == 1).sum())
+                    count = int(role_counts.at[rc, lvl])
                     if count > 0:
                         flows.append((lvl_name, role_name, count))
 
             if flows:
-                levels = sorted(list({f[0] for f in flows}), key=lambda x: list(level_map.values()).index(x))
-                roles = sorted(list({f[1] for f in flows}))
-                nodes = levels + roles
-                node_index = {n: i for i, n in enumerate(nodes)}
-
-                source = [node_index[s] for s, _, _ in flows]
-                target = [node_index[t] for _, t, _ in flows]
-                value = [v for _, _, v in flows]
+                nodes, source, target, value = sankey_links(pd.DataFrame(flows, columns=['level', 'role', 'count']),
+                                                            level_map.values())
 
                 sankey_fig = go.Figure(data=[go.Sankey(
                     node=dict(pad=15, thickness=18, line=dict(color='black', width=0.5), label=nodes),
@@ -311,15 +365,13 @@ def main():
             # Work mode analysis
             work_mode_data = []
             for mode in ['Remote', 'Hybrid', 'Office']:
-                col = f'work_mode_{mode}'
-                if col in filtered_df.columns:
-                    subset = filtered_df[filtered_df[col] == 1]
-                    if len(subset) > 0:
-                        work_mode_data.append({
-                            'Work Mode': mode, 
-                            'Average Salary': subset['salary_numeric'].mean(), 
-                            'Participants': len(subset)
-                        })
+                subset = group_stats(by_mode, mode)
+                if subset['count'] > 0:
+                    work_mode_data.append({
+                        'Work Mode': mode, 
+                        'Average Salary': subset['mean'], 
+                        'Participants': int(subset['count'])
+                    })
             
             if work_mode_data:
                 mode_df = pd.DataFrame(work_mode_data)
@@ -329,24 +381,22 @@ def main():
                 st.plotly_chart(fig, use_container_width=True)
                 
                 # Work mode insights
-                if len(remote_salaries) > 10 and len(office_salaries) > 10:
+                if remote_salaries['count'] > 10 and office_salaries['count'] > 10:
                     st.markdown("**Work Mode Insights:**")
-                    st.write(f"• Remote workers earn {remote_salaries.mean() - office_salaries.mean():.1f}k TL more")
-                    st.write(f"• Remote premium: {((remote_salaries.mean() / office_salaries.mean()) - 1) * 100:.1f}%")
+                    st.write(f"• Remote workers earn {remote_salaries['mean'] - office_salaries['mean']:.1f}k TL more")
+                    st.write(f"• Remote premium: {((remote_salaries['mean'] / office_salaries['mean']) - 1) * 100:.1f}%")
         
         with c2:
             # Location analysis
             location_data = []
             for loc in ['Turkiye', 'Avrupa', 'Amerika', 'Yurtdisi_TR_hub']:
-                col = f'company_location_{loc}'
-                if col in filtered_df.columns:
-                    subset = filtered_df[filtered_df[col] == 1]
-                    if len(subset) > 0:
-                        location_data.append({
-                            'Location': loc.replace('_', ' '), 
-                            'Average Salary': subset['salary_numeric'].mean(), 
-                            'Participants': len(subset)
-                        })
+                subset = group_stats(flag_users, f'company_location_{loc}')
+                if subset['count'] > 0:
+                    location_data.append({
+                        'Location': loc.replace('_', ' '), 
+                        'Average Salary': subset['mean'], 
+                        'Participants': int(subset['count'])
+                    })
             
             if location_data:
                 loc_df = pd.DataFrame(location_data)
@@ -356,35 +406,25 @@ def main():
                 st.plotly_chart(fig, use_container_width=True)
                 
                 # Location insights
-                if len(europe_salaries) > 10 and len(turkey_salaries) > 10:
+                if europe_salaries['count'] > 10 and turkey_salaries['count'] > 10:
                     st.markdown("**Location Insights:**")
-                    st.write(f"• European companies pay {europe_salaries.mean() - turkey_salaries.mean():.1f}k TL more")
-                    st.write(f"• European premium: {((europe_salaries.mean() / turkey_salaries.mean()) - 1) * 100:.1f}%")
+                    st.write(f"• European companies pay {europe_salaries['mean'] - turkey_salaries['mean']:.1f}k TL more")
+                    st.write(f"• European premium: {((europe_salaries['mean'] / turkey_salaries['mean']) - 1) * 100:.1f}%")
 
         st.info(f"ℹ️ {LOCATION_NOTE}")
 
     with tab4:
         st.header("⚡ Technology ROI Analysis")
         
+        # All technologies at once; more than 10 users and non-users each
+        tech_roi = roi_from_moments(*cube.flag_moment_sums(filters), cube.flags, min_count=11)
+
         # Programming languages ROI
         st.subheader("Programming Languages ROI")
-        lang_cols = [c for c in filtered_df.columns if c.startswith('programming_') and c != 'programming_Hicbiri']
-        rows = []
-        for c in lang_cols:
-            users = filtered_df[filtered_df[c] == 1]['salary_numeric']
-            non_users = filtered_df[filtered_df[c] == 0]['salary_numeric']
-            if len(users) > 10 and len(non_users) > 10:
-                roi = users.mean() - non_users.mean()
-                percentage_increase = (roi / non_users.mean()) * 100
-                rows.append({
-                    'Technology': c.replace('programming_', '').replace('_', ' '),
-                    'ROI': roi, 
-                    'Users': len(users),
-                    'Percentage Increase': percentage_increase
-                })
+        lang_df = roi_table(tech_roi, 'programming_', exclude='programming_Hicbiri')
         
-        if rows:
-            lang_df = pd.DataFrame(rows).sort_values('ROI', ascending=False)
+        if len(lang_df) > 0:
+            lang_df = lang_df.sort_values('ROI', ascending=False)
             fig = px.bar(lang_df.head(15), x='ROI', y='Technology', 
                         title="Top Programming Languages by ROI",
                         labels={'ROI': 'Average Salary Difference (thousand TL)'}, 
@@ -401,23 +441,10 @@ def main():
 
         # Frontend technologies ROI
         st.subheader("Frontend Technologies ROI")
-        fe_cols = [c for c in filtered_df.columns if c.startswith('frontend_') and c != 'frontend_Kullanmiyorum']
-        rows = []
-        for c in fe_cols:
-            users = filtered_df[filtered_df[c] == 1]['salary_numeric']
-            non_users = filtered_df[filtered_df[c] == 0]['salary_numeric']
-            if len(users) > 10 and len(non_users) > 10:
-                roi = users.mean() - non_users.mean()
-                percentage_increase = (roi / non_users.mean()) * 100
-                rows.append({
-                    'Technology': c.replace('frontend_', '').replace('_', ' '),
-                    'ROI': roi, 
-                    'Users': len(users),
-                    'Percentage Increase': percentage_increase
-                })
+        fe_df = roi_table(tech_roi, 'frontend_', exclude='frontend_Kullanmiyorum')
         
-        if rows:
-            fe_df = pd.DataFrame(rows).sort_values('ROI', ascending=False)
+        if len(fe_df) > 0:
+            fe_df = fe_df.sort_values('ROI', ascending=False)
             fig = px.bar(fe_df, x='ROI', y='Technology', 
                         title="Frontend Technologies ROI",
                         labels={'ROI': 'Average Salary Difference (thousand TL)'}, 
@@ -426,43 +453,59 @@ def main():
 
         # Tools ROI
         st.subheader("Development Tools ROI")
-        tools_cols = [c for c in filtered_df.columns if c.startswith('tools_')]
-        rows = []
-        for c in tools_cols:
-            users = filtered_df[filtered_df[c] == 1]['salary_numeric']
-            non_users = filtered_df[filtered_df[c] == 0]['salary_numeric']
-            if len(users) > 10 and len(non_users) > 10:
-                roi = users.mean() - non_users.mean()
-                percentage_increase = (roi / non_users.mean()) * 100
-                rows.append({
-                    'Tool': c.replace('tools_', '').replace('_', ' '),
-                    'ROI': roi, 
-                    'Users': len(users),
-                    'Percentage Increase': percentage_increase
-                })
+        tools_df = roi_table(tech_roi, 'tools_', label='Tool')
         
-        if rows:
-            tools_df = pd.DataFrame(rows).sort_values('ROI', ascending=False)
+        if len(tools_df) > 0:
+            tools_df = tools_df.sort_values('ROI', ascending=False)
             fig = px.bar(tools_df.head(10), x='ROI', y='Tool', 
                         title="Top Development Tools by ROI",
                         labels={'ROI': 'Average Salary Difference (thousand TL)'}, 
                         color='ROI', color_continuous_scale='RdYlGn')
             st.plotly_chart(fig, use_container_width=True)
 
+        # Frequent language + frontend + tool stacks within a role
+        st.subheader("Frequent Technology Stacks")
+        role_cols = flag_columns(filtered_df.columns, 'role_')
+        role_counts = filtered_df[role_cols].eq(1).sum().sort_values(ascending=False)
+        role_counts = role_counts[role_counts > 0]
+        if len(role_counts) > 0:
+            stack_role = st.selectbox("Role", role_counts.index,
+                                      format_func=lambda c: c.replace('role_', '').replace('_', ' '))
+            stacks = mine_stacks(filtered_df[filtered_df[stack_role] == 1], min_support=10)
+            stacks = stacks[stacks['size'] == 3].sort_values('mean', ascending=False).head(15)
+            if len(stacks) > 0:
+                fig = go.Figure(go.Bar(
+                    x=stacks['mean'], y=stacks['stack'], orientation='h',
+                    error_x=dict(type='data', symmetric=False,
+                                 array=stacks['ci_high'] - stacks['mean'],
+                                 arrayminus=stacks['mean'] - stacks['ci_low']),
+                    customdata=stacks['count'],
+                    hovertemplate='%{y}<br>Mean: %{x:.1f}k TL<br>n=%{customdata}<extra></extra>'
+                ))
+                fig.update_layout(title="Best-Paid Language + Frontend + Tool Stacks (95% CI)",
+                                  xaxis_title='Average Salary (thousand TL)',
+                                  yaxis=dict(autorange='reversed'), height=500)
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info("No stack has at least 10 respondents for this role and filter selection.")
+
     with tab5:
         st.header("👥 Gender and Technology Analysis")
         
+        usage_by_gender = cube.flag_counts_by('gender', filters)
+        male_count = group_stats(by_gender, 0)['count']
+        female_count = group_stats(by_gender, 1)['count']
         c1, c2 = st.columns(2)
         
         with c1:
             # Programming languages by gender
             st.subheader("Programming Languages by Gender")
-            lang_cols = [c for c in filtered_df.columns if c.startswith('programming_') and c != 'programming_Hicbiri']
+            lang_cols = [c for c in flag_columns(flag_users.index, 'programming_') if c != 'programming_Hicbiri']
             if lang_cols:
                 # Top 10 languages by overall usage
                 lang_usage = []
                 for col in lang_cols:
-                    usage = filtered_df[col].mean()
+                    usage = flag_users.at[col, 'count'] / selected['count']
                     lang_usage.append((col.replace('programming_', '').replace('_', ' '), usage))
                 lang_usage.sort(key=lambda x: x[1], reverse=True)
                 top_langs = [col.replace('programming_', '') for col, _ in lang_usage[:10]]
@@ -470,9 +513,9 @@ def main():
                 gender_data = []
                 for lang in top_langs:
                     col = f'programming_{lang}'
-                    if col in filtered_df.columns:
-                        male_usage = filtered_df[filtered_df['gender'] == 0][col].mean() * 100
-                        female_usage = filtered_df[filtered_df['gender'] == 1][col].mean() * 100
+                    if col in usage_by_gender.index:
+                        male_usage = usage_by_gender.at[col, 0] / male_count * 100
+                        female_usage = usage_by_gender.at[col, 1] / female_count * 100
                         gender_data.append({
                             'Language': lang.replace('_', ' '),
                             'Male (%)': male_usage,
@@ -489,12 +532,12 @@ def main():
         with c2:
             # Frontend technologies by gender
             st.subheader("Frontend Technologies by Gender")
-            fe_cols = [c for c in filtered_df.columns if c.startswith('frontend_') and c != 'frontend_Kullanmiyorum']
+            fe_cols = [c for c in flag_columns(flag_users.index, 'frontend_') if c != 'frontend_Kullanmiyorum']
             if fe_cols:
                 # Top 8 frontend technologies
                 fe_usage = []
                 for col in fe_cols:
-                    usage = filtered_df[col].mean()
+                    usage = flag_users.at[col, 'count'] / selected['count']
                     fe_usage.append((col.replace('frontend_', '').replace('_', ' '), usage))
                 fe_usage.sort(key=lambda x: x[1], reverse=True)
                 top_fe = [col.replace('frontend_', '') for col, _ in fe_usage[:8]]
@@ -502,9 +545,9 @@ def main():
                 gender_data = []
                 for tech in top_fe:
                     col = f'frontend_{tech}'
-                    if col in filtered_df.columns:
-                        male_usage = filtered_df[filtered_df['gender'] == 0][col].mean() * 100
-                        female_usage = filtered_df[filtered_df['gender'] == 1][col].mean() * 100
+                    if col in usage_by_gender.index:
+                        male_usage = usage_by_gender.at[col, 0] / male_count * 100
+                        female_usage = usage_by_gender.at[col, 1] / female_count * 100
                         gender_data.append({
                             'Technology': tech.replace('_', ' '),
                             'Male (%)': male_usage,
@@ -529,75 +572,72 @@ def main():
         st.header("📈 Statistical Tests with Effect Sizes")
         
         # React vs Non-React
-        react = filtered_df[filtered_df['frontend_React'] == 1]['salary_numeric'] if 'frontend_React' in filtered_df.columns else pd.Series(dtype=float)
-        non_react = filtered_df[filtered_df['frontend_React'] == 0]['salary_numeric'] if 'frontend_React' in filtered_df.columns else pd.Series(dtype=float)
-        
-        if len(react) > 10 and len(non_react) > 10:
-            _, p_react = ttest_ind(react, non_react, equal_var=False)
-            effect_react = calculate_effect_size(react, non_react)
+        if react['count'] > 10 and non_react['count'] > 10:
+            p_react = tests.at['react', 'p_value']
+            effect_react = tests.at['react', 'cohens_d']
             
             st.markdown("**🔵 React vs Non-React Analysis**")
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("React Users Avg", f"{react.mean():.1f}k TL", f"{len(react):,} users")
+                st.metric("React Users Avg", f"{react['mean']:.1f}k TL", f"{int(react['count']):,} users")
             with col2:
-                st.metric("Non-React Users Avg", f"{non_react.mean():.1f}k TL", f"{len(non_react):,} users")
+                st.metric("Non-React Users Avg", f"{non_react['mean']:.1f}k TL", f"{int(non_react['count']):,} users")
             with col3:
-                st.metric("Difference", f"{react.mean() - non_react.mean():.1f}k TL", 
+                st.metric("Difference", f"{react['mean'] - non_react['mean']:.1f}k TL", 
                          f"p={p_react:.4f}")
             
             st.markdown(f"**Effect Size:** Cohen's d = {effect_react:.3f} ({interpret_effect_size(effect_react)} effect)")
             st.markdown(f"**Significance:** {'✅ Statistically Significant' if p_react < 0.05 else '❌ Not Significant'}")
 
         # Remote vs Office
-        if len(remote_salaries) > 10 and len(office_salaries) > 10:
-            _, p_remote = ttest_ind(remote_salaries, office_salaries, equal_var=False)
-            effect_remote = calculate_effect_size(remote_salaries, office_salaries)
+        if remote_salaries['count'] > 10 and office_salaries['count'] > 10:
+            p_remote = tests.at['remote', 'p_value']
+            effect_remote = tests.at['remote', 'cohens_d']
             
             st.markdown("**🏠 Remote vs Office Analysis**")
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Remote Workers Avg", f"{remote_salaries.mean():.1f}k TL", f"{len(remote_salaries):,} users")
+                st.metric("Remote Workers Avg", f"{remote_salaries['mean']:.1f}k TL", f"{int(remote_salaries['count']):,} users")
             with col2:
-                st.metric("Office Workers Avg", f"{office_salaries.mean():.1f}k TL", f"{len(office_salaries):,} users")
+                st.metric("Office Workers Avg", f"{office_salaries['mean']:.1f}k TL", f"{int(office_salaries['count']):,} users")
             with col3:
-                st.metric("Difference", f"{remote_salaries.mean() - office_salaries.mean():.1f}k TL", 
+                st.metric("Difference", f"{remote_salaries['mean'] - office_salaries['mean']:.1f}k TL", 
                          f"p={p_remote:.4f}")
             
             st.markdown(f"**Effect Size:** Cohen's d = {effect_remote:.3f} ({interpret_effect_size(effect_remote)} effect)")
             st.markdown(f"**Significance:** {'✅ Statistically Significant' if p_remote < 0.05 else '❌ Not Significant'}")
 
         # Europe vs Turkey
-        if len(europe_salaries) > 10 and len(turkey_salaries) > 10:
-            _, p_europe = ttest_ind(europe_salaries, turkey_salaries, equal_var=False)
-            effect_europe = calculate_effect_size(europe_salaries, turkey_salaries)
+        if europe_salaries['count'] > 10 and turkey_salaries['count'] > 10:
+            p_europe = tests.at['europe', 'p_value']
+            effect_europe = tests.at['europe', 'cohens_d']
             
             st.markdown("**🌍 Europe vs Turkey Analysis**")
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("European Companies Avg", f"{europe_salaries.mean():.1f}k TL", f"{len(europe_salaries):,} users")
+                st.metric("European Companies Avg", f"{europe_salaries['mean']:.1f}k TL", f"{int(europe_salaries['count']):,} users")
             with col2:
-                st.metric("Turkish Companies Avg", f"{turkey_salaries.mean():.1f}k TL", f"{len(turkey_salaries):,} users")
+                st.metric("Turkish Companies Avg", f"{turkey_salaries['mean']:.1f}k TL", f"{int(turkey_salaries['count']):,} users")
             with col3:
-                st.metric("Difference", f"{europe_salaries.mean() - turkey_salaries.mean():.1f}k TL", 
+                st.metric("Difference", f"{europe_salaries['mean'] - turkey_salaries['mean']:.1f}k TL", 
                          f"p={p_europe:.4f}")
             
             st.markdown(f"**Effect Size:** Cohen's d = {effect_europe:.3f} ({interpret_effect_size(effect_europe)} effect)")
             st.markdown(f"**Significance:** {'✅ Statistically Significant' if p_europe < 0.05 else '❌ Not Significant'}")
 
         # Gender gap
-        if len(male_salaries) > 10 and len(female_salaries) > 10:
-            _, p_gender = ttest_ind(male_salaries, female_salaries, equal_var=False)
-            effect_gender = calculate_effect_size(male_salaries, female_salaries)
+        if male_salaries['count'] > 10 and female_salaries['count'] > 10:
+            p_gender = tests.at['gender', 'p_value']
+            effect_gender = tests.at['gender', 'cohens_d']
             
             st.markdown("**👥 Gender Gap Analysis**")
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Male Professionals Avg", f"{male_salaries.mean():.1f}k TL", f"{len(male_salaries):,} users")
+                st.metric("Male Professionals Avg", f"{male_salaries['mean']:.1f}k TL", f"{int(male_salaries['count']):,} users")
             with col2:
-                st.metric("Female Professionals Avg", f"{female_salaries.mean():.1f}k TL", f"{len(female_salaries):,} users")
+                st.metric("Female Professionals Avg", f"{female_salaries['mean']:.1f}k TL", f"{int(female_salaries['count']):,} users")
             with col3:
-                st.metric("Difference", f"{male_salaries.mean() - female_salaries.mean():.1f}k TL", 
+                st.metric("Difference", f"{male_salaries['mean'] - female_salaries['mean']:.1f}k TL", 
                          f"p={p_gender:.4f}")
             
             st.markdown(f"**Effect Size:** Cohen's d = {effect_gender:.3f} ({interpret_effect_size(effect_gender)} effect)")
@@ -614,31 +654,29 @@ def main():
     with tab7:
         st.header("📅 Survey Participation Patterns")
         
-        # Add hour column
-        filtered_df['hour'] = pd.to_datetime(filtered_df['timestamp']).dt.hour
+        # Mean salary and participants per survey hour (same table as the Sprint 2 figures)
+        hourly = hourly_participation(filtered_df)
         
         c1, c2 = st.columns(2)
         
         with c1:
             # Average salary by hour
-            hourly_salary = filtered_df.groupby('hour')['salary_numeric'].mean().reset_index()
-            fig = px.bar(hourly_salary, x='hour', y='salary_numeric',
+            fig = px.bar(hourly, x='hour', y='avg_salary',
                         title="Average Salary by Survey Hour",
-                        labels={'hour': 'Hour of Day (0-23)', 'salary_numeric': 'Average Salary (thousand TL)'})
+                        labels={'hour': 'Hour of Day (0-23)', 'avg_salary': 'Average Salary (thousand TL)'})
             st.plotly_chart(fig, use_container_width=True)
         
         with c2:
             # Participants by hour
-            hourly_participants = filtered_df.groupby('hour').size().reset_index(name='participants')
-            fig = px.bar(hourly_participants, x='hour', y='participants',
+            fig = px.bar(hourly, x='hour', y='participants',
                         title="Participants by Survey Hour",
                         labels={'hour': 'Hour of Day (0-23)', 'participants': 'Number of Participants'})
             st.plotly_chart(fig, use_container_width=True)
 
         # Participation insights
         st.markdown("**📊 Participation Pattern Insights:**")
-        peak_hour = hourly_participants.loc[hourly_participants['participants'].idxmax(), 'hour']
-        peak_salary_hour = hourly_salary.loc[hourly_salary['salary_numeric'].idxmax(), 'hour']
+        peak_hour = hourly.loc[hourly['participants'].idxmax(), 'hour']
+        peak_salary_hour = hourly.loc[hourly['avg_salary'].idxmax(), 'hour']
         
         st.write(f"• Peak participation hour: {peak_hour}:00")
         st.write(f"• Highest average salary hour: {peak_salary_hour}:00")
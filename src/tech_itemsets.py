@@ -0,0 +1,148 @@
+"""
+Technology Stack Miner (English)
+Frequent technology combinations (itemsets) over the multi-hot language, frontend and
+tool flags, mined Apriori-style on packed bitsets: every flag is a bitmap of its users,
+the support of a combination is the popcount of the AND of its flags' bitmaps, and a
+combination is only extended when it is frequent itself (and every one of its subsets
+is), so the search never leaves the frequent part of the lattice. By default a stack
+holds at most one technology per block, i.e. language + frontend + tool combinations.
+Salary count, mean and a t-based confidence interval are reported per stack, overall
+or per role.
+"""
+
+import numpy as np
+import pandas as pd
+
+from bitmap_index import pack_bits
+from stat_kernels import masked_stats, mean_confidence_interval
+from technology_roi import technology_columns
+from vocabulary import flag_columns
+
+# Technology blocks a stack is built from, and the "none" answers left out of them
+ITEM_PREFIXES = ('programming_', 'frontend_', 'tools_')
+EXCLUDED_ITEMS = ('programming_Hicbiri', 'frontend_Kullanmiyorum', 'tools_Kullanmiyorum')
+MIN_SUPPORT = 10
+MAX_STACK_SIZE = 3
+CONFIDENCE_LEVEL = 0.95
+# Upper bound on unpacked mask cells per salary-statistics batch
+STATS_BATCH_CELLS = 1 << 22
+STACK_COLUMNS = ['stack', 'items', 'size', 'count', 'support', 'mean', 'ci_low', 'ci_high']
+
+
+def item_label(column, prefix):
+    """Display name of a flag column of the block `prefix` (prefix dropped, underscores as spaces)."""
+    return column[len(prefix):].replace('_', ' ')
+
+
+def frequent_itemsets(bitmaps, blocks, min_support, max_size=MAX_STACK_SIZE, one_per_block=True):
+    """
+    Apriori over item bitmaps (items x words). Yields one level at a time as
+    (itemsets, counts, bits): item index tuples in ascending order, their supports
+    (popcounts) and their AND-ed bitmaps. A k-itemset is only counted when its
+    (k-1)-prefix is frequent and all of its other (k-1)-subsets are frequent too;
+    with one_per_block no two items of a stack share a block.
+    """
+    blocks = np.asarray(blocks)
+    counts = np.bitwise_count(bitmaps).sum(axis=1, dtype=np.int64)
+    singles = np.flatnonzero(counts >= min_support)
+    itemsets = [(int(i),) for i in singles]
+    counts, bits = counts[singles], bitmaps[singles]
+    size = 1
+    while itemsets:
+        yield itemsets, counts, bits
+        if size == max_size:
+            return
+        frequent = set(itemsets)
+        next_itemsets, next_counts, next_bits = [], [], []
+        for parent, parent_bits in zip(itemsets, bits):
+            used = set(blocks[list(parent)]) if one_per_block else set()
+            candidates = [int(j) for j in singles[singles > parent[-1]]
+                          if blocks[j] not in used
+                          and all(parent[:i] + parent[i + 1:] + (int(j),) in frequent for i in range(size))]
+            if not candidates:
+                continue
+            joined = parent_bits & bitmaps[candidates]
+            support = np.bitwise_count(joined).sum(axis=1, dtype=np.int64)
+            keep = np.flatnonzero(support >= min_support)
+            next_itemsets.extend(parent + (candidates[k],) for k in keep)
+            next_counts.append(support[keep])
+            next_bits.append(joined[keep])
+        itemsets = next_itemsets
+        if itemsets:
+            counts, bits = np.concatenate(next_counts), np.vstack(next_bits)
+        size += 1
+
+
+def _salary_stats(bits, salary, level):
+    """Count, mean and confidence interval of salary under each bitmap, in bounded batches."""
+    n_rows = len(salary)
+    batch = max(1, STATS_BATCH_CELLS // max(n_rows, 1))
+    count, mean, var = [], [], []
+    for start in range(0, len(bits), batch):
+        masks = np.unpackbits(bits[start:start + batch].view(np.uint8), axis=1,
+                              count=n_rows, bitorder='little')
+        n, m, v = masked_stats(masks, salary)
+        count.append(n)
+        mean.append(m)
+        var.append(v)
+    count, mean, var = np.concatenate(count), np.concatenate(mean), np.concatenate(var)
+    low, high = mean_confidence_interval(count, mean, var, level)
+    return count, mean, low, high
+
+
+def mine_stacks(df, min_support=MIN_SUPPORT, max_size=MAX_STACK_SIZE, one_per_block=True,
+                level=CONFIDENCE_LEVEL, salary_col='salary_numeric') -> pd.DataFrame:
+    """
+    Frequent technology stacks among the respondents of df with a salary. min_support is
+    a number of respondents, or a share of them when below 1. One row per stack with its
+    label, flag columns, size, count, support share, mean salary and confidence interval.
+    """
+    salary = df[salary_col].to_numpy(dtype=np.float64)
+    df, salary = df[~np.isnan(salary)], salary[~np.isnan(salary)]
+    columns, blocks, names = [], [], {}
+    for b, prefix in enumerate(ITEM_PREFIXES):
+        block_columns = technology_columns(df, prefix, exclude=EXCLUDED_ITEMS)
+        columns.extend(block_columns)
+        blocks.extend([b] * len(block_columns))
+        names.update((c, item_label(c, prefix)) for c in block_columns)
+    if df.empty or not columns:
+        return pd.DataFrame(columns=STACK_COLUMNS)
+    if min_support < 1:
+        min_support = max(1, int(np.ceil(min_support * len(df))))
+    bitmaps = np.vstack([pack_bits(df[c].to_numpy() == 1) for c in columns])
+
+    frames = []
+    for itemsets, counts, bits in frequent_itemsets(bitmaps, blocks, min_support, max_size, one_per_block):
+        count, mean, low, high = _salary_stats(bits, salary, level)
+        items = [tuple(columns[i] for i in itemset) for itemset in itemsets]
+        frames.append(pd.DataFrame({
+            'stack': [' + '.join(names[c] for c in stack) for stack in items],
+            'items': items,
+            'size': [len(stack) for stack in items],
+            'count': count.astype(int),
+            'support': counts / len(df),
+            'mean': mean,
+            'ci_low': low,
+            'ci_high': high,
+        }))
+    if not frames:
+        return pd.DataFrame(columns=STACK_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+def mine_stacks_by_role(df, min_support=MIN_SUPPORT, max_size=MAX_STACK_SIZE, one_per_block=True,
+                        level=CONFIDENCE_LEVEL, salary_col='salary_numeric') -> pd.DataFrame:
+    """
+    mine_stacks within every role (role_* flags); support and statistics are relative to
+    the role's respondents. Adds a leading 'role' column.
+    """
+    frames = []
+    for role_col in flag_columns(df.columns, 'role_'):
+        stacks = mine_stacks(df[df[role_col].to_numpy() == 1], min_support, max_size,
+                             one_per_block, level, salary_col)
+        if not stacks.empty:
+            stacks.insert(0, 'role', role_col[len('role_'):].replace('_', ' '))
+            frames.append(stacks)
+    if not frames:
+        return pd.DataFrame(columns=['role'] + STACK_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,77 @@
+"""
+Technology ROI (English)
+Salary return of every technology flag (mean salary of users minus non-users) from one
+matrix product: X.T @ [1, y, y^2] over the flag matrix X gives each technology's user
+count, salary sum and sum of squares, and the same product over the "answered" matrix
+(flag not NaN) gives the totals the non-user statistics are derived from. ROI,
+percentage increase, Welch t-test and Cohen's d then come out as arrays for all
+technologies at once. Shared by the dashboard, the LaTeX report and the Sprint 2 plots.
+"""
+
+import numpy as np
+import pandas as pd
+
+from stat_kernels import moment_stats, pairwise_tests
+from vocabulary import flag_columns
+
+MIN_GROUP_SIZE = 10
+
+
+def flag_moments(flags: pd.DataFrame, salary):
+    """
+    Count, salary sum and salary sum of squares of users (flag == 1) and of respondents
+    who answered (flag not NaN) for every flag column: two (flags x 3) arrays from one
+    product. Rows without a salary are ignored.
+    """
+    y = np.asarray(salary, dtype=np.float64)
+    valid = ~np.isnan(y)
+    y = np.where(valid, y, 0.0)
+    X = np.hstack([flags.to_numpy(dtype=np.float64) == 1, flags.notna().to_numpy()]).astype(np.float64)
+    moments = X.T @ np.column_stack([valid, y, y ** 2]).astype(np.float64)
+    k = flags.shape[1]
+    return moments[:k], moments[k:]
+
+
+def roi_from_moments(user_moments, answered_moments, technologies, min_count=MIN_GROUP_SIZE):
+    """
+    ROI table from per-technology user moments (k x 3) and the moments of everyone who
+    answered (k x 3, or a single row of 3 broadcast to all technologies). Keeps the input
+    order and only technologies with at least min_count users and non-users.
+    """
+    user_moments = np.asarray(user_moments, dtype=np.float64)
+    other_moments = np.broadcast_to(answered_moments, user_moments.shape) - user_moments
+    n1, n0 = user_moments[:, 0], other_moments[:, 0]
+    mean1, var1 = moment_stats(n1, user_moments[:, 1], user_moments[:, 2])
+    mean0, var0 = moment_stats(n0, other_moments[:, 1], other_moments[:, 2])
+    tests = pairwise_tests(n1, mean1, var1, n0, mean0, var0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roi = mean1 - mean0
+        table = pd.DataFrame({
+            'technology': list(technologies),
+            'users': n1.astype(int),
+            'non_users': n0.astype(int),
+            'user_mean': mean1,
+            'non_user_mean': mean0,
+            'roi': roi,
+            'percentage_increase': roi / mean0 * 100,
+            't_stat': tests.t_stat,
+            'p_value': tests.p_value,
+            'cohens_d': tests.cohens_d,
+        })
+    return table[(n1 >= min_count) & (n0 >= min_count)].reset_index(drop=True)
+
+
+def technology_columns(df, prefix, exclude=()):
+    """Flag columns of a block (prefix or tuple of prefixes), without the excluded ones."""
+    excluded = set(exclude)
+    return [c for c in flag_columns(df.columns, prefix) if c not in excluded]
+
+
+def technology_roi(df, prefix, exclude=(), min_count=MIN_GROUP_SIZE, salary_col='salary_numeric'):
+    """
+    ROI of every technology of a block in df (one row per technology, column order).
+    Non-users are respondents with the flag set to 0; NaN flags count as unanswered.
+    """
+    columns = technology_columns(df, prefix, exclude)
+    users, answered = flag_moments(df[columns], df[salary_col])
+    return roi_from_moments(users, answered, columns, min_count=min_count)
@@ -0,0 +1,140 @@
+"""
+Kategorik ve çoklu seçim alanları için kalıcı, sürümlü kelime dağarcığı (vocabulary).
+Her alan için sıralı etiketler, bu etiketlerin kodlanmış sütun adları ve çoklu seçim
+alias haritası tek bir JSON dosyasında tutulur. Kodlayıcı her çalıştırmada etiketleri
+yeniden keşfetmek yerine bu dosyayı kullanır; yeni etiketler yalnızca sona eklenir,
+böylece sütun sırası ve indeksleri çalıştırmalar ve süreçler arasında sabit kalır.
+Etiket kümesi değiştiğinde `version` bir artırılır.
+"""
+
+import json
+import os
+
+VOCABULARY_PATH = 'data/2025_cleaned_data.vocabulary.json'
+# Dosya biçimi sürümü; biçim uyumsuz değişirse artırılır
+VOCABULARY_FORMAT = 1
+# cached_vocabulary: yol → (dosya mtime, kelime dağarcığı)
+_CACHE = {}
+
+
+def extend_labels(known, seen):
+    """
+    Bilinen etiketlerin sırasını koruyarak yeni görülen etiketleri (sıralı) sona ekle.
+    """
+    known = list(known or [])
+    known_set = set(known)
+    return known + sorted(label for label in set(seen) if label not in known_set)
+
+
+def make_vocabulary(fields, aliases, previous=None):
+    """
+    Alan tanımlarından (alan → {'kind', 'prefix', 'labels', 'columns'}) kelime dağarcığı oluştur.
+    previous verilirse ve alanlar ya da alias haritası değiştiyse sürüm bir artırılır.
+    """
+    version = 1
+    if previous is not None:
+        unchanged = previous['fields'] == fields and previous['aliases'] == aliases
+        version = previous['version'] if unchanged else previous['version'] + 1
+    return {
+        'format': VOCABULARY_FORMAT,
+        'version': version,
+        'fields': fields,
+        'aliases': aliases,
+    }
+
+
+def load_vocabulary(path=VOCABULARY_PATH):
+    """
+    Kayıtlı kelime dağarcığını oku; dosya yoksa None.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        vocabulary = json.load(f)
+    if vocabulary.get('format') != VOCABULARY_FORMAT:
+        raise ValueError(f"Desteklenmeyen kelime dağarcığı biçimi: {vocabulary.get('format')} ({path})")
+    return vocabulary
+
+
+def cached_vocabulary(path=VOCABULARY_PATH):
+    """
+    Kayıtlı kelime dağarcığını süreç başına bir kez oku; dosya değişmedikçe
+    (mtime) sonraki çağrılar aynı nesneyi döndürür. Dosya yoksa None.
+    """
+    mtime = os.stat(path).st_mtime_ns if os.path.exists(path) else None
+    cached = _CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = _CACHE[path] = (mtime, load_vocabulary(path))
+    return cached[1]
+
+
+def save_vocabulary(vocabulary, path=VOCABULARY_PATH):
+    """
+    Kelime dağarcığını kaydet.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(vocabulary, f, ensure_ascii=False, indent=2)
+
+
+def field_labels(vocabulary, field):
+    """
+    Alanın sıralı etiket listesi; alan yoksa None.
+    """
+    spec = vocabulary['fields'].get(field)
+    return spec['labels'] if spec else None
+
+
+def column_index(vocabulary):
+    """
+    Sütun adı → (alan, etiket) sözlüğü. Farklı etiketler aynı sütun adına
+    düştüğünde (örn. C, C# ve C++ → programming_C) sütun ilk etikete aittir.
+    """
+    index = {}
+    for field, spec in vocabulary['fields'].items():
+        for label, column in zip(spec['labels'], spec['columns']):
+            index.setdefault(column, (field, label))
+    return index
+
+
+def field_columns(vocabulary, field):
+    """
+    Alanın kodlanmış sütunları, sabit sırayla ve tekilleştirilmiş olarak.
+    """
+    return list(dict.fromkeys(vocabulary['fields'][field]['columns']))
+
+
+def prefix_columns(vocabulary, prefix):
+    """
+    Sütun öneki (örn. 'programming') ile alanın kodlanmış sütunları;
+    `startswith` taraması yerine kayıtlı kelime dağarcığından okunur.
+    """
+    for field, spec in vocabulary['fields'].items():
+        if spec['prefix'] == prefix:
+            return field_columns(vocabulary, field)
+    raise KeyError(f"Kelime dağarcığında '{prefix}' önekli alan yok")
+
+
+def flag_columns(columns, prefixes, vocabulary=None):
+    """
+    columns içinde bulunan, verilen önekli blokların (örn. 'tools_' ya da
+    ('role_', 'tools_')) kodlanmış sütunları. Sütun adları kelime dağarcığından
+    (field_columns) alan ve sütun sırasıyla okunur; columns üzerinde yalnızca küme
+    üyeliği denetlenir. Dağarcıkta tanımlı olmayan önekler için `startswith`
+    taramasına düşülür. vocabulary verilmezse VOCABULARY_PATH'teki dağarcık
+    kullanılır; boş dağarcık ({}) tüm önekleri taratır (örn. farklı dağarcıklarla
+    kodlanmış yılların birleşimi).
+    """
+    if isinstance(prefixes, str):
+        prefixes = (prefixes,)
+    if vocabulary is None:
+        vocabulary = cached_vocabulary()
+    fields = vocabulary['fields'] if vocabulary else {}
+    wanted = {prefix.rstrip('_') for prefix in prefixes}
+    known = {spec['prefix'] for spec in fields.values()} & wanted
+    available = set(columns)
+    result = [column for field, spec in fields.items() if spec['prefix'] in known
+              for column in field_columns(vocabulary, field) if column in available]
+    scanned = tuple(prefix for prefix in prefixes if prefix.rstrip('_') not in known)
+    if scanned:
+        result += [column for column in columns if column.startswith(scanned)]
+    return result
@@ -0,0 +1,236 @@
+"""
+Year-over-Year Comparison (English)
+Compares survey years from the year-partitioned dataset (data/processed/survey_year=YYYY/):
+group means, distribution shifts, technology ROI deltas and Welch t-tests.
+All per-group statistics come from one grouped pass: flag matrices are multiplied by
+per-year indicator/salary matrices to get count, sum and sum of squares for every
+(group, year) cell at once. Inflation normalization is a pluggable step applied to
+salary_numeric before any statistic is computed.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from data_store import load_survey_data, PARTITION_COLUMN
+from stat_kernels import moment_stats, pairwise_tests
+
+# One-hot blocks compared as respondent groups
+GROUP_PREFIXES = ('company_location_', 'employment_type_', 'work_mode_', 'role_', 'management_')
+# Ordinal codes expanded to groups
+ORDINAL_GROUP_COLUMNS = ('seniority_level_ic', 'experience_years')
+# Multi-hot technology blocks compared by ROI; "none" columns are excluded
+TECH_PREFIXES = ('programming_', 'frontend_', 'tools_')
+TECH_EXCLUDE = {'programming_Hicbiri', 'frontend_Kullanmiyorum', 'tools_Kullanmiyorum'}
+SALARY_QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+MIN_GROUP_SIZE = 10
+
+
+def cpi_deflator(index_by_year, base_year):
+    """
+    Build an inflation normalizer from a price index per survey year.
+    Salaries are rescaled to base_year prices: salary * index[base_year] / index[year].
+    """
+    base = index_by_year[base_year]
+    factor_by_year = {year: base / value for year, value in index_by_year.items()}
+
+    def normalize(df):
+        factors = df[PARTITION_COLUMN].map(factor_by_year).astype('float64')
+        if factors.isna().any():
+            missing = sorted(set(df.loc[factors.isna(), PARTITION_COLUMN]))
+            raise KeyError(f'No price index for survey year(s) {missing}')
+        return df.assign(salary_numeric=df['salary_numeric'] * factors)
+    return normalize
+
+
+def load_multi_year(years=None, inflation=None):
+    """
+    Load the year-partitioned dataset; inflation is an optional callable df -> df
+    (e.g. cpi_deflator) applied to salaries.
+    """
+    df = load_survey_data(years=years)
+    df['salary_numeric'] = df['salary_numeric'].astype('float64')
+    if inflation is not None:
+        df = inflation(df)
+    return df
+
+
+def group_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    0/1 indicator frame for every comparison group: one-hot blocks as-is and
+    ordinal codes expanded to one column per level (e.g. seniority_level_ic=3).
+    Flags missing in a year (NaN) count as 0.
+    """
+    blocks = [df[[c for c in df.columns if c.startswith(GROUP_PREFIXES)]].fillna(0)]
+    for col in ORDINAL_GROUP_COLUMNS:
+        if col in df.columns:
+            blocks.append(pd.get_dummies(df[col], prefix=col, prefix_sep='=', dtype='uint8'))
+    return pd.concat(blocks, axis=1)
+
+
+def grouped_moments(flags: pd.DataFrame, years: pd.Series, salary: pd.Series, year_list):
+    """
+    Count, sum and sum of squares of salary for every (flag, year) pair in one pass:
+    X.T @ [Y, Y*s, Y*s^2] where X is the n x groups flag matrix and Y the n x years indicator.
+    Returns three DataFrames indexed by flag column with one column per year.
+    """
+    X = flags.to_numpy(dtype=np.float64)
+    Y = (years.to_numpy()[:, None] == np.asarray(year_list)[None, :]).astype(np.float64)
+    s = salary.to_numpy(dtype=np.float64)[:, None]
+    moments = X.T @ np.hstack([Y, Y * s, Y * s ** 2])
+    k = len(year_list)
+    frame = lambda block: pd.DataFrame(block, index=flags.columns, columns=list(year_list))
+    return frame(moments[:, :k]), frame(moments[:, k:2 * k]), frame(moments[:, 2 * k:])
+
+
+def compare_groups(df, base_year, target_year, min_count=MIN_GROUP_SIZE):
+    """
+    Mean salary per group in both years, share shift and Welch test of target vs base.
+    """
+    flags = group_indicators(df)
+    counts, sums, sumsqs = grouped_moments(flags, df[PARTITION_COLUMN], df['salary_numeric'],
+                                           [base_year, target_year])
+    n_year = df[PARTITION_COLUMN].value_counts()
+    n0, n1 = counts[base_year].to_numpy(), counts[target_year].to_numpy()
+    m0, v0 = moment_stats(n0, sums[base_year].to_numpy(), sumsqs[base_year].to_numpy())
+    m1, v1 = moment_stats(n1, sums[target_year].to_numpy(), sumsqs[target_year].to_numpy())
+    tests = pairwise_tests(n1, m1, v1, n0, m0, v0)
+
+    result = pd.DataFrame({
+        'group': flags.columns,
+        f'n_{base_year}': n0.astype(int),
+        f'n_{target_year}': n1.astype(int),
+        f'share_{base_year}': n0 / n_year.get(base_year, np.nan),
+        f'share_{target_year}': n1 / n_year.get(target_year, np.nan),
+        f'mean_{base_year}': m0,
+        f'mean_{target_year}': m1,
+        'mean_change': m1 - m0,
+        'pct_change': (m1 - m0) / m0 * 100,
+        't_stat': tests.t_stat,
+        'p_value': tests.p_value,
+        'cohens_d': tests.cohens_d,
+    })
+    result['share_shift_pp'] = (result[f'share_{target_year}'] - result[f'share_{base_year}']) * 100
+    enough = (result[f'n_{base_year}'] >= min_count) & (result[f'n_{target_year}'] >= min_count)
+    return result[enough].sort_values('mean_change', ascending=False).reset_index(drop=True)
+
+
+def compare_roi(df, base_year, target_year, min_count=MIN_GROUP_SIZE):
+    """
+    Technology ROI (mean salary of users minus non-users) per year and its change.
+    Technologies not asked in a year (e.g. frontend/tools in 2024) get NaN for that year.
+    """
+    tech_cols = [c for c in df.columns if c.startswith(TECH_PREFIXES) and c not in TECH_EXCLUDE]
+    years = df[PARTITION_COLUMN]
+    # Rows where the technology block was asked in that year (flag not NaN)
+    asked = df[tech_cols].notna()
+    flags = df[tech_cols].fillna(0)
+    year_list = [base_year, target_year]
+    users_n, users_sum, _ = grouped_moments(flags, years, df['salary_numeric'], year_list)
+    asked_n, asked_sum, _ = grouped_moments(asked.astype('uint8'), years, df['salary_numeric'], year_list)
+
+    result = pd.DataFrame({'technology': tech_cols})
+    for year in year_list:
+        n_users = users_n[year].to_numpy()
+        n_non = asked_n[year].to_numpy() - n_users
+        with np.errstate(divide='ignore', invalid='ignore'):
+            roi = users_sum[year].to_numpy() / n_users - (asked_sum[year].to_numpy() - users_sum[year].to_numpy()) / n_non
+        roi[(n_users < min_count) | (n_non < min_count)] = np.nan
+        result[f'users_{year}'] = n_users.astype(int)
+        result[f'roi_{year}'] = roi
+    result['roi_change'] = result[f'roi_{target_year}'] - result[f'roi_{base_year}']
+    return result.sort_values('roi_change', ascending=False, na_position='last').reset_index(drop=True)
+
+
+def distribution_shift(df, base_year, target_year, quantiles=SALARY_QUANTILES):
+    """
+    Salary quantiles per year (one grouped quantile call) plus a two-sample KS test.
+    """
+    by_year = df[df[PARTITION_COLUMN].isin([base_year, target_year])].groupby(PARTITION_COLUMN)['salary_numeric']
+    table = by_year.quantile(list(quantiles)).unstack(level=0)
+    table.index = [f'p{int(q * 100)}' for q in quantiles]
+    table.loc['mean'] = by_year.mean()
+    table.loc['std'] = by_year.std()
+    table['change'] = table[target_year] - table[base_year]
+    table['pct_change'] = table['change'] / table[base_year] * 100
+    ks = stats.ks_2samp(df.loc[df[PARTITION_COLUMN] == target_year, 'salary_numeric'],
+                        df.loc[df[PARTITION_COLUMN] == base_year, 'salary_numeric'])
+    return table, {'ks_statistic': float(ks.statistic), 'ks_p_value': float(ks.pvalue)}
+
+
+def compare_years(df, base_year=2024, target_year=2025, min_count=MIN_GROUP_SIZE):
+    """
+    Full cross-year comparison. Returns a dict of result tables:
+    'overall', 'distribution', 'groups', 'roi'.
+    """
+    salary = df['salary_numeric'].to_numpy(dtype=np.float64)
+    years = df[PARTITION_COLUMN].to_numpy()
+    s0, s1 = salary[years == base_year], salary[years == target_year]
+    tests = pairwise_tests(len(s1), s1.mean(), s1.var(ddof=1), len(s0), s0.mean(), s0.var(ddof=1))
+    distribution, ks = distribution_shift(df, base_year, target_year)
+    overall = {
+        f'n_{base_year}': len(s0), f'n_{target_year}': len(s1),
+        f'mean_{base_year}': s0.mean(), f'mean_{target_year}': s1.mean(),
+        'mean_change': s1.mean() - s0.mean(),
+        'pct_change': (s1.mean() - s0.mean()) / s0.mean() * 100,
+        't_stat': float(tests.t_stat), 'p_value': float(tests.p_value),
+        'cohens_d': float(tests.cohens_d),
+        **ks,
+    }
+    return {
+        'overall': overall,
+        'distribution': distribution,
+        'groups': compare_groups(df, base_year, target_year, min_count),
+        'roi': compare_roi(df, base_year, target_year, min_count),
+    }
+
+
+def print_report(results, base_year, target_year, top=10):
+    overall = results['overall']
+    print(f'\n=== {target_year} vs {base_year}: overall ===')
+    print(f"Mean salary: {overall[f'mean_{base_year}']:.1f} -> {overall[f'mean_{target_year}']:.1f} "
+          f"({overall['pct_change']:+.1f}%), Welch t={overall['t_stat']:.2f}, p={overall['p_value']:.2e}, "
+          f"d={overall['cohens_d']:.2f}")
+    print(f"KS statistic={overall['ks_statistic']:.3f}, p={overall['ks_p_value']:.2e}")
+
+    print('\n=== Salary distribution (thousand TL) ===')
+    print(results['distribution'].round(1).to_string())
+
+    groups = results['groups']
+    cols = ['group', f'n_{base_year}', f'n_{target_year}', f'mean_{base_year}', f'mean_{target_year}',
+            'pct_change', 'share_shift_pp', 'p_value']
+    print(f'\n=== Largest group mean increases (top {top}) ===')
+    print(groups[cols].head(top).round(3).to_string(index=False))
+    print(f'\n=== Smallest group mean changes (bottom {top}) ===')
+    print(groups[cols].tail(top).iloc[::-1].round(3).to_string(index=False))
+
+    roi = results['roi'].dropna(subset=['roi_change'])
+    print(f'\n=== Technology ROI change (top {top}) ===')
+    print(roi.head(top).round(1).to_string(index=False))
+
+
+def main(base_year=2024, target_year=2025, cpi=None):
+    start = time.perf_counter()
+    inflation = cpi_deflator(cpi, target_year) if cpi else None
+    df = load_multi_year([base_year, target_year], inflation=inflation)
+    results = compare_years(df, base_year, target_year)
+    elapsed = time.perf_counter() - start
+    if cpi:
+        print(f'Salaries normalized to {target_year} prices using index {cpi}')
+    print_report(results, base_year, target_year)
+    print(f'\nComparison computed in {elapsed:.3f} s ({len(df)} rows)')
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Year-over-year salary comparison')
+    parser.add_argument('--base', type=int, default=2024, help='Base survey year')
+    parser.add_argument('--target', type=int, default=2025, help='Target survey year')
+    parser.add_argument('--cpi', nargs='+', default=None, metavar='YEAR=INDEX',
+                        help='Price index per year for inflation normalization, e.g. --cpi 2024=100 2025=135')
+    args = parser.parse_args()
+    cpi = {int(k): float(v) for k, v in (item.split('=') for item in args.cpi)} if args.cpi else None
+    main(args.base, args.target, cpi)